@@ -55,6 +55,11 @@ setuptools.setup(
         ),
     ),
     install_requires=read_requirements(["requirements/requirements.sdk.http.txt"]),
+    extras_require={
+        "streaming": read_requirements(
+            "requirements/requirements.sdk.http.streaming.txt"
+        ),
+    },
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Developers",
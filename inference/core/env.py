@@ -43,6 +43,16 @@ AWS_SECRET_ACCESS_KEY = os.getenv("AWS_SECRET_ACCESS_KEY", None)
 COGVLM_LOAD_4BIT = str2bool(os.getenv("COGVLM_LOAD_4BIT", True))
 COGVLM_LOAD_8BIT = str2bool(os.getenv("COGVLM_LOAD_8BIT", False))
 COGVLM_VERSION_ID = os.getenv("COGVLM_VERSION_ID", "cogvlm-chat-hf")
+# Flag to keep CogVLM vision tower out of bitsandbytes quantization, default is False
+COGVLM_SKIP_VISION_QUANTIZATION = str2bool(
+    os.getenv("COGVLM_SKIP_VISION_QUANTIZATION", False)
+)
+# Flag to quantize CogVLM vision tower linear layers to INT8 (requires Turing+ GPU), default is False
+COGVLM_VISION_INT8 = str2bool(os.getenv("COGVLM_VISION_INT8", False))
+# Flag to wrap CogVLM with torch.compile (only applied when CUDA is available), default is True
+COGVLM_TORCH_COMPILE = str2bool(os.getenv("COGVLM_TORCH_COMPILE", True))
+# Flag to compile CogVLM with dynamic shapes - disable when input shapes are static, default is True
+COGVLM_TORCH_COMPILE_DYNAMIC = str2bool(os.getenv("COGVLM_TORCH_COMPILE_DYNAMIC", True))
 # CLIP version ID, default is "ViT-B-16"
 CLIP_VERSION_ID = os.getenv("CLIP_VERSION_ID", "ViT-B-16")
 
@@ -1,26 +1,151 @@
 import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
 from time import perf_counter
-from typing import Any, List, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 import numpy as np
-import requests
 import torch
+import torch.nn.functional as F
+import xxhash
 from PIL import Image
-from transformers import AutoModelForCausalLM, LlamaTokenizer
+from transformers import AutoModelForCausalLM, AutoTokenizer, BitsAndBytesConfig
 
+from inference.core import logger
 from inference.core.entities.requests.cogvlm import CogVLMInferenceRequest
 from inference.core.entities.responses.cogvlm import CogVLMResponse
 from inference.core.env import (
     API_KEY,
     COGVLM_LOAD_4BIT,
     COGVLM_LOAD_8BIT,
+    COGVLM_SKIP_VISION_QUANTIZATION,
+    COGVLM_TORCH_COMPILE,
+    COGVLM_TORCH_COMPILE_DYNAMIC,
     COGVLM_VERSION_ID,
+    COGVLM_VISION_INT8,
     MODEL_CACHE_DIR,
 )
 from inference.core.models.base import Model, PreprocessReturnMetadata
 from inference.core.utils.image_utils import load_image_rgb
 
-DEVICE = "cuda" if torch.cuda.is_available() else "cpu"
+T = TypeVar("T")
+
+MAX_LENGTH = 2048
+WARM_UP_IMAGE_SIZE = (490, 490)
+# prefill step + decoding steps - each of them gets its own graph compiled
+WARM_UP_NEW_TOKENS = 3
+INPUTS_CACHE_SIZE = 128
+# checking for EOS requires device -> host sync, so it is only done every N decoding steps
+EOS_CHECK_INTERVAL = 16
+# normalisation applied by CogVLM remote code (CLIP statistics)
+IMAGE_MEAN = (0.48145466, 0.4578275, 0.40821073)
+IMAGE_STD = (0.26862954, 0.26130258, 0.27577711)
+
+
+def select_device() -> torch.device:
+    # explicit index - weights (`device_map`) and inputs must land on the same CUDA device,
+    # which does not have to be the first one
+    if not torch.cuda.is_available():
+        return torch.device("cpu")
+    return torch.device("cuda", torch.cuda.current_device())
+
+
+def build_quantization_config() -> Optional[BitsAndBytesConfig]:
+    if not COGVLM_LOAD_4BIT and not COGVLM_LOAD_8BIT:
+        return None
+    skip_modules = None
+    if COGVLM_SKIP_VISION_QUANTIZATION:
+        # providing the list overrides the default exclusions, so `lm_head` must be repeated
+        skip_modules = ["lm_head", "vision", "patch_embedding"]
+    if COGVLM_LOAD_4BIT:
+        return BitsAndBytesConfig(
+            load_in_4bit=True,
+            bnb_4bit_quant_type="nf4",
+            bnb_4bit_use_double_quant=True,
+            bnb_4bit_compute_dtype=torch.float16,
+            llm_int8_skip_modules=skip_modules,
+        )
+    return BitsAndBytesConfig(
+        load_in_8bit=True,
+        llm_int8_threshold=6.0,
+        llm_int8_has_fp16_weight=False,
+        llm_int8_skip_modules=skip_modules,
+    )
+
+
+def quantize_linear_layers_to_int8(
+    module: torch.nn.Module, device: torch.device
+) -> int:
+    # bitsandbytes is only needed on this path
+    import bitsandbytes as bnb
+
+    replaced_layers = 0
+    for name, child in module.named_children():
+        # exact type check - bitsandbytes layers subclass `torch.nn.Linear`
+        if type(child) is not torch.nn.Linear:
+            replaced_layers += quantize_linear_layers_to_int8(
+                module=child, device=device
+            )
+            continue
+        int8_linear = bnb.nn.Linear8bitLt(
+            child.in_features,
+            child.out_features,
+            bias=child.bias is not None,
+            has_fp16_weights=False,
+            threshold=6.0,
+        )
+        # weights are quantized by bitsandbytes while moved from CPU to the device
+        int8_linear.weight = bnb.nn.Int8Params(
+            child.weight.data.cpu(), requires_grad=False, has_fp16_weights=False
+        )
+        if child.bias is not None:
+            int8_linear.bias = child.bias
+        setattr(module, name, int8_linear.to(device))
+        replaced_layers += 1
+    return replaced_layers
+
+
+def fused_attention_context(device: torch.device) -> ContextManager:
+    # CogVLM remote code already routes attention through `scaled_dot_product_attention(...)`,
+    # (it does not accept `attn_implementation`) - here we restrict it to fused kernels, keeping
+    # the math kernel only as a last resort for inputs fused kernels reject (dtype, head size, GPU arch)
+    if device.type != "cuda":
+        return nullcontext()
+    try:
+        from torch.nn.attention import SDPBackend, sdpa_kernel
+    except ImportError:
+        return torch.backends.cuda.sdp_kernel(
+            enable_flash=True, enable_mem_efficient=True, enable_math=True
+        )
+    return sdpa_kernel(
+        [SDPBackend.FLASH_ATTENTION, SDPBackend.EFFICIENT_ATTENTION, SDPBackend.MATH]
+    )
+
+
+@contextmanager
+def tf32_matmul_context(device: torch.device) -> Generator[None, None, None]:
+    # TF32 tensor cores for any fp32 matmuls (Ampere+) - precision is a process-wide setting,
+    # so it is only switched for the duration of generation and restored afterwards
+    if device.type != "cuda":
+        yield None
+        return None
+    previous_precision = torch.get_float32_matmul_precision()
+    torch.set_float32_matmul_precision("high")
+    try:
+        yield None
+    finally:
+        torch.set_float32_matmul_precision(previous_precision)
 
 
 class CogVLM(Model):
@@ -34,25 +159,137 @@ class CogVLM(Model):
                 "Only one of environment variable `COGVLM_LOAD_4BIT` or `COGVLM_LOAD_8BIT` can be true"
             )
         self.cache_dir = os.path.join(MODEL_CACHE_DIR, self.endpoint)
+        # resolved once - CUDA is not initialised at import and `.to(...)` gets ready device object
+        self.device = select_device()
         with torch.inference_mode():
-            self.tokenizer = LlamaTokenizer.from_pretrained("lmsys/vicuna-7b-v1.5")
+            self.tokenizer = AutoTokenizer.from_pretrained(
+                "lmsys/vicuna-7b-v1.5", use_fast=True
+            )
+            if not self.tokenizer.is_fast:
+                logger.warning(
+                    "Could not load fast tokenizer for CogVLM - falling back to slow one."
+                )
             self.model = AutoModelForCausalLM.from_pretrained(
                 f"THUDM/{self.version_id}",
                 torch_dtype=torch.float16,
                 low_cpu_mem_usage=True,
+                # safetensors shards are memory-mapped and streamed straight to target device
+                use_safetensors=True,
+                device_map=(
+                    {"": self.device.index} if self.device.type == "cuda" else None
+                ),
                 trust_remote_code=True,
-                load_in_4bit=COGVLM_LOAD_4BIT,
-                load_in_8bit=COGVLM_LOAD_8BIT,
+                quantization_config=build_quantization_config(),
                 cache_dir=self.cache_dir,
             ).eval()
+        if COGVLM_VISION_INT8:
+            self._quantize_vision_tower()
+        # CogVLM remote code keeps KV-cache as tuples concatenated per step, which is not compatible
+        # with `StaticCache` - we can only make sure cache is used and generation params are fixed.
+        # Decoding is always greedy (see `_greedy_decode(...)`), so only fields it reads are set.
+        self.model.generation_config.use_cache = True
+        self.model.generation_config.max_length = MAX_LENGTH
+        self._inputs_cache = OrderedDict()
+        self._image_size = self.model.config.vision_config["image_size"]
+        # remote code only derives token layout from the image count - constant placeholder is passed
+        # in place of request image, whose pixel values are computed on device
+        self._layout_image = Image.new("RGB", (self._image_size, self._image_size))
+        self._image_mean = torch.tensor(IMAGE_MEAN, device=self.device).view(1, 3, 1, 1)
+        self._image_std = torch.tensor(IMAGE_STD, device=self.device).view(1, 3, 1, 1)
+        # device work must be serialised anyway - single worker keeps generation off request threads
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._compute_stream = None
+        self._copy_stream = None
+        self._pinned_tokens_buffer = None
+        self._pinned_tokens_buffer_event = None
+        self._pinned_output_buffer = None
+        if self.device.type == "cuda":
+            self._copy_stream = torch.cuda.Stream()
+            self._compute_stream = torch.cuda.Stream()
+            # page-locked staging rows for input_ids, token_type_ids and attention_mask
+            self._pinned_tokens_buffer = torch.empty(
+                (3, MAX_LENGTH), dtype=torch.long, pin_memory=True
+            )
+            # marks completion of the last copy reading from staging buffer
+            self._pinned_tokens_buffer_event = torch.cuda.Event()
+            self._pinned_output_buffer = torch.empty(
+                (MAX_LENGTH,), dtype=torch.long, pin_memory=True
+            )
+            # NHWC for patch-embedding convolution
+            self.model.model.vision.patch_embedding.to(
+                memory_format=torch.channels_last
+            )
+            # dropping load-time leftovers, so that warm-up populates allocator pool
+            # with blocks of sizes actually required by generation
+            torch.cuda.empty_cache()
+            if COGVLM_TORCH_COMPILE:
+                self._compile_decoder_layers()
+            # warm-up runs on the worker thread and stream that serve inference later on
+            self._run_on_worker(self._warm_up)
         self.task_type = "lmm"
 
+    def _quantize_vision_tower(self) -> None:
+        # INT8 tensor cores are available from Turing onwards; only linear layers are swapped,
+        # so residual additions and norms in the vision tower keep running in fp16
+        if (
+            COGVLM_LOAD_4BIT or COGVLM_LOAD_8BIT
+        ) and not COGVLM_SKIP_VISION_QUANTIZATION:
+            logger.warning(
+                "`COGVLM_VISION_INT8` is ignored, as vision tower is already quantized by "
+                "`COGVLM_LOAD_4BIT` / `COGVLM_LOAD_8BIT` - set `COGVLM_SKIP_VISION_QUANTIZATION=True` "
+                "to use it."
+            )
+            return None
+        if self.device.type != "cuda" or torch.cuda.get_device_capability(
+            self.device
+        ) < (7, 5):
+            logger.warning(
+                "`COGVLM_VISION_INT8` requires CUDA device with compute capability >= 7.5 - skipping."
+            )
+            return None
+        replaced_layers = quantize_linear_layers_to_int8(
+            module=self.model.model.vision, device=self.device
+        )
+        logger.info(
+            f"Replaced {replaced_layers} linear layers of CogVLM vision tower with INT8 ones."
+        )
+
+    def _compile_decoder_layers(self) -> None:
+        # regional compilation - decoder layers share the same code, so Dynamo traces the block
+        # once and re-uses the cache for the rest of the stack; vision tower and `lm_head` stay eager.
+        # Graph breaks are allowed - vision-expert attention and MLP select hidden states with
+        # boolean token type masks (data-dependent shapes), bitsandbytes layers are not traceable.
+        # Default mode on purpose - KV-cache grows with every decoding step, so CUDA graphs
+        # ("reduce-overhead") would be re-recorded for each sequence length.
+        layers = self.model.model.layers
+        for i, layer in enumerate(layers):
+            layers[i] = torch.compile(
+                layer,
+                dynamic=COGVLM_TORCH_COMPILE_DYNAMIC,
+                fullgraph=False,
+            )
+
+    def _warm_up(self) -> None:
+        # first call triggers compilation and allocations - paying the cost at load time
+        # rather than on first request. Prefill (whole prompt) and decode (single token) steps
+        # are specialised by Dynamo into separate graphs - warm-up must exercise both of them.
+        dummy_image = np.zeros((*WARM_UP_IMAGE_SIZE, 3), dtype=np.uint8)
+        inputs = self._build_inputs(image=dummy_image, prompt="", history=[])
+        with torch.inference_mode(), fused_attention_context(
+            device=self.device
+        ), tf32_matmul_context(device=self.device):
+            self._greedy_decode(
+                inputs=inputs, max_new_tokens=WARM_UP_NEW_TOKENS, stop_on_eos=False
+            )
+        if self.device.type == "cuda":
+            # warm-up output is never copied to host - without synchronisation, non-blocking
+            # transfers of its inputs could still read pinned buffers reused by first request
+            torch.cuda.synchronize()
+
     def preprocess(
         self, image: Any, **kwargs
-    ) -> Tuple[Image.Image, PreprocessReturnMetadata]:
-        pil_image = Image.fromarray(load_image_rgb(image))
-
-        return pil_image, PreprocessReturnMetadata({})
+    ) -> Tuple[np.ndarray, PreprocessReturnMetadata]:
+        return load_image_rgb(image), PreprocessReturnMetadata({})
 
     def postprocess(
         self,
@@ -62,36 +299,203 @@ class CogVLM(Model):
     ) -> Any:
         return predictions[0]
 
-    def predict(self, image_in: Image.Image, prompt="", history=None, **kwargs):
-        images = [image_in]
+    def predict(self, image_in: np.ndarray, prompt="", history=None, **kwargs):
         if history is None:
             history = []
+        inputs = self._get_inputs(image=image_in, prompt=prompt, history=history)
+        with torch.inference_mode(), fused_attention_context(
+            device=self.device
+        ), tf32_matmul_context(device=self.device):
+            new_tokens = self._transfer_to_host(
+                tokens=self._greedy_decode(inputs=inputs)
+            )
+            text = self.tokenizer.decode(
+                new_tokens,
+                skip_special_tokens=True,
+                clean_up_tokenization_spaces=False,
+            )
+            return (text,)
+
+    def _greedy_decode(
+        self,
+        inputs: Dict[str, Any],
+        max_new_tokens: Optional[int] = None,
+        stop_on_eos: bool = True,
+    ) -> torch.Tensor:
+        # equivalent of `generate(do_sample=False)` without logits processors and stopping
+        # criteria machinery - model hooks are used to keep CogVLM-specific position ids
+        # and token types handling intact. Returns only newly generated tokens.
+        generation_config = self.model.generation_config
+        input_ids = inputs["input_ids"]
+        if max_new_tokens is None:
+            max_new_tokens = generation_config.max_length - input_ids.shape[1]
+        max_new_tokens = max(max_new_tokens, 0)
+        eos_token_ids = generation_config.eos_token_id
+        if not isinstance(eos_token_ids, list):
+            eos_token_ids = [eos_token_ids]
+        eos_token_ids = torch.tensor(eos_token_ids, device=self.device)
+        model_kwargs = {
+            "token_type_ids": inputs["token_type_ids"],
+            "attention_mask": inputs["attention_mask"],
+            "images": inputs["images"],
+            "use_cache": generation_config.use_cache,
+        }
+        generated = torch.empty(
+            (max_new_tokens,), dtype=input_ids.dtype, device=self.device
+        )
+        # EOS is tracked on device, so decoding steps are not interleaved with host syncs
+        finished = torch.zeros((), dtype=torch.bool, device=self.device)
+        steps = 0
+        while steps < max_new_tokens:
+            model_inputs = self.model.prepare_inputs_for_generation(
+                input_ids, **model_kwargs
+            )
+            outputs = self.model(**model_inputs, return_dict=True)
+            next_token = outputs.logits[:, -1].argmax(dim=-1)
+            generated[steps] = next_token[0]
+            steps += 1
+            # with KV-cache in place, only the last token is consumed by the model
+            input_ids = next_token[:, None]
+            model_kwargs = self.model._update_model_kwargs_for_generation(
+                outputs, model_kwargs
+            )
+            if not stop_on_eos:
+                continue
+            finished |= torch.isin(next_token[0], eos_token_ids)
+            if steps % EOS_CHECK_INTERVAL == 0 and finished.item():
+                break
+        generated = generated[:steps]
+        if not stop_on_eos:
+            return generated
+        # up to `EOS_CHECK_INTERVAL - 1` tokens may have been decoded past EOS - they are dropped
+        eos_positions = torch.isin(generated, eos_token_ids).nonzero()
+        if eos_positions.shape[0] > 0:
+            return generated[: eos_positions[0, 0] + 1]
+        return generated
+
+    def _transfer_to_host(self, tokens: torch.Tensor) -> torch.Tensor:
+        if self._pinned_output_buffer is None or tokens.shape[0] > MAX_LENGTH:
+            return tokens.cpu()
+        host_tokens = self._pinned_output_buffer[: tokens.shape[0]]
+        host_tokens.copy_(tokens, non_blocking=True)
+        # single synchronisation point, right before tokens are needed on host
+        torch.cuda.synchronize()
+        return host_tokens
+
+    def _get_inputs(
+        self, image: np.ndarray, prompt: str, history: list
+    ) -> Dict[str, Any]:
+        # device-resident inputs are cached, so repeated prompts over the same image
+        # skip tokenization and transfers entirely
+        cache_key = (
+            prompt,
+            tuple(tuple(turn) for turn in history),
+            image.shape,
+            xxhash.xxh64(np.ascontiguousarray(image)).intdigest(),
+        )
+        inputs = self._inputs_cache.get(cache_key)
+        if inputs is not None:
+            self._inputs_cache.move_to_end(cache_key)
+            return inputs
+        inputs = self._build_inputs(image=image, prompt=prompt, history=history)
+        self._inputs_cache[cache_key] = inputs
+        if len(self._inputs_cache) > INPUTS_CACHE_SIZE:
+            self._inputs_cache.popitem(last=False)
+        return inputs
+
+    def _build_inputs(
+        self, image: np.ndarray, prompt: str, history: list
+    ) -> Dict[str, Any]:
+        # token layout is left to CogVLM remote code, pixel values it computes are discarded
         built_inputs = self.model.build_conversation_input_ids(
-            self.tokenizer, query=prompt, history=history, images=images
+            self.tokenizer,
+            query=prompt,
+            history=history,
+            images=[self._layout_image],
         )  # chat mode
-        inputs = {
-            "input_ids": built_inputs["input_ids"].unsqueeze(0).to(DEVICE),
-            "token_type_ids": built_inputs["token_type_ids"].unsqueeze(0).to(DEVICE),
-            "attention_mask": built_inputs["attention_mask"].unsqueeze(0).to(DEVICE),
-            "images": [[built_inputs["images"][0].to(DEVICE).to(torch.float16)]],
+        stream_context = (
+            torch.cuda.stream(self._copy_stream)
+            if self._copy_stream is not None
+            else nullcontext()
+        )
+        with stream_context:
+            image_tensor = self._transfer_image(image=image)
+            input_ids, token_type_ids, attention_mask = self._transfer_tokens(
+                tensors=[
+                    built_inputs["input_ids"],
+                    built_inputs["token_type_ids"],
+                    built_inputs["attention_mask"],
+                ]
+            )
+        if self._copy_stream is not None:
+            current_stream = torch.cuda.current_stream()
+            current_stream.wait_stream(self._copy_stream)
+            for tensor in (image_tensor, input_ids, token_type_ids, attention_mask):
+                tensor.record_stream(current_stream)
+        return {
+            "input_ids": input_ids,
+            "token_type_ids": token_type_ids,
+            "attention_mask": attention_mask,
+            "images": [[image_tensor]],
         }
-        gen_kwargs = {"max_length": 2048, "do_sample": False}
 
-        with torch.inference_mode():
-            outputs = self.model.generate(**inputs, **gen_kwargs)
-            outputs = outputs[:, inputs["input_ids"].shape[1] :]
-            text = self.tokenizer.decode(outputs[0])
-            if text.endswith("</s>"):
-                text = text[:-4]
-            return (text,)
+    def _transfer_tokens(self, tensors: List[torch.Tensor]) -> List[torch.Tensor]:
+        sequence_length = tensors[0].shape[0]
+        if self._pinned_tokens_buffer is None or sequence_length > MAX_LENGTH:
+            return [t.unsqueeze(0).to(self.device, non_blocking=True) for t in tensors]
+        # non-blocking copies of previous inputs may still be reading the buffer - waiting
+        # for them, regardless of what the caller synchronised in the meantime
+        self._pinned_tokens_buffer_event.synchronize()
+        staging = self._pinned_tokens_buffer[:, :sequence_length]
+        for row, tensor in zip(staging, tensors):
+            row.copy_(tensor)
+        device_tensors = [
+            row.unsqueeze(0).to(self.device, non_blocking=True) for row in staging
+        ]
+        self._pinned_tokens_buffer_event.record()
+        return device_tensors
+
+    def _transfer_image(self, image: np.ndarray) -> torch.Tensor:
+        # uint8 HWC array is uploaded as is - resizing and normalisation of remote code
+        # (bicubic resize, scaling to [0, 1], CLIP statistics) are replicated on device
+        image = torch.from_numpy(np.ascontiguousarray(image))
+        if self.device.type == "cuda":
+            image = image.pin_memory()
+        image = image.to(self.device, non_blocking=True)
+        image = image.permute(2, 0, 1).unsqueeze(0).float()
+        image = F.interpolate(
+            image,
+            size=(self._image_size, self._image_size),
+            mode="bicubic",
+            align_corners=False,
+            antialias=True,
+        )
+        # PIL resizes in uint8, so overshoots of bicubic kernel are clipped
+        image = image.clamp_(0, 255).div_(255)
+        image = (image - self._image_mean) / self._image_std
+        # NHWC strides survive indexing and stacking inside the model, matching vision tower layout
+        image = image.to(dtype=torch.float16, memory_format=torch.channels_last)
+        return image[0]
 
     def infer_from_request(self, request: CogVLMInferenceRequest) -> CogVLMResponse:
         t1 = perf_counter()
-        text = self.infer(**request.dict())
+        text = self._run_on_worker(self.infer, **request.dict())
         response = CogVLMResponse(response=text)
         response.time = perf_counter() - t1
         return response
 
+    def _run_on_worker(self, function: Callable[..., T], **kwargs) -> T:
+        return self._executor.submit(self._run_on_stream, function, **kwargs).result()
+
+    def _run_on_stream(self, function: Callable[..., T], **kwargs) -> T:
+        stream_context = (
+            torch.cuda.stream(self._compute_stream)
+            if self._compute_stream is not None
+            else nullcontext()
+        )
+        with stream_context:
+            return function(**kwargs)
+
 
 if __name__ == "__main__":
     m = CogVLM()
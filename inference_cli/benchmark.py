@@ -53,7 +53,7 @@ def api_speed(
         typer.Option(
             "--clients",
             "-c",
-            help="Meaningful if `rps` not specified - number of concurrent threads that will send requests one by one",
+            help="Meaningful if `rps` not specified - number of concurrent clients that will send requests one by one",
         ),
     ] = 1,
     requests_per_second: Annotated[
@@ -61,7 +61,7 @@ def api_speed(
         typer.Option(
             "--rps",
             "-rps",
-            help="Number of requests per second to emit. If not specified - requests will be sent one-by-one by requested number of client threads",
+            help="Number of requests per second to emit. If not specified - requests will be sent one-by-one by requested number of concurrent clients",
         ),
     ] = None,
     api_key: Annotated[
@@ -183,6 +183,15 @@ def python_package_speed(
             help="Location where to save the result (path to file or directory)",
         ),
     ] = None,
+    resize_to: Annotated[
+        Optional[int],
+        typer.Option(
+            "--resize_to",
+            "-rs",
+            help="Size of square all dataset images are to be resized to before benchmark - keeps input shapes "
+            "static, which prevents re-compilation of models compiled with static shapes",
+        ),
+    ] = None,
 ):
     try:
         run_python_package_speed_benchmark(
@@ -194,6 +203,7 @@ def python_package_speed(
             api_key=api_key,
             model_configuration=model_configuration,
             output_location=output_location,
+            resize_to=resize_to,
         )
     except KeyboardInterrupt:
         print("Benchmark interrupted.")
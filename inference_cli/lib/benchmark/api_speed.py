@@ -1,9 +1,10 @@
+import asyncio
 import math
 import random
 import time
 from functools import partial
 from threading import Thread
-from typing import Callable, List, Optional
+from typing import Awaitable, Callable, List, Optional
 
 import numpy as np
 from tqdm import tqdm
@@ -91,62 +92,84 @@ def execute_api_speed_benchmark(
                 "RPS to maintain is specified."
             )
         results_collector.start_benchmark()
-        execute_given_rps_sequentially(
-            executor=api_request_executor,
-            benchmark_requests=benchmark_requests,
-            requests_per_second=requests_per_second,
+        asyncio.run(
+            run_and_close_client(
+                client=client,
+                benchmark=execute_given_rps_sequentially(
+                    executor=api_request_executor,
+                    benchmark_requests=benchmark_requests,
+                    requests_per_second=requests_per_second,
+                ),
+            )
         )
         results_collector.stop_benchmark()
         return None
-    client_threads = []
     results_collector.start_benchmark()
-    for _ in range(number_of_clients):
-        client_thread = Thread(
-            target=execute_requests_sequentially,
-            args=(api_request_executor, benchmark_requests),
+    asyncio.run(
+        run_and_close_client(
+            client=client,
+            benchmark=execute_requests_by_concurrent_clients(
+                executor=api_request_executor,
+                benchmark_requests=benchmark_requests,
+                number_of_clients=number_of_clients,
+            ),
         )
-        client_thread.start()
-        client_threads.append(client_thread)
-    for thread in client_threads:
-        thread.join()
+    )
     results_collector.stop_benchmark()
     return None
 
 
-def execute_requests_sequentially(
-    executor: Callable[[], None], benchmark_requests: int
+async def run_and_close_client(
+    client: InferenceHTTPClient, benchmark: Awaitable[None]
+) -> None:
+    # async sessions of the client are bound to the loop created by `asyncio.run(...)`,
+    # so they must be closed before the loop goes away
+    try:
+        await benchmark
+    finally:
+        await client.aclose()
+
+
+async def execute_requests_by_concurrent_clients(
+    executor: Callable[[], Awaitable[None]],
+    benchmark_requests: int,
+    number_of_clients: int,
+) -> None:
+    await asyncio.gather(
+        *[
+            execute_requests_sequentially(
+                executor=executor, benchmark_requests=benchmark_requests
+            )
+            for _ in range(number_of_clients)
+        ]
+    )
+
+
+async def execute_requests_sequentially(
+    executor: Callable[[], Awaitable[None]], benchmark_requests: int
 ) -> None:
     for _ in range(benchmark_requests):
-        executor()
+        await executor()
 
 
-def execute_given_rps_sequentially(
-    executor: Callable[[], None],
+async def execute_given_rps_sequentially(
+    executor: Callable[[], Awaitable[None]],
     benchmark_requests: int,
     requests_per_second: int,
 ) -> None:
     rounds = math.ceil(benchmark_requests / requests_per_second)
-    threads = []
+    tasks = []
     for _ in range(rounds):
         start = time.time()
         for _ in range(requests_per_second):
-            executor_thread = Thread(target=executor, daemon=True)
-            executor_thread.start()
-            threads.append(executor_thread)
-        still_alive_threads = []
-        for thread in threads:
-            thread.join(timeout=0.0)
-            if thread.is_alive():
-                still_alive_threads.append(thread)
-        threads = still_alive_threads
+            tasks.append(asyncio.create_task(executor()))
         duration = time.time() - start
         remaining = max(0.0, 1.0 - duration)
-        time.sleep(remaining)
-    for thread in threads:
-        thread.join()
+        await asyncio.sleep(remaining)
+    await asyncio.gather(*tasks)
 
 
-def execute_api_request(
+async def execute_api_request(
     results_collector: ResultsCollector,
     client: InferenceHTTPClient,
     images: List[np.ndarray],
@@ -154,12 +177,12 @@ def execute_api_request(
     delay: bool = False,
 ) -> None:
     if delay:
-        time.sleep(random.random())
+        await asyncio.sleep(random.random())
     random.shuffle(images)
     payload = images[:request_batch_size]
     start = time.time()
     try:
-        _ = client.infer(payload)
+        _ = await client.infer_async(payload)
         duration = time.time() - start
         results_collector.register_inference_duration(
             batch_size=request_batch_size, duration=duration
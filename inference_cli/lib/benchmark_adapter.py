@@ -2,7 +2,10 @@ import os.path
 from dataclasses import asdict
 from datetime import datetime
 from threading import Thread
-from typing import Optional
+from typing import List, Optional
+
+import cv2
+import numpy as np
 
 from inference_cli.lib.benchmark.api_speed import (
     coordinate_api_speed_benchmark,
@@ -84,6 +87,7 @@ def run_python_package_speed_benchmark(
     api_key: Optional[str] = None,
     model_configuration: Optional[str] = None,
     output_location: Optional[str] = None,
+    resize_to: Optional[int] = None,
 ) -> None:
     # importing here not to affect other entrypoints by missing `inference` core library
     from inference_cli.lib.benchmark.python_package_speed import (
@@ -93,6 +97,7 @@ def run_python_package_speed_benchmark(
     dataset_images = load_dataset_images(
         dataset_reference=dataset_reference,
     )
+    dataset_images = resize_dataset_images(images=dataset_images, resize_to=resize_to)
     image_sizes = {i.shape[:2] for i in dataset_images}
     print(f"Detected images dimensions: {image_sizes}")
     results_collector = ResultsCollector()
@@ -121,6 +126,7 @@ def run_python_package_speed_benchmark(
         "benchmark_inferences": benchmark_inferences,
         "batch_size": batch_size,
         "model_configuration": model_configuration,
+        "resize_to": resize_to,
     }
     dump_benchmark_results(
         output_location=output_location,
@@ -129,6 +135,17 @@ def run_python_package_speed_benchmark(
     )
 
 
+def resize_dataset_images(
+    images: List[np.ndarray], resize_to: Optional[int]
+) -> List[np.ndarray]:
+    if resize_to is None:
+        return images
+    return [
+        cv2.resize(i, (resize_to, resize_to), interpolation=cv2.INTER_AREA)
+        for i in images
+    ]
+
+
 def dump_benchmark_results(
     output_location: str,
     benchmark_parameters: dict,
@@ -1,6 +1,8 @@
 from inference_sdk.http.client import InferenceHTTPClient
 from inference_sdk.http.entities import (
+    AsyncTransport,
     InferenceConfiguration,
+    UploadCompression,
     VisualisationResponseFormat,
 )
 
@@ -1,11 +1,47 @@
-from contextlib import contextmanager
-from typing import Any, Dict, Generator, List, Optional, Tuple, Union
+import asyncio
+import copy
+import itertools
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import replace
+from functools import wraps
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import urlencode
 
 import aiohttp
 import numpy as np
+import orjson
 import requests
 from aiohttp import ClientConnectionError, ClientResponseError
-from requests import HTTPError
+from multidict import CIMultiDict, CIMultiDictProxy
+from requests import HTTPError, RequestException
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 from inference_sdk.http.entities import (
     ALL_ROBOFLOW_API_URLS,
@@ -13,12 +49,14 @@ from inference_sdk.http.entities import (
     INSTANCE_SEGMENTATION_TASK,
     KEYPOINTS_DETECTION_TASK,
     OBJECT_DETECTION_TASK,
+    AsyncTransport,
     HTTPClientMode,
     ImagesReference,
     InferenceConfiguration,
     ModelDescription,
     RegisteredModels,
     ServerInfo,
+    VisualisationResponseFormat,
 )
 from inference_sdk.http.errors import (
     APIKeyNotProvided,
@@ -26,6 +64,7 @@ from inference_sdk.http.errors import (
     HTTPClientError,
     InvalidModelIdentifier,
     InvalidParameterError,
+    InvalidWorkflowResponseError,
     ModelNotInitializedError,
     ModelNotSelectedError,
     ModelTaskTypeNotSupportedError,
@@ -33,11 +72,25 @@ from inference_sdk.http.errors import (
 )
 from inference_sdk.http.utils.aliases import resolve_roboflow_model_alias
 from inference_sdk.http.utils.executors import (
+    CONNECTIONS_POOL_SIZE,
+    AsyncSession,
     RequestMethod,
+    build_async_session,
+    build_httpx_async_client,
+    build_session,
+    compression_is_not_supported,
     execute_requests_packages,
     execute_requests_packages_async,
+    iterate_requests_packages_async,
+    make_parallel_requests_async,
+    serialise_json,
+    serialise_payload,
+)
+from inference_sdk.http.utils.iterables import (
+    make_batches,
+    make_batches_within_characters_limit,
+    unwrap_single_element_list,
 )
-from inference_sdk.http.utils.iterables import unwrap_single_element_list
 from inference_sdk.http.utils.loaders import (
     load_static_inference_input,
     load_static_inference_input_async,
@@ -48,6 +101,7 @@ from inference_sdk.http.utils.post_processing import (
     combine_clip_embeddings,
     combine_gaze_detections,
     decode_workflow_outputs,
+    decode_workflow_outputs_items,
     filter_model_descriptions,
     response_contains_jpeg_image,
     transform_base64_visualisation,
@@ -55,6 +109,7 @@ from inference_sdk.http.utils.post_processing import (
 )
 from inference_sdk.http.utils.request_building import (
     ImagePlacement,
+    RequestData,
     prepare_requests_data,
 )
 from inference_sdk.http.utils.requests import (
@@ -64,9 +119,8 @@ from inference_sdk.http.utils.requests import (
 )
 
 SUCCESSFUL_STATUS_CODE = 200
-DEFAULT_HEADERS = {
-    "Content-Type": "application/json",
-}
+# pre-built once, so that aiohttp does not convert plain dict on each request
+DEFAULT_HEADERS = CIMultiDictProxy(CIMultiDict({"Content-Type": "application/json"}))
 NEW_INFERENCE_ENDPOINTS = {
     INSTANCE_SEGMENTATION_TASK: "/infer/instance_segmentation",
     OBJECT_DETECTION_TASK: "/infer/object_detection",
@@ -74,15 +128,30 @@ NEW_INFERENCE_ENDPOINTS = {
     KEYPOINTS_DETECTION_TASK: "/infer/keypoints_detection",
 }
 CLIP_ARGUMENT_TYPES = {"image", "text"}
+CLIP_TEXT_EMBEDDINGS_BATCH_SIZE = 64
+CLIP_TEXT_EMBEDDINGS_MAX_BATCH_CHARACTERS = 16384
+SESSION_MAX_RETRIES = 3
+SESSION_RETRIES_BACKOFF_FACTOR = 0.2
+MODEL_DESCRIPTIONS_CACHE_TTL = 60  # seconds
+PREWARM_TIMEOUT = 5  # seconds
+JSON_CONTENT_TYPE = "application/json"
+WORKFLOW_OUTPUTS_MISSING_MESSAGE = (
+    "Workflow response does not contain `outputs` object."
+)
+# `requests.ConnectionError` does not inherit from built-in `ConnectionError`
+CONNECTION_ERRORS = (ConnectionError, requests.ConnectionError)
+HTTPX_STATUS_ERRORS = (httpx.HTTPStatusError,) if httpx is not None else ()
+HTTPX_CONNECTION_ERRORS = (httpx.TransportError,) if httpx is not None else ()
 
 
-def wrap_errors(function: callable) -> callable:
+def wrap_errors(function: Callable) -> Callable:
+    @wraps(function)
     def decorate(*args, **kwargs) -> Any:
         try:
             return function(*args, **kwargs)
         except HTTPError as error:
-            if "application/json" in error.response.headers.get("Content-Type", ""):
-                api_message = error.response.json().get("message")
+            if JSON_CONTENT_TYPE in error.response.headers.get("Content-Type", ""):
+                api_message = orjson.loads(error.response.content).get("message")
             else:
                 api_message = error.response.text
             raise HTTPCallErrorError(
@@ -90,7 +159,7 @@ def wrap_errors(function: callable) -> callable:
                 status_code=error.response.status_code,
                 api_message=api_message,
             ) from error
-        except ConnectionError as error:
+        except CONNECTION_ERRORS as error:
             raise HTTPClientError(
                 f"Error with server connection: {deduct_api_key_from_string(str(error))}"
             ) from error
@@ -98,7 +167,8 @@ def wrap_errors(function: callable) -> callable:
     return decorate
 
 
-def wrap_errors_async(function: callable) -> callable:
+def wrap_errors_async(function: Callable) -> Callable:
+    @wraps(function)
     async def decorate(*args, **kwargs) -> Any:
         try:
             return await function(*args, **kwargs)
@@ -112,6 +182,27 @@ def wrap_errors_async(function: callable) -> callable:
             raise HTTPClientError(
                 f"Error with server connection: {deduct_api_key_from_string(str(error))}"
             ) from error
+        except HTTPX_STATUS_ERRORS as error:
+            raise HTTPCallErrorError(
+                description=deduct_api_key_from_string(value=str(error)),
+                status_code=error.response.status_code,
+                api_message=deduct_api_key_from_string(error.response.text),
+            ) from error
+        except HTTPX_CONNECTION_ERRORS as error:
+            raise HTTPClientError(
+                f"Error with server connection: {deduct_api_key_from_string(str(error))}"
+            ) from error
+
+    return decorate
+
+
+def releases_async_sessions(function: Callable) -> Callable:
+    # outside of `async with client:` sessions only live as long as the outermost call -
+    # with `asyncio.run(...)` per call, cached session would outlive its event loop
+    @wraps(function)
+    async def decorate(client: "InferenceHTTPClient", *args, **kwargs) -> Any:
+        async with client._async_sessions_scope():
+            return await function(client, *args, **kwargs)
 
     return decorate
 
@@ -123,19 +214,107 @@ class InferenceHTTPClient:
         cls,
         api_url: str,
         api_key: Optional[str] = None,
+        async_transport: AsyncTransport = AsyncTransport.AIOHTTP,
+        prewarm_connections: bool = False,
     ) -> "InferenceHTTPClient":
-        return cls(api_url=api_url, api_key=api_key)
+        return cls(
+            api_url=api_url,
+            api_key=api_key,
+            async_transport=async_transport,
+            prewarm_connections=prewarm_connections,
+        )
 
     def __init__(
         self,
         api_url: str,
         api_key: Optional[str] = None,
+        async_transport: AsyncTransport = AsyncTransport.AIOHTTP,
+        prewarm_connections: bool = False,
     ):
+        async_transport = AsyncTransport(async_transport)
+        if async_transport is AsyncTransport.HTTPX and httpx is None:
+            raise InvalidParameterError(
+                "`httpx` async transport requires `httpx` package to be installed - "
+                'use `pip install "httpx[http2]"`.'
+            )
         self.__api_url = api_url
         self.__api_key = api_key
+        self.__server_info_url = f"{api_url}/info"
+        self.__model_registry_url = f"{api_url}/model/registry"
+        self.__model_add_url = f"{api_url}/model/add"
+        self.__model_remove_url = f"{api_url}/model/remove"
+        self.__model_clear_url = f"{api_url}/model/clear"
+        self.__cogvlm_url = f"{api_url}/llm/cogvlm"
+        self.__workflows_url = f"{api_url}/infer/workflows"
+        self.__v1_inference_urls = {
+            task_type: f"{api_url}{endpoint}"
+            for task_type, endpoint in NEW_INFERENCE_ENDPOINTS.items()
+        }
+        self.__endpoint_urls: Dict[Tuple[HTTPClientMode, str], str] = {}
         self.__inference_configuration = InferenceConfiguration.init_default()
         self.__client_mode = _determine_client_mode(api_url=api_url)
         self.__selected_model: Optional[str] = None
+        self.__session = build_session(
+            pool_size=CONNECTIONS_POOL_SIZE,
+            max_retries=Retry(
+                total=SESSION_MAX_RETRIES,
+                backoff_factor=SESSION_RETRIES_BACKOFF_FACTOR,
+            ),
+        )
+        self.__async_session: Optional[aiohttp.ClientSession] = None
+        self.__async_session_loop: Optional[asyncio.AbstractEventLoop] = None
+        # number of pending async calls (and open `async with` blocks) using the sessions
+        self.__async_sessions_users = 0
+        self.__async_transport = async_transport
+        self.__model_descriptions_cache: Dict[str, Tuple[float, ModelDescription]] = {}
+        # (clip version, text) -> embedding, in order of last use
+        self.__clip_text_embeddings_cache = OrderedDict()
+        self.__clip_text_embeddings_cache_lock = threading.Lock()
+        self.__httpx_client: Optional["httpx.AsyncClient"] = None
+        self.__httpx_client_loop: Optional[asyncio.AbstractEventLoop] = None
+        if prewarm_connections:
+            threading.Thread(
+                target=_prewarm_connection,
+                kwargs={"session": self.__session, "url": api_url},
+                daemon=True,
+            ).start()
+
+    def __enter__(self) -> "InferenceHTTPClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "InferenceHTTPClient":
+        self.__async_sessions_users += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.__async_sessions_users -= 1
+        await self.aclose()
+
+    def close(self) -> None:
+        self.__session.close()
+
+    async def aclose(self) -> None:
+        if self.__async_session is not None and not self.__async_session.closed:
+            await self.__async_session.close()
+        self.__async_session = None
+        self.__async_session_loop = None
+        if self.__httpx_client is not None and not self.__httpx_client.is_closed:
+            await self.__httpx_client.aclose()
+        self.__httpx_client = None
+        self.__httpx_client_loop = None
+
+    @asynccontextmanager
+    async def _async_sessions_scope(self) -> AsyncGenerator[None, None]:
+        self.__async_sessions_users += 1
+        try:
+            yield None
+        finally:
+            self.__async_sessions_users -= 1
+            if self.__async_sessions_users == 0:
+                await self.aclose()
 
     @property
     def inference_configuration(self) -> InferenceConfiguration:
@@ -207,9 +386,9 @@ class InferenceHTTPClient:
 
     @wrap_errors
     def get_server_info(self) -> ServerInfo:
-        response = requests.get(f"{self.__api_url}/info")
-        response.raise_for_status()
-        response_payload = response.json()
+        response_payload = self.__request_json(
+            method=RequestMethod.GET, url=self.__server_info_url
+        )
         return ServerInfo.from_dict(response_payload)
 
     def infer_on_stream(
@@ -217,15 +396,32 @@ class InferenceHTTPClient:
         input_uri: str,
         model_id: Optional[str] = None,
     ) -> Generator[Tuple[Union[str, int], np.ndarray, dict], None, None]:
-        for reference, frame in load_stream_inference_input(
-            input_uri=input_uri,
-            image_extensions=self.__inference_configuration.image_extensions_for_directory_scan,
-        ):
-            prediction = self.infer(
-                inference_input=frame,
-                model_id=model_id,
-            )
-            yield reference, frame, prediction
+        # frames are decoded while previous ones are still being inferred - up to
+        # `2 * max_concurrent_requests` frames are kept in memory, results come in stream order
+        max_workers = max(self.__inference_configuration.max_concurrent_requests, 1)
+        max_frames_in_flight = 2 * max_workers
+        in_flight: Deque[Tuple[Union[str, int], np.ndarray, Future]] = deque()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            try:
+                for reference, frame in load_stream_inference_input(
+                    input_uri=input_uri,
+                    image_extensions=self.__inference_configuration.image_extensions_for_directory_scan,
+                ):
+                    future = executor.submit(
+                        self.infer,
+                        inference_input=frame,
+                        model_id=model_id,
+                    )
+                    in_flight.append((reference, frame, future))
+                    if len(in_flight) >= max_frames_in_flight:
+                        reference, frame, future = in_flight.popleft()
+                        yield reference, frame, future.result()
+                while in_flight:
+                    reference, frame, future = in_flight.popleft()
+                    yield reference, frame, future.result()
+            finally:
+                for _, _, future in in_flight:
+                    future.cancel()
 
     @wrap_errors
     def infer(
@@ -244,6 +440,7 @@ class InferenceHTTPClient:
         )
 
     @wrap_errors_async
+    @releases_async_sessions
     async def infer_async(
         self,
         inference_input: Union[ImagesReference, List[ImagesReference]],
@@ -259,6 +456,50 @@ class InferenceHTTPClient:
             model_id=model_id,
         )
 
+    def batch_infer(
+        self,
+        inference_inputs: List[ImagesReference],
+        model_id: Optional[str] = None,
+        max_batch_size: Optional[int] = None,
+        max_concurrent_requests: Optional[int] = None,
+    ) -> List[dict]:
+        """
+        Runs inference against all `inference_inputs`, packing them into requests of
+        `max_batch_size` images (`v1` mode only - `v0` API accepts single image per request)
+        sent `max_concurrent_requests` at a time. Unless given, both values are taken from
+        client configuration. Predictions are always returned as list.
+        """
+        batching_client = self.__with_batching_overrides(
+            max_batch_size=max_batch_size,
+            max_concurrent_requests=max_concurrent_requests,
+        )
+        result = batching_client.infer(
+            inference_input=inference_inputs,
+            model_id=model_id,
+        )
+        return _ensure_list(result)
+
+    @releases_async_sessions
+    async def batch_infer_async(
+        self,
+        inference_inputs: List[ImagesReference],
+        model_id: Optional[str] = None,
+        max_batch_size: Optional[int] = None,
+        max_concurrent_requests: Optional[int] = None,
+    ) -> List[dict]:
+        # sessions created upfront, such that batching client shares them
+        await self.__get_async_session()
+        await self.__get_inference_async_session()
+        batching_client = self.__with_batching_overrides(
+            max_batch_size=max_batch_size,
+            max_concurrent_requests=max_concurrent_requests,
+        )
+        result = await batching_client.infer_async(
+            inference_input=inference_inputs,
+            model_id=model_id,
+        )
+        return _ensure_list(result)
+
     def infer_from_api_v0(
         self,
         inference_input: Union[ImagesReference, List[ImagesReference]],
@@ -282,6 +523,9 @@ class InferenceHTTPClient:
             inference_input=inference_input,
             max_height=max_height,
             max_width=max_width,
+            session=self.__session,
+            # multipart upload sends binary body - base64 round-trip is skipped
+            encode_base64=not self.__inference_configuration.multipart_upload,
         )
         params = {
             "api_key": self.__api_key,
@@ -294,30 +538,34 @@ class InferenceHTTPClient:
             parameters=params,
             payload=None,
             max_batch_size=1,
-            image_placement=ImagePlacement.DATA,
+            image_placement=(
+                ImagePlacement.MULTIPART
+                if self.__inference_configuration.multipart_upload
+                else ImagePlacement.DATA
+            ),
         )
         responses = execute_requests_packages(
             requests_data=requests_data,
             request_method=RequestMethod.POST,
             max_concurrent_requests=self.__inference_configuration.max_concurrent_requests,
+            session=self.__session,
         )
-        results = []
-        for request_data, response in zip(requests_data, responses):
-            if response_contains_jpeg_image(response=response):
-                visualisation = transform_visualisation_bytes(
-                    visualisation=response.content,
-                    expected_format=self.__inference_configuration.output_visualisation_format,
-                )
-                parsed_response = {"visualization": visualisation}
-            else:
-                parsed_response = response.json()
-            parsed_response = adjust_prediction_to_client_scaling_factor(
-                prediction=parsed_response,
+        expected_format = self.__inference_configuration.output_visualisation_format
+        results = [
+            _post_process_v0_prediction(
+                prediction=(
+                    response.content
+                    if response_contains_jpeg_image(response=response)
+                    else orjson.loads(response.content)
+                ),
                 scaling_factor=request_data.image_scaling_factors[0],
+                expected_format=expected_format,
             )
-            results.append(parsed_response)
+            for request_data, response in zip(requests_data, responses)
+        ]
         return unwrap_single_element_list(sequence=results)
 
+    @releases_async_sessions
     async def infer_from_api_v0_async(
         self,
         inference_input: Union[ImagesReference, List[ImagesReference]],
@@ -341,6 +589,9 @@ class InferenceHTTPClient:
             inference_input=inference_input,
             max_height=max_height,
             max_width=max_width,
+            session=await self.__get_async_session(),
+            # multipart upload sends binary body - base64 round-trip is skipped
+            encode_base64=not self.__inference_configuration.multipart_upload,
         )
         params = {
             "api_key": self.__api_key,
@@ -353,28 +604,27 @@ class InferenceHTTPClient:
             parameters=params,
             payload=None,
             max_batch_size=1,
-            image_placement=ImagePlacement.DATA,
+            image_placement=(
+                ImagePlacement.MULTIPART
+                if self.__inference_configuration.multipart_upload
+                else ImagePlacement.DATA
+            ),
         )
         responses = await execute_requests_packages_async(
             requests_data=requests_data,
             request_method=RequestMethod.POST,
             max_concurrent_requests=self.__inference_configuration.max_concurrent_requests,
+            session=await self.__get_inference_async_session(),
         )
-        results = []
-        for request_data, response in zip(requests_data, responses):
-            if not issubclass(type(response), dict):
-                visualisation = transform_visualisation_bytes(
-                    visualisation=response,
-                    expected_format=self.__inference_configuration.output_visualisation_format,
-                )
-                parsed_response = {"visualization": visualisation}
-            else:
-                parsed_response = response
-            parsed_response = adjust_prediction_to_client_scaling_factor(
-                prediction=parsed_response,
+        expected_format = self.__inference_configuration.output_visualisation_format
+        results = [
+            _post_process_v0_prediction(
+                prediction=response,
                 scaling_factor=request_data.image_scaling_factors[0],
+                expected_format=expected_format,
             )
-            results.append(parsed_response)
+            for request_data, response in zip(requests_data, responses)
+        ]
         return unwrap_single_element_list(sequence=results)
 
     def infer_from_api_v1(
@@ -400,12 +650,12 @@ class InferenceHTTPClient:
             inference_input=inference_input,
             max_height=max_height,
             max_width=max_width,
+            session=self.__session,
         )
         payload = {
             "api_key": self.__api_key,
             "model_id": model_id_to_be_used,
         }
-        endpoint = NEW_INFERENCE_ENDPOINTS[model_description.task_type]
         payload.update(
             self.__inference_configuration.to_api_call_parameters(
                 client_mode=self.__client_mode,
@@ -413,41 +663,30 @@ class InferenceHTTPClient:
             )
         )
         requests_data = prepare_requests_data(
-            url=f"{self.__api_url}{endpoint}",
+            url=self.__v1_inference_urls[model_description.task_type],
             encoded_inference_inputs=encoded_inference_inputs,
             headers=DEFAULT_HEADERS,
             parameters=None,
             payload=payload,
             max_batch_size=self.__inference_configuration.max_batch_size,
             image_placement=ImagePlacement.JSON,
+            content_encoding=self.__inference_configuration.upload_compression,
         )
         responses = execute_requests_packages(
             requests_data=requests_data,
             request_method=RequestMethod.POST,
             max_concurrent_requests=self.__inference_configuration.max_concurrent_requests,
+            session=self.__session,
+        )
+        results = _post_process_v1_responses(
+            requests_data=requests_data,
+            parsed_responses=[orjson.loads(r.content) for r in responses],
+            visualisation_requested=self.__inference_configuration.visualize_predictions,
+            expected_format=self.__inference_configuration.output_visualisation_format,
         )
-        results = []
-        for request_data, response in zip(requests_data, responses):
-            parsed_response = response.json()
-            if not issubclass(type(parsed_response), list):
-                parsed_response = [parsed_response]
-            for parsed_response_element, scaling_factor in zip(
-                parsed_response, request_data.image_scaling_factors
-            ):
-                if parsed_response_element.get("visualization") is not None:
-                    parsed_response_element["visualization"] = (
-                        transform_base64_visualisation(
-                            visualisation=parsed_response_element["visualization"],
-                            expected_format=self.__inference_configuration.output_visualisation_format,
-                        )
-                    )
-                parsed_response_element = adjust_prediction_to_client_scaling_factor(
-                    prediction=parsed_response_element,
-                    scaling_factor=scaling_factor,
-                )
-                results.append(parsed_response_element)
         return unwrap_single_element_list(sequence=results)
 
+    @releases_async_sessions
     async def infer_from_api_v1_async(
         self,
         inference_input: Union[ImagesReference, List[ImagesReference]],
@@ -473,12 +712,12 @@ class InferenceHTTPClient:
             inference_input=inference_input,
             max_height=max_height,
             max_width=max_width,
+            session=await self.__get_async_session(),
         )
         payload = {
             "api_key": self.__api_key,
             "model_id": model_id_to_be_used,
         }
-        endpoint = NEW_INFERENCE_ENDPOINTS[model_description.task_type]
         payload.update(
             self.__inference_configuration.to_api_call_parameters(
                 client_mode=self.__client_mode,
@@ -486,38 +725,30 @@ class InferenceHTTPClient:
             )
         )
         requests_data = prepare_requests_data(
-            url=f"{self.__api_url}{endpoint}",
+            url=self.__v1_inference_urls[model_description.task_type],
             encoded_inference_inputs=encoded_inference_inputs,
             headers=DEFAULT_HEADERS,
             parameters=None,
             payload=payload,
             max_batch_size=self.__inference_configuration.max_batch_size,
             image_placement=ImagePlacement.JSON,
+            content_encoding=self.__inference_configuration.upload_compression,
         )
-        responses = await execute_requests_packages_async(
+        # responses are post-processed as they arrive, overlapping with requests in flight
+        results_by_request: List[List[dict]] = [[] for _ in requests_data]
+        async for request_index, response in iterate_requests_packages_async(
             requests_data=requests_data,
             request_method=RequestMethod.POST,
             max_concurrent_requests=self.__inference_configuration.max_concurrent_requests,
-        )
-        results = []
-        for request_data, parsed_response in zip(requests_data, responses):
-            if not issubclass(type(parsed_response), list):
-                parsed_response = [parsed_response]
-            for parsed_response_element, scaling_factor in zip(
-                parsed_response, request_data.image_scaling_factors
-            ):
-                if parsed_response_element.get("visualization") is not None:
-                    parsed_response_element["visualization"] = (
-                        transform_base64_visualisation(
-                            visualisation=parsed_response_element["visualization"],
-                            expected_format=self.__inference_configuration.output_visualisation_format,
-                        )
-                    )
-                parsed_response_element = adjust_prediction_to_client_scaling_factor(
-                    prediction=parsed_response_element,
-                    scaling_factor=scaling_factor,
-                )
-                results.append(parsed_response_element)
+            session=await self.__get_inference_async_session(),
+        ):
+            results_by_request[request_index] = _post_process_v1_responses(
+                requests_data=[requests_data[request_index]],
+                parsed_responses=[response],
+                visualisation_requested=self.__inference_configuration.visualize_predictions,
+                expected_format=self.__inference_configuration.output_visualisation_format,
+            )
+        results = list(itertools.chain.from_iterable(results_by_request))
         return unwrap_single_element_list(sequence=results)
 
     def get_model_description(
@@ -525,16 +756,19 @@ class InferenceHTTPClient:
     ) -> ModelDescription:
         self.__ensure_v1_client_mode()
         de_aliased_model_id = resolve_roboflow_model_alias(model_id=model_id)
+        matching_model = self.__get_cached_model_description(
+            model_id=de_aliased_model_id
+        )
+        if matching_model is not None:
+            return matching_model
         registered_models = self.list_loaded_models()
         matching_model = filter_model_descriptions(
-            descriptions=registered_models.models,
-            model_id=de_aliased_model_id,
+            descriptions=registered_models.models, model_id=de_aliased_model_id
         )
         if matching_model is None and allow_loading is True:
             registered_models = self.load_model(model_id=de_aliased_model_id)
             matching_model = filter_model_descriptions(
-                descriptions=registered_models.models,
-                model_id=de_aliased_model_id,
+                descriptions=registered_models.models, model_id=de_aliased_model_id
             )
         if matching_model is not None:
             return matching_model
@@ -543,23 +777,27 @@ class InferenceHTTPClient:
             f"retrieve its description."
         )
 
+    @releases_async_sessions
     async def get_model_description_async(
         self, model_id: str, allow_loading: bool = True
     ) -> ModelDescription:
         self.__ensure_v1_client_mode()
         de_aliased_model_id = resolve_roboflow_model_alias(model_id=model_id)
+        matching_model = self.__get_cached_model_description(
+            model_id=de_aliased_model_id
+        )
+        if matching_model is not None:
+            return matching_model
         registered_models = await self.list_loaded_models_async()
         matching_model = filter_model_descriptions(
-            descriptions=registered_models.models,
-            model_id=de_aliased_model_id,
+            descriptions=registered_models.models, model_id=de_aliased_model_id
         )
         if matching_model is None and allow_loading is True:
             registered_models = await self.load_model_async(
                 model_id=de_aliased_model_id
             )
             matching_model = filter_model_descriptions(
-                descriptions=registered_models.models,
-                model_id=de_aliased_model_id,
+                descriptions=registered_models.models, model_id=de_aliased_model_id
             )
         if matching_model is not None:
             return matching_model
@@ -571,19 +809,24 @@ class InferenceHTTPClient:
     @wrap_errors
     def list_loaded_models(self) -> RegisteredModels:
         self.__ensure_v1_client_mode()
-        response = requests.get(f"{self.__api_url}/model/registry")
-        response.raise_for_status()
-        response_payload = response.json()
-        return RegisteredModels.from_dict(response_payload)
+        response_payload = self.__request_json(
+            method=RequestMethod.GET, url=self.__model_registry_url
+        )
+        return self.__refresh_model_descriptions_cache(
+            registered_models=RegisteredModels.from_dict(response_payload)
+        )
 
     @wrap_errors_async
+    @releases_async_sessions
     async def list_loaded_models_async(self) -> RegisteredModels:
         self.__ensure_v1_client_mode()
-        async with aiohttp.ClientSession() as session:
-            async with session.get(f"{self.__api_url}/model/registry") as response:
-                response.raise_for_status()
-                response_payload = await response.json()
-                return RegisteredModels.from_dict(response_payload)
+        session = await self.__get_async_session()
+        async with session.get(self.__model_registry_url) as response:
+            response.raise_for_status()
+            response_payload = orjson.loads(await response.read())
+            return self.__refresh_model_descriptions_cache(
+                registered_models=RegisteredModels.from_dict(response_payload)
+            )
 
     @wrap_errors
     def load_model(
@@ -591,21 +834,22 @@ class InferenceHTTPClient:
     ) -> RegisteredModels:
         self.__ensure_v1_client_mode()
         de_aliased_model_id = resolve_roboflow_model_alias(model_id=model_id)
-        response = requests.post(
-            f"{self.__api_url}/model/add",
-            json={
+        response_payload = self.__request_json(
+            method=RequestMethod.POST,
+            url=self.__model_add_url,
+            payload={
                 "model_id": de_aliased_model_id,
                 "api_key": self.__api_key,
             },
-            headers=DEFAULT_HEADERS,
         )
-        response.raise_for_status()
-        response_payload = response.json()
         if set_as_default:
             self.__selected_model = de_aliased_model_id
-        return RegisteredModels.from_dict(response_payload)
+        return self.__refresh_model_descriptions_cache(
+            registered_models=RegisteredModels.from_dict(response_payload)
+        )
 
     @wrap_errors_async
+    @releases_async_sessions
     async def load_model_async(
         self, model_id: str, set_as_default: bool = False
     ) -> RegisteredModels:
@@ -615,77 +859,78 @@ class InferenceHTTPClient:
             "model_id": de_aliased_model_id,
             "api_key": self.__api_key,
         }
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.__api_url}/model/add",
-                json=payload,
-                headers=DEFAULT_HEADERS,
-            ) as response:
-                response.raise_for_status()
-                response_payload = await response.json()
+        response_payload = await self.__post_json_async(
+            url=self.__model_add_url, payload=payload
+        )
         if set_as_default:
             self.__selected_model = de_aliased_model_id
-        return RegisteredModels.from_dict(response_payload)
+        return self.__refresh_model_descriptions_cache(
+            registered_models=RegisteredModels.from_dict(response_payload)
+        )
 
     @wrap_errors
     def unload_model(self, model_id: str) -> RegisteredModels:
         self.__ensure_v1_client_mode()
         de_aliased_model_id = resolve_roboflow_model_alias(model_id=model_id)
-        response = requests.post(
-            f"{self.__api_url}/model/remove",
-            json={
+        response_payload = self.__request_json(
+            method=RequestMethod.POST,
+            url=self.__model_remove_url,
+            payload={
                 "model_id": de_aliased_model_id,
             },
-            headers=DEFAULT_HEADERS,
         )
-        response.raise_for_status()
-        response_payload = response.json()
         if (
             de_aliased_model_id == self.__selected_model
             or model_id == self.__selected_model
         ):
             self.__selected_model = None
-        return RegisteredModels.from_dict(response_payload)
+        return self.__refresh_model_descriptions_cache(
+            registered_models=RegisteredModels.from_dict(response_payload)
+        )
 
     @wrap_errors_async
+    @releases_async_sessions
     async def unload_model_async(self, model_id: str) -> RegisteredModels:
         self.__ensure_v1_client_mode()
         de_aliased_model_id = resolve_roboflow_model_alias(model_id=model_id)
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.__api_url}/model/remove",
-                json={
-                    "model_id": de_aliased_model_id,
-                },
-                headers=DEFAULT_HEADERS,
-            ) as response:
-                response.raise_for_status()
-                response_payload = await response.json()
+        response_payload = await self.__post_json_async(
+            url=self.__model_remove_url,
+            payload={
+                "model_id": de_aliased_model_id,
+            },
+        )
         if (
             de_aliased_model_id == self.__selected_model
             or model_id == self.__selected_model
         ):
             self.__selected_model = None
-        return RegisteredModels.from_dict(response_payload)
+        return self.__refresh_model_descriptions_cache(
+            registered_models=RegisteredModels.from_dict(response_payload)
+        )
 
     @wrap_errors
     def unload_all_models(self) -> RegisteredModels:
         self.__ensure_v1_client_mode()
-        response = requests.post(f"{self.__api_url}/model/clear")
-        response.raise_for_status()
-        response_payload = response.json()
+        response_payload = self.__request_json(
+            method=RequestMethod.POST, url=self.__model_clear_url
+        )
         self.__selected_model = None
-        return RegisteredModels.from_dict(response_payload)
+        return self.__refresh_model_descriptions_cache(
+            registered_models=RegisteredModels.from_dict(response_payload)
+        )
 
     @wrap_errors_async
+    @releases_async_sessions
     async def unload_all_models_async(self) -> RegisteredModels:
         self.__ensure_v1_client_mode()
-        async with aiohttp.ClientSession() as session:
-            async with session.post(f"{self.__api_url}/model/clear") as response:
-                response.raise_for_status()
-                response_payload = await response.json()
+        session = await self.__get_async_session()
+        async with session.post(self.__model_clear_url) as response:
+            response.raise_for_status()
+            response_payload = orjson.loads(await response.read())
         self.__selected_model = None
-        return RegisteredModels.from_dict(response_payload)
+        return self.__refresh_model_descriptions_cache(
+            registered_models=RegisteredModels.from_dict(response_payload)
+        )
 
     @wrap_errors
     def prompt_cogvlm(
@@ -697,6 +942,7 @@ class InferenceHTTPClient:
         self.__ensure_v1_client_mode()  # Lambda does not support CogVLM, so we require v1 mode of client
         encoded_image = load_static_inference_input(
             inference_input=visual_prompt,
+            session=self.__session,
         )
         payload = {
             "api_key": self.__api_key,
@@ -709,15 +955,12 @@ class InferenceHTTPClient:
         )
         if chat_history is not None:
             payload["history"] = chat_history
-        response = requests.post(
-            f"{self.__api_url}/llm/cogvlm",
-            json=payload,
-            headers=DEFAULT_HEADERS,
-        )
+        response = self.__post_json(url=self.__cogvlm_url, payload=payload)
         api_key_safe_raise_for_status(response=response)
-        return response.json()
+        return orjson.loads(response.content)
 
     @wrap_errors_async
+    @releases_async_sessions
     async def prompt_cogvlm_async(
         self,
         visual_prompt: ImagesReference,
@@ -727,6 +970,7 @@ class InferenceHTTPClient:
         self.__ensure_v1_client_mode()  # Lambda does not support CogVLM, so we require v1 mode of client
         encoded_image = await load_static_inference_input_async(
             inference_input=visual_prompt,
+            session=await self.__get_async_session(),
         )
         payload = {
             "api_key": self.__api_key,
@@ -739,14 +983,7 @@ class InferenceHTTPClient:
         )
         if chat_history is not None:
             payload["history"] = chat_history
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                f"{self.__api_url}/llm/cogvlm",
-                json=payload,
-                headers=DEFAULT_HEADERS,
-            ) as response:
-                response.raise_for_status()
-                return await response.json()
+        return await self.__post_json_async(url=self.__cogvlm_url, payload=payload)
 
     @wrap_errors
     def ocr_image(
@@ -755,9 +992,10 @@ class InferenceHTTPClient:
     ) -> Union[dict, List[dict]]:
         encoded_inference_inputs = load_static_inference_input(
             inference_input=inference_input,
+            session=self.__session,
         )
         payload = self.__initialise_payload()
-        url = self.__wrap_url_with_api_key(f"{self.__api_url}/doctr/ocr")
+        url = self.__build_endpoint_url("/doctr/ocr")
         requests_data = prepare_requests_data(
             url=url,
             encoded_inference_inputs=encoded_inference_inputs,
@@ -771,20 +1009,23 @@ class InferenceHTTPClient:
             requests_data=requests_data,
             request_method=RequestMethod.POST,
             max_concurrent_requests=self.__inference_configuration.max_concurrent_requests,
+            session=self.__session,
         )
-        results = [r.json() for r in responses]
+        results = [orjson.loads(r.content) for r in responses]
         return unwrap_single_element_list(sequence=results)
 
     @wrap_errors_async
+    @releases_async_sessions
     async def ocr_image_async(
         self,
         inference_input: Union[ImagesReference, List[ImagesReference]],
     ) -> Union[dict, List[dict]]:
         encoded_inference_inputs = await load_static_inference_input_async(
             inference_input=inference_input,
+            session=await self.__get_async_session(),
         )
         payload = self.__initialise_payload()
-        url = self.__wrap_url_with_api_key(f"{self.__api_url}/doctr/ocr")
+        url = self.__build_endpoint_url("/doctr/ocr")
         requests_data = prepare_requests_data(
             url=url,
             encoded_inference_inputs=encoded_inference_inputs,
@@ -798,6 +1039,7 @@ class InferenceHTTPClient:
             requests_data=requests_data,
             request_method=RequestMethod.POST,
             max_concurrent_requests=self.__inference_configuration.max_concurrent_requests,
+            session=await self.__get_inference_async_session(),
         )
         return unwrap_single_element_list(sequence=responses)
 
@@ -813,6 +1055,7 @@ class InferenceHTTPClient:
         return combine_gaze_detections(detections=result)
 
     @wrap_errors_async
+    @releases_async_sessions
     async def detect_gazes_async(
         self,
         inference_input: Union[ImagesReference, List[ImagesReference]],
@@ -841,6 +1084,7 @@ class InferenceHTTPClient:
         return unwrap_single_element_list(result)
 
     @wrap_errors_async
+    @releases_async_sessions
     async def get_clip_image_embeddings_async(
         self,
         inference_input: Union[ImagesReference, List[ImagesReference]],
@@ -863,38 +1107,130 @@ class InferenceHTTPClient:
         text: Union[str, List[str]],
         clip_version: Optional[str] = None,
     ) -> Union[dict, List[dict]]:
+        cached_embeddings = self.__get_cached_clip_text_embeddings(
+            text=text, clip_version=clip_version
+        )
+        missing_text = _exclude_cached_texts(
+            text=text, cached_embeddings=cached_embeddings
+        )
+        if missing_text is None:
+            return _build_cached_clip_text_embeddings_response(
+                text=text, cached_embeddings=cached_embeddings
+            )
+        unique_text, texts_indices = _deduplicate_texts(text=missing_text)
         payload = self.__initialise_payload()
-        payload["text"] = text
+        payload["text"] = unique_text
         if clip_version is not None:
             payload["clip_version_id"] = clip_version
-        response = requests.post(
-            self.__wrap_url_with_api_key(f"{self.__api_url}/clip/embed_text"),
-            json=payload,
-            headers=DEFAULT_HEADERS,
+        response = self.__post_json(
+            url=self.__build_endpoint_url("/clip/embed_text"), payload=payload
         )
         api_key_safe_raise_for_status(response=response)
-        return unwrap_single_element_list(sequence=response.json())
+        response_payload = _restore_duplicated_texts_embeddings(
+            response_payload=orjson.loads(response.content),
+            texts_indices=texts_indices,
+        )
+        response_payload = self.__cache_clip_text_embeddings(
+            text=text,
+            missing_text=missing_text,
+            clip_version=clip_version,
+            response_payload=response_payload,
+            cached_embeddings=cached_embeddings,
+        )
+        return unwrap_single_element_list(sequence=response_payload)
 
     @wrap_errors_async
+    @releases_async_sessions
     async def get_clip_text_embeddings_async(
         self,
         text: Union[str, List[str]],
         clip_version: Optional[str] = None,
     ) -> Union[dict, List[dict]]:
+        cached_embeddings = self.__get_cached_clip_text_embeddings(
+            text=text, clip_version=clip_version
+        )
+        missing_text = _exclude_cached_texts(
+            text=text, cached_embeddings=cached_embeddings
+        )
+        if missing_text is None:
+            return _build_cached_clip_text_embeddings_response(
+                text=text, cached_embeddings=cached_embeddings
+            )
+        unique_text, texts_indices = _deduplicate_texts(text=missing_text)
         payload = self.__initialise_payload()
-        payload["text"] = text
+        payload["text"] = unique_text
         if clip_version is not None:
             payload["clip_version_id"] = clip_version
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                self.__wrap_url_with_api_key(f"{self.__api_url}/clip/embed_text"),
-                json=payload,
-                headers=DEFAULT_HEADERS,
-            ) as response:
-                response.raise_for_status()
-                response_payload = await response.json()
+        response_payload = await self.__post_json_async(
+            url=self.__build_endpoint_url("/clip/embed_text"),
+            payload=payload,
+        )
+        response_payload = _restore_duplicated_texts_embeddings(
+            response_payload=response_payload,
+            texts_indices=texts_indices,
+        )
+        response_payload = self.__cache_clip_text_embeddings(
+            text=text,
+            missing_text=missing_text,
+            clip_version=clip_version,
+            response_payload=response_payload,
+            cached_embeddings=cached_embeddings,
+        )
         return unwrap_single_element_list(sequence=response_payload)
 
+    def get_clip_text_embeddings_batch(
+        self,
+        texts: List[str],
+        clip_version: Optional[str] = None,
+        batch_size: int = CLIP_TEXT_EMBEDDINGS_BATCH_SIZE,
+        max_batch_characters: int = CLIP_TEXT_EMBEDDINGS_MAX_BATCH_CHARACTERS,
+    ) -> List[dict]:
+        results = [
+            self.get_clip_text_embeddings(text=batch, clip_version=clip_version)
+            for batch in make_batches_within_characters_limit(
+                texts=texts,
+                batch_size=batch_size,
+                max_batch_characters=max_batch_characters,
+            )
+        ]
+        return combine_clip_embeddings(embeddings=results)
+
+    @releases_async_sessions
+    async def get_clip_text_embeddings_batch_async(
+        self,
+        texts: List[str],
+        clip_version: Optional[str] = None,
+        batch_size: int = CLIP_TEXT_EMBEDDINGS_BATCH_SIZE,
+        max_batch_characters: int = CLIP_TEXT_EMBEDDINGS_MAX_BATCH_CHARACTERS,
+    ) -> List[dict]:
+        semaphore = asyncio.Semaphore(
+            max(self.__inference_configuration.max_concurrent_requests, 1)
+        )
+        results = await asyncio.gather(
+            *[
+                self.__get_clip_text_embeddings_with_semaphore_async(
+                    semaphore=semaphore, text=batch, clip_version=clip_version
+                )
+                for batch in make_batches_within_characters_limit(
+                    texts=texts,
+                    batch_size=batch_size,
+                    max_batch_characters=max_batch_characters,
+                )
+            ]
+        )
+        return combine_clip_embeddings(embeddings=list(results))
+
+    async def __get_clip_text_embeddings_with_semaphore_async(
+        self,
+        semaphore: asyncio.Semaphore,
+        text: List[str],
+        clip_version: Optional[str],
+    ) -> dict:
+        async with semaphore:
+            return await self.get_clip_text_embeddings_async(
+                text=text, clip_version=clip_version
+            )
+
     @wrap_errors
     def clip_compare(
         self,
@@ -922,6 +1258,7 @@ class InferenceHTTPClient:
         if subject_type == "image":
             encoded_image = load_static_inference_input(
                 inference_input=subject,
+                session=self.__session,
             )
             payload = inject_images_into_payload(
                 payload=payload, encoded_images=encoded_image, key="subject"
@@ -931,21 +1268,22 @@ class InferenceHTTPClient:
         if prompt_type == "image":
             encoded_inference_inputs = load_static_inference_input(
                 inference_input=prompt,
+                session=self.__session,
             )
             payload = inject_images_into_payload(
                 payload=payload, encoded_images=encoded_inference_inputs, key="prompt"
             )
         else:
             payload["prompt"] = prompt
-        response = requests.post(
-            self.__wrap_url_with_api_key(f"{self.__api_url}/clip/compare"),
-            json=payload,
-            headers=DEFAULT_HEADERS,
+        response = self.__post_json(
+            url=self.__build_endpoint_url("/clip/compare"),
+            payload=payload,
         )
         api_key_safe_raise_for_status(response=response)
-        return response.json()
+        return orjson.loads(response.content)
 
     @wrap_errors_async
+    @releases_async_sessions
     async def clip_compare_async(
         self,
         subject: Union[str, ImagesReference],
@@ -972,6 +1310,7 @@ class InferenceHTTPClient:
         if subject_type == "image":
             encoded_image = await load_static_inference_input_async(
                 inference_input=subject,
+                session=await self.__get_async_session(),
             )
             payload = inject_images_into_payload(
                 payload=payload, encoded_images=encoded_image, key="subject"
@@ -981,6 +1320,7 @@ class InferenceHTTPClient:
         if prompt_type == "image":
             encoded_inference_inputs = await load_static_inference_input_async(
                 inference_input=prompt,
+                session=await self.__get_async_session(),
             )
             payload = inject_images_into_payload(
                 payload=payload, encoded_images=encoded_inference_inputs, key="prompt"
@@ -988,14 +1328,10 @@ class InferenceHTTPClient:
         else:
             payload["prompt"] = prompt
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                self.__wrap_url_with_api_key(f"{self.__api_url}/clip/compare"),
-                json=payload,
-                headers=DEFAULT_HEADERS,
-            ) as response:
-                response.raise_for_status()
-                return await response.json()
+        return await self.__post_json_async(
+            url=self.__build_endpoint_url("/clip/compare"),
+            payload=payload,
+        )
 
     @wrap_errors
     def infer_from_workflow(
@@ -1006,6 +1342,7 @@ class InferenceHTTPClient:
         images: Optional[Dict[str, Any]] = None,
         parameters: Optional[Dict[str, Any]] = None,
         excluded_fields: Optional[List[str]] = None,
+        decode_fields: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """
         Triggers inference from workflow specification at the inference HTTP
@@ -1017,7 +1354,9 @@ class InferenceHTTPClient:
         images and prepare a proper payload. Supported images are numpy arrays,
         PIL.Image and base64 images, links to images and local paths.
         `excluded_fields` will be added to request to filter out results
-        of workflow execution at the server side.
+        of workflow execution at the server side. If `decode_fields` are given,
+        only those outputs are decoded into `output_visualisation_format` - the
+        rest is returned as raw JSON (empty list skips decoding entirely).
         """
         named_workflow_specified = (workspace_name is not None) and (
             workflow_name is not None
@@ -1036,6 +1375,7 @@ class InferenceHTTPClient:
         for image_name, image in images.items():
             loaded_image = load_static_inference_input(
                 inference_input=image,
+                session=self.__session,
             )
             inject_images_into_payload(
                 payload=inputs,
@@ -1049,19 +1389,19 @@ class InferenceHTTPClient:
         if specification is not None:
             payload["specification"] = specification
         if specification is not None:
-            url = f"{self.__api_url}/infer/workflows"
+            url = self.__workflows_url
         else:
-            url = f"{self.__api_url}/infer/workflows/{workspace_name}/{workflow_name}"
-        response = requests.post(
-            url,
-            json=payload,
-            headers=DEFAULT_HEADERS,
+            url = f"{self.__workflows_url}/{workspace_name}/{workflow_name}"
+        response = self.__post_json(
+            url=url,
+            payload=payload,
+            stream=ijson is not None,
         )
         api_key_safe_raise_for_status(response=response)
-        workflow_outputs = response.json()["outputs"]
-        return decode_workflow_outputs(
-            workflow_outputs=workflow_outputs,
+        return _decode_workflow_response(
+            response=response,
             expected_format=self.__inference_configuration.output_visualisation_format,
+            decode_fields=decode_fields,
         )
 
     @wrap_errors
@@ -1074,6 +1414,7 @@ class InferenceHTTPClient:
     ) -> List[dict]:
         encoded_inference_inputs = load_static_inference_input(
             inference_input=inference_input,
+            session=self.__session,
         )
         payload = self.__initialise_payload()
         payload["text"] = class_names
@@ -1081,7 +1422,7 @@ class InferenceHTTPClient:
             payload["yolo_world_version_id"] = model_version
         if confidence is not None:
             payload["confidence"] = confidence
-        url = self.__wrap_url_with_api_key(f"{self.__api_url}/yolo_world/infer")
+        url = self.__build_endpoint_url("/yolo_world/infer")
         requests_data = prepare_requests_data(
             url=url,
             encoded_inference_inputs=encoded_inference_inputs,
@@ -1095,10 +1436,12 @@ class InferenceHTTPClient:
             requests_data=requests_data,
             request_method=RequestMethod.POST,
             max_concurrent_requests=self.__inference_configuration.max_concurrent_requests,
+            session=self.__session,
         )
-        return [r.json() for r in responses]
+        return [orjson.loads(r.content) for r in responses]
 
     @wrap_errors_async
+    @releases_async_sessions
     async def infer_from_yolo_world_async(
         self,
         inference_input: Union[ImagesReference, List[ImagesReference]],
@@ -1108,6 +1451,7 @@ class InferenceHTTPClient:
     ) -> List[dict]:
         encoded_inference_inputs = await load_static_inference_input_async(
             inference_input=inference_input,
+            session=await self.__get_async_session(),
         )
         payload = self.__initialise_payload()
         payload["text"] = class_names
@@ -1115,7 +1459,7 @@ class InferenceHTTPClient:
             payload["yolo_world_version_id"] = model_version
         if confidence is not None:
             payload["confidence"] = confidence
-        url = self.__wrap_url_with_api_key(f"{self.__api_url}/yolo_world/infer")
+        url = self.__build_endpoint_url("/yolo_world/infer")
         requests_data = prepare_requests_data(
             url=url,
             encoded_inference_inputs=encoded_inference_inputs,
@@ -1129,6 +1473,7 @@ class InferenceHTTPClient:
             requests_data=requests_data,
             request_method=RequestMethod.POST,
             max_concurrent_requests=self.__inference_configuration.max_concurrent_requests,
+            session=await self.__get_inference_async_session(),
         )
 
     def _post_images(
@@ -1138,30 +1483,87 @@ class InferenceHTTPClient:
         model_id: Optional[str] = None,
         extra_payload: Optional[Dict[str, Any]] = None,
     ) -> Union[dict, List[dict]]:
-        encoded_inference_inputs = load_static_inference_input(
-            inference_input=inference_input,
-        )
         payload = self.__initialise_payload()
         if model_id is not None:
             payload["model_id"] = model_id
-        url = self.__wrap_url_with_api_key(f"{self.__api_url}{endpoint}")
+        url = self.__build_endpoint_url(endpoint)
         if extra_payload is not None:
             payload.update(extra_payload)
-        requests_data = prepare_requests_data(
-            url=url,
-            encoded_inference_inputs=encoded_inference_inputs,
-            headers=DEFAULT_HEADERS,
-            parameters=None,
-            payload=payload,
-            max_batch_size=self.__inference_configuration.max_batch_size,
-            image_placement=ImagePlacement.JSON,
-        )
-        responses = execute_requests_packages(
-            requests_data=requests_data,
-            request_method=RequestMethod.POST,
-            max_concurrent_requests=self.__inference_configuration.max_concurrent_requests,
-        )
-        results = [r.json() for r in responses]
+        max_batch_size = self.__inference_configuration.max_batch_size
+        max_concurrent_requests = self.__inference_configuration.max_concurrent_requests
+        images = _ensure_images_list(inference_input=inference_input)
+        if len(images) <= max_batch_size:
+            # single request - no point in encoding images in background
+            requests_data = prepare_requests_data(
+                url=url,
+                encoded_inference_inputs=load_static_inference_input(
+                    inference_input=images,
+                    session=self.__session,
+                ),
+                headers=DEFAULT_HEADERS,
+                parameters=None,
+                payload=payload,
+                max_batch_size=max_batch_size,
+                image_placement=ImagePlacement.JSON,
+                content_encoding=self.__inference_configuration.upload_compression,
+            )
+            responses = execute_requests_packages(
+                requests_data=requests_data,
+                request_method=RequestMethod.POST,
+                max_concurrent_requests=max_concurrent_requests,
+                session=self.__session,
+            )
+            return unwrap_single_element_list(
+                sequence=[orjson.loads(r.content) for r in responses]
+            )
+        images_batches = make_batches(iterable=images, batch_size=max_batch_size)
+        results = []
+        # images are encoded one by one in worker threads, ahead of requests being sent
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as encoding_executor:
+            encoded_batches = [
+                [
+                    encoding_executor.submit(
+                        load_static_inference_input,
+                        inference_input=image,
+                        session=self.__session,
+                    )
+                    for image in images_batch
+                ]
+                for images_batch in images_batches
+            ]
+            try:
+                for encoded_batches_package in make_batches(
+                    iterable=encoded_batches, batch_size=max_concurrent_requests
+                ):
+                    requests_data = [
+                        request_data
+                        for encoded_batch in encoded_batches_package
+                        for request_data in prepare_requests_data(
+                            url=url,
+                            encoded_inference_inputs=[
+                                encoded_image
+                                for encoded_images in encoded_batch
+                                for encoded_image in encoded_images.result()
+                            ],
+                            headers=DEFAULT_HEADERS,
+                            parameters=None,
+                            payload=payload,
+                            max_batch_size=max_batch_size,
+                            image_placement=ImagePlacement.JSON,
+                            content_encoding=self.__inference_configuration.upload_compression,
+                        )
+                    ]
+                    responses = execute_requests_packages(
+                        requests_data=requests_data,
+                        request_method=RequestMethod.POST,
+                        max_concurrent_requests=max_concurrent_requests,
+                        session=self.__session,
+                    )
+                    results.extend(orjson.loads(r.content) for r in responses)
+            finally:
+                for encoded_batch in encoded_batches:
+                    for encoded_images in encoded_batch:
+                        encoded_images.cancel()
         return unwrap_single_element_list(sequence=results)
 
     async def _post_images_async(
@@ -1171,15 +1573,86 @@ class InferenceHTTPClient:
         model_id: Optional[str] = None,
         extra_payload: Optional[Dict[str, Any]] = None,
     ) -> Union[dict, List[dict]]:
-        encoded_inference_inputs = await load_static_inference_input_async(
+        batches_responses = {}
+        async for batch_index, responses in self._iterate_post_images_async(
             inference_input=inference_input,
+            endpoint=endpoint,
+            model_id=model_id,
+            extra_payload=extra_payload,
+        ):
+            batches_responses[batch_index] = responses
+        return unwrap_single_element_list(
+            sequence=[
+                response
+                for batch_index in sorted(batches_responses)
+                for response in batches_responses[batch_index]
+            ]
         )
+
+    async def _iterate_post_images_async(
+        self,
+        inference_input: Union[ImagesReference, List[ImagesReference]],
+        endpoint: str,
+        model_id: Optional[str] = None,
+        extra_payload: Optional[Dict[str, Any]] = None,
+    ) -> AsyncGenerator[Tuple[int, List[Union[dict, bytes]]], None]:
+        # yields responses for batches of images (with index of batch) as they complete
         payload = self.__initialise_payload()
         if model_id is not None:
             payload["model_id"] = model_id
-        url = self.__wrap_url_with_api_key(f"{self.__api_url}{endpoint}")
+        url = self.__build_endpoint_url(endpoint)
         if extra_payload is not None:
             payload.update(extra_payload)
+        semaphore = asyncio.Semaphore(
+            max(self.__inference_configuration.max_concurrent_requests, 1)
+        )
+        loading_session = await self.__get_async_session()
+        session = await self.__get_inference_async_session()
+        batches_requests = [
+            self.__post_images_batch_async(
+                batch_index=batch_index,
+                images=images_batch,
+                url=url,
+                payload=payload,
+                semaphore=semaphore,
+                loading_session=loading_session,
+                session=session,
+            )
+            for batch_index, images_batch in enumerate(
+                make_batches(
+                    iterable=_ensure_images_list(inference_input=inference_input),
+                    batch_size=self.__inference_configuration.max_batch_size,
+                )
+            )
+        ]
+        if len(batches_requests) == 1:
+            # single request is awaited directly, without scheduling a task
+            yield await batches_requests[0]
+            return
+        tasks = [asyncio.ensure_future(request) for request in batches_requests]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def __post_images_batch_async(
+        self,
+        batch_index: int,
+        images: List[ImagesReference],
+        url: str,
+        payload: Dict[str, Any],
+        semaphore: asyncio.Semaphore,
+        loading_session: aiohttp.ClientSession,
+        session: AsyncSession,
+    ) -> Tuple[int, List[Union[dict, bytes]]]:
+        # encoding happens before the request slot is taken - overlapping with
+        # requests of other batches that are already in flight
+        encoded_inference_inputs = await load_static_inference_input_async(
+            inference_input=images,
+            session=loading_session,
+        )
         requests_data = prepare_requests_data(
             url=url,
             encoded_inference_inputs=encoded_inference_inputs,
@@ -1188,23 +1661,219 @@ class InferenceHTTPClient:
             payload=payload,
             max_batch_size=self.__inference_configuration.max_batch_size,
             image_placement=ImagePlacement.JSON,
+            content_encoding=self.__inference_configuration.upload_compression,
         )
-        responses = await execute_requests_packages_async(
-            requests_data=requests_data,
+        async with semaphore:
+            responses = await make_parallel_requests_async(
+                requests_data=requests_data,
+                request_method=RequestMethod.POST,
+                session=session,
+            )
+        return batch_index, responses
+
+    def __post_json(
+        self, url: str, payload: dict, stream: bool = False
+    ) -> requests.Response:
+        request_data = RequestData(
+            url=url,
+            request_elements=1,
+            headers=DEFAULT_HEADERS,
+            parameters=None,
+            data=None,
+            payload=payload,
+            image_scaling_factors=[None],
+            content_encoding=self.__inference_configuration.upload_compression,
+        )
+        data, headers = serialise_payload(request_data=request_data)
+        response = self.__session.post(url, data=data, headers=headers, stream=stream)
+        if compression_is_not_supported(
+            status_code=response.status_code, headers=headers
+        ):
+            # server does not accept compressed body - falling back to plain upload,
+            # streamed response must be released, so that connection returns to the pool
+            response.close()
+            data, headers = serialise_payload(
+                request_data=replace(request_data, content_encoding=None)
+            )
+            response = self.__session.post(
+                url, data=data, headers=headers, stream=stream
+            )
+        return response
+
+    def __request_json(
+        self,
+        method: RequestMethod,
+        url: str,
+        payload: Optional[dict] = None,
+    ) -> Any:
+        # small JSON control-plane calls (server info, models registry)
+        if payload is None:
+            response = self.__session.request(method.value, url)
+        else:
+            response = self.__session.request(
+                method.value,
+                url,
+                data=serialise_json(value=payload),
+                headers=DEFAULT_HEADERS,
+            )
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    async def __post_json_async(self, url: str, payload: dict) -> Any:
+        content_encoding = self.__inference_configuration.upload_compression
+        if (
+            self.__async_transport is AsyncTransport.AIOHTTP
+            and content_encoding is None
+        ):
+            session = await self.__get_async_session()
+            async with session.post(
+                url, json=payload, headers=DEFAULT_HEADERS
+            ) as response:
+                response.raise_for_status()
+                return orjson.loads(await response.read())
+        # `httpx` client multiplexes concurrent calls over HTTP/2 connection, executor
+        # takes care of upload compression
+        request_data = RequestData(
+            url=url,
+            request_elements=1,
+            headers=DEFAULT_HEADERS,
+            parameters=None,
+            data=None,
+            payload=payload,
+            image_scaling_factors=[None],
+            content_encoding=content_encoding,
+        )
+        responses = await make_parallel_requests_async(
+            requests_data=[request_data],
             request_method=RequestMethod.POST,
-            max_concurrent_requests=self.__inference_configuration.max_concurrent_requests,
+            session=await self.__get_inference_async_session(),
         )
-        return unwrap_single_element_list(sequence=responses)
+        return responses[0]
+
+    async def __get_async_session(self) -> aiohttp.ClientSession:
+        # aiohttp session is bound to event loop it was created in
+        loop = asyncio.get_running_loop()
+        if (
+            self.__async_session is None
+            or self.__async_session.closed
+            or self.__async_session_loop is not loop
+        ):
+            self.__async_session = build_async_session()
+            self.__async_session_loop = loop
+        return self.__async_session
+
+    async def __get_inference_async_session(self) -> AsyncSession:
+        if self.__async_transport is not AsyncTransport.HTTPX:
+            return await self.__get_async_session()
+        loop = asyncio.get_running_loop()
+        if (
+            self.__httpx_client is None
+            or self.__httpx_client.is_closed
+            or self.__httpx_client_loop is not loop
+        ):
+            self.__httpx_client = build_httpx_async_client()
+            self.__httpx_client_loop = loop
+        return self.__httpx_client
+
+    def __with_batching_overrides(
+        self,
+        max_batch_size: Optional[int],
+        max_concurrent_requests: Optional[int],
+    ) -> "InferenceHTTPClient":
+        # shallow copy shares connections, but not configuration - so overrides
+        # do not leak into concurrent calls made against this client
+        overrides = {}
+        if max_batch_size is not None:
+            overrides["max_batch_size"] = max_batch_size
+        if max_concurrent_requests is not None:
+            overrides["max_concurrent_requests"] = max_concurrent_requests
+        if not overrides:
+            return self
+        return copy.copy(self).configure(
+            inference_configuration=replace(self.__inference_configuration, **overrides)
+        )
+
+    def __refresh_model_descriptions_cache(
+        self, registered_models: RegisteredModels
+    ) -> RegisteredModels:
+        # each registry response reflects full server state - previous entries are dropped
+        expires_at = time.monotonic() + MODEL_DESCRIPTIONS_CACHE_TTL
+        self.__model_descriptions_cache.clear()
+        self.__model_descriptions_cache.update(
+            (model.model_id, (expires_at, model)) for model in registered_models.models
+        )
+        return registered_models
+
+    def __get_cached_model_description(
+        self, model_id: str
+    ) -> Optional[ModelDescription]:
+        cache_entry = self.__model_descriptions_cache.get(model_id)
+        if cache_entry is None:
+            return None
+        expires_at, model_description = cache_entry
+        if time.monotonic() > expires_at:
+            self.__model_descriptions_cache.pop(model_id, None)
+            return None
+        return model_description
+
+    def __get_cached_clip_text_embeddings(
+        self, text: Union[str, List[str]], clip_version: Optional[str]
+    ) -> Dict[str, List[float]]:
+        if self.__inference_configuration.clip_text_embeddings_cache_size <= 0:
+            return {}
+        cached_embeddings = {}
+        with self.__clip_text_embeddings_cache_lock:
+            for t in _ensure_texts_list(text=text):
+                key = (clip_version, t)
+                embedding = self.__clip_text_embeddings_cache.get(key)
+                if embedding is not None:
+                    self.__clip_text_embeddings_cache.move_to_end(key)
+                    cached_embeddings[t] = embedding
+        return cached_embeddings
+
+    def __cache_clip_text_embeddings(
+        self,
+        text: Union[str, List[str]],
+        missing_text: Union[str, List[str]],
+        clip_version: Optional[str],
+        response_payload: dict,
+        cached_embeddings: Dict[str, List[float]],
+    ) -> dict:
+        cache_size = self.__inference_configuration.clip_text_embeddings_cache_size
+        if cache_size <= 0:
+            return response_payload
+        embeddings = dict(
+            zip(_ensure_texts_list(text=missing_text), response_payload["embeddings"])
+        )
+        with self.__clip_text_embeddings_cache_lock:
+            for t, embedding in embeddings.items():
+                # copy is cached, so that callers can safely modify returned lists
+                self.__clip_text_embeddings_cache[(clip_version, t)] = list(embedding)
+                self.__clip_text_embeddings_cache.move_to_end((clip_version, t))
+            while len(self.__clip_text_embeddings_cache) > cache_size:
+                self.__clip_text_embeddings_cache.popitem(last=False)
+        if cached_embeddings:
+            # embeddings of cache hits are merged back in order of input texts
+            embeddings.update(cached_embeddings)
+            response_payload["embeddings"] = [
+                list(embeddings[t]) for t in _ensure_texts_list(text=text)
+            ]
+        return response_payload
 
     def __initialise_payload(self) -> dict:
         if self.__client_mode is not HTTPClientMode.V0:
             return {"api_key": self.__api_key}
         return {}
 
-    def __wrap_url_with_api_key(self, url: str) -> str:
-        if self.__client_mode is not HTTPClientMode.V0:
-            return url
-        return f"{url}?api_key={self.__api_key}"
+    def __build_endpoint_url(self, endpoint: str) -> str:
+        key = (self.__client_mode, endpoint)
+        url = self.__endpoint_urls.get(key)
+        if url is None:
+            url = f"{self.__api_url}{endpoint}"
+            if self.__client_mode is HTTPClientMode.V0:
+                url = f"{url}?{urlencode({'api_key': self.__api_key})}"
+            self.__endpoint_urls[key] = url
+        return url
 
     def __ensure_v1_client_mode(self) -> None:
         if self.__client_mode is not HTTPClientMode.V1:
@@ -1233,6 +1902,187 @@ def _determine_client_mode(api_url: str) -> HTTPClientMode:
     return HTTPClientMode.V1
 
 
+def _prewarm_connection(session: requests.Session, url: str) -> None:
+    # opens (and performs TLS handshake for) pooled connection ahead of first request
+    try:
+        session.head(url, timeout=PREWARM_TIMEOUT)
+    except RequestException:
+        pass
+
+
+def _deduplicate_texts(
+    text: Union[str, List[str]]
+) -> Tuple[Union[str, List[str]], Optional[List[int]]]:
+    # returns unique texts and - if any duplicate was found - index of unique text
+    # for each of the input texts
+    if not isinstance(text, list):
+        return text, None
+    unique_texts: Dict[str, int] = {}
+    texts_indices = [unique_texts.setdefault(t, len(unique_texts)) for t in text]
+    if len(unique_texts) == len(text):
+        return text, None
+    return list(unique_texts), texts_indices
+
+
+def _ensure_texts_list(text: Union[str, List[str]]) -> List[str]:
+    if isinstance(text, list):
+        return text
+    return [text]
+
+
+def _exclude_cached_texts(
+    text: Union[str, List[str]], cached_embeddings: Dict[str, List[float]]
+) -> Optional[Union[str, List[str]]]:
+    # returns texts to be embedded by the server - `None` if all of them are cached
+    if not cached_embeddings:
+        return text
+    missing_texts = [
+        t for t in _ensure_texts_list(text=text) if t not in cached_embeddings
+    ]
+    return missing_texts or None
+
+
+def _build_cached_clip_text_embeddings_response(
+    text: Union[str, List[str]], cached_embeddings: Dict[str, List[float]]
+) -> dict:
+    return {
+        "frame_id": None,
+        "time": None,
+        "embeddings": [
+            list(cached_embeddings[t]) for t in _ensure_texts_list(text=text)
+        ],
+    }
+
+
+def _restore_duplicated_texts_embeddings(
+    response_payload: dict, texts_indices: Optional[List[int]]
+) -> dict:
+    if texts_indices is None:
+        return response_payload
+    embeddings = response_payload["embeddings"]
+    response_payload["embeddings"] = [embeddings[i] for i in texts_indices]
+    return response_payload
+
+
+def _decode_workflow_response(
+    response: requests.Response,
+    expected_format: VisualisationResponseFormat,
+    decode_fields: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    if decode_fields is not None:
+        decode_fields = set(decode_fields)
+    if ijson is None:
+        workflow_outputs = orjson.loads(response.content).get("outputs")
+        if not issubclass(type(workflow_outputs), dict):
+            raise InvalidWorkflowResponseError(WORKFLOW_OUTPUTS_MISSING_MESSAGE)
+        return decode_workflow_outputs(
+            workflow_outputs=workflow_outputs,
+            expected_format=expected_format,
+            decode_fields=decode_fields,
+        )
+    # outputs are parsed one by one from the stream, without keeping the whole body
+    response.raw.decode_content = True
+    with response:
+        return decode_workflow_outputs_items(
+            workflow_outputs_items=_stream_workflow_outputs_items(stream=response.raw),
+            expected_format=expected_format,
+            decode_fields=decode_fields,
+        )
+
+
+def _stream_workflow_outputs_items(
+    stream: Any,
+) -> Generator[Tuple[str, Any], None, None]:
+    # `ijson.kvitems(...)` silently yields nothing if `outputs` is missing or is not an object,
+    # so the event of `outputs` value is tracked to fail the same way as in-memory decoding
+    outputs_value_events = []
+
+    def track_outputs_value_event(
+        events: Iterable[Tuple[str, str, Any]]
+    ) -> Generator[Tuple[str, str, Any], None, None]:
+        for prefix, event, value in events:
+            if prefix == "outputs" and not outputs_value_events:
+                outputs_value_events.append(event)
+            yield prefix, event, value
+
+    events = track_outputs_value_event(events=ijson.parse(stream, use_float=True))
+    yield from ijson.kvitems(events, "outputs")
+    if outputs_value_events != ["start_map"]:
+        raise InvalidWorkflowResponseError(WORKFLOW_OUTPUTS_MISSING_MESSAGE)
+
+
+def _post_process_v1_responses(
+    requests_data: List[RequestData],
+    parsed_responses: List[Union[dict, List[dict]]],
+    visualisation_requested: bool,
+    expected_format: VisualisationResponseFormat,
+) -> List[dict]:
+    # without visualisation requested, there is no need to look it up per prediction
+    expected_format = expected_format if visualisation_requested else None
+    return [
+        _post_process_v1_prediction(
+            prediction=prediction,
+            scaling_factor=scaling_factor,
+            expected_format=expected_format,
+        )
+        for request_data, parsed_response in zip(requests_data, parsed_responses)
+        for prediction, scaling_factor in zip(
+            _ensure_list(result=parsed_response), request_data.image_scaling_factors
+        )
+    ]
+
+
+def _post_process_v1_prediction(
+    prediction: dict,
+    scaling_factor: Optional[float],
+    expected_format: Optional[VisualisationResponseFormat],
+) -> dict:
+    visualisation = None
+    if expected_format is not None:
+        visualisation = prediction.get("visualization")
+    if visualisation is not None:
+        prediction["visualization"] = transform_base64_visualisation(
+            visualisation=visualisation,
+            expected_format=expected_format,
+        )
+    return adjust_prediction_to_client_scaling_factor(
+        prediction=prediction,
+        scaling_factor=scaling_factor,
+    )
+
+
+def _post_process_v0_prediction(
+    prediction: Union[dict, bytes],
+    scaling_factor: Optional[float],
+    expected_format: VisualisationResponseFormat,
+) -> dict:
+    if not isinstance(prediction, dict):
+        prediction = {
+            "visualization": transform_visualisation_bytes(
+                visualisation=prediction,
+                expected_format=expected_format,
+            )
+        }
+    return adjust_prediction_to_client_scaling_factor(
+        prediction=prediction,
+        scaling_factor=scaling_factor,
+    )
+
+
+def _ensure_images_list(
+    inference_input: Union[ImagesReference, List[ImagesReference]]
+) -> List[ImagesReference]:
+    if isinstance(inference_input, list):
+        return inference_input
+    return [inference_input]
+
+
+def _ensure_list(result: Union[dict, List[dict]]) -> List[dict]:
+    if isinstance(result, list):
+        return result
+    return [result]
+
+
 def _ensure_model_is_selected(model_id: Optional[str]) -> None:
     if model_id is None:
         raise ModelNotSelectedError("No model was selected to be used.")
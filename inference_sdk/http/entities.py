@@ -54,6 +54,17 @@ class HTTPClientMode(str, Enum):
     V1 = "v1"
 
 
+class AsyncTransport(str, Enum):
+    AIOHTTP = "aiohttp"
+    HTTPX = "httpx"
+
+
+class UploadCompression(str, Enum):
+    # only for backends decompressing request bodies - `inference` server does not
+    GZIP = "gzip"
+    ZSTD = "zstd"
+
+
 class VisualisationResponseFormat(str, Enum):
     BASE64 = "base64"
     NUMPY = "numpy"
@@ -94,6 +105,9 @@ class InferenceConfiguration:
     active_learning_target_dataset: Optional[str] = None
     max_concurrent_requests: int = 1
     max_batch_size: int = 1
+    upload_compression: Optional[UploadCompression] = None
+    multipart_upload: bool = False
+    clip_text_embeddings_cache_size: int = 0
     source: Optional[str] = None
     source_info: Optional[str] = None
 
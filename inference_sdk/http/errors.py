@@ -75,3 +75,7 @@ class WrongClientModeError(HTTPClientError):
 
 class InvalidParameterError(HTTPClientError):
     pass
+
+
+class InvalidWorkflowResponseError(HTTPClientError):
+    pass
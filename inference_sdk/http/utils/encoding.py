@@ -8,22 +8,36 @@ from PIL import Image, UnidentifiedImageError
 
 from inference_sdk.http.errors import EncodingError
 
+try:
+    import pybase64
+except ImportError:
+    pybase64 = None
+
 
 def numpy_array_to_base64_jpeg(
     image: np.ndarray,
 ) -> Union[str]:
+    return encode_base_64(payload=numpy_array_to_jpeg_bytes(image=image))
+
+
+def numpy_array_to_jpeg_bytes(image: np.ndarray) -> bytes:
     _, img_encoded = cv2.imencode(".jpg", image)
-    image_bytes = np.array(img_encoded).tobytes()
-    return encode_base_64(payload=image_bytes)
+    return img_encoded.tobytes()
 
 
 def pillow_image_to_base64_jpeg(image: Image.Image) -> str:
+    return encode_base_64(payload=pillow_image_to_jpeg_bytes(image=image))
+
+
+def pillow_image_to_jpeg_bytes(image: Image.Image) -> bytes:
     with BytesIO() as buffer:
         image.save(buffer, format="JPEG")
-        return encode_base_64(payload=buffer.getvalue())
+        return buffer.getvalue()
 
 
 def encode_base_64(payload: bytes) -> str:
+    if pybase64 is not None:
+        return pybase64.b64encode_as_string(payload)
     return base64.b64encode(payload).decode("utf-8")
 
 
@@ -1,12 +1,26 @@
 import asyncio
+import gzip
 import logging
+from dataclasses import replace
 from enum import Enum
 from functools import partial
 from multiprocessing.pool import ThreadPool
-from typing import List, Tuple, Union
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import aiohttp
 import backoff
+import numpy as np
+import orjson
 import requests
 from aiohttp import (
     ClientConnectionError,
@@ -15,12 +29,157 @@ from aiohttp import (
     RequestInfo,
 )
 from requests import Response
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2
+except ImportError:
+    h2 = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
+from inference_sdk.http.entities import UploadCompression
+from inference_sdk.http.errors import InvalidParameterError
 from inference_sdk.http.utils.iterables import make_batches
 from inference_sdk.http.utils.request_building import RequestData
 from inference_sdk.http.utils.requests import api_key_safe_raise_for_status
 
 RETRYABLE_STATUS_CODES = {429, 503}
+CONNECTIONS_POOL_SIZE = 128
+DNS_CACHE_TTL = 300
+KEEPALIVE_TIMEOUT = 60
+HTTPX_TIMEOUT = 300
+# servers without request decompression (e.g. `inference` server itself) do not answer
+# with `415`, but fail to parse compressed body as JSON - giving `400` / `422`
+COMPRESSION_REJECTED_STATUS_CODES = {400, 415, 422}
+CONTENT_ENCODING_HEADER = "Content-Encoding"
+GZIP_COMPRESSION_LEVEL = 1
+ZSTD_COMPRESSION_LEVEL = 1
+# smaller bodies are not worth the CPU time spent on compression
+UPLOAD_COMPRESSION_MIN_BODY_SIZE = 16 * 1024
+# `json.dumps(...)` used to accept numpy scalars (e.g. thresholds computed with numpy)
+# and non-`str` dict keys - orjson needs to be told so explicitly
+JSON_SERIALISATION_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+HTTPX_CONNECTION_ERRORS = (httpx.TransportError,) if httpx is not None else ()
+
+AsyncSession = Union[aiohttp.ClientSession, "httpx.AsyncClient"]
+
+
+def build_session(
+    pool_size: int = CONNECTIONS_POOL_SIZE,
+    max_retries: Union[Retry, int] = 0,
+) -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=max_retries,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# shared by all worker threads - keeps connections alive between requests
+SESSION = build_session()
+
+
+def build_async_session(
+    pool_size: int = CONNECTIONS_POOL_SIZE,
+) -> aiohttp.ClientSession:
+    # must be invoked with running event loop - session gets bound to it
+    connector = aiohttp.TCPConnector(
+        limit=pool_size,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+    )
+    return aiohttp.ClientSession(connector=connector, json_serialize=dump_json)
+
+
+def dump_json(value: Any) -> str:
+    return serialise_json(value=value).decode("utf-8")
+
+
+def serialise_json(value: Any) -> bytes:
+    return orjson.dumps(
+        value,
+        default=_serialise_unsupported_value,
+        option=JSON_SERIALISATION_OPTIONS,
+    )
+
+
+def _serialise_unsupported_value(value: Any) -> Any:
+    # orjson falls back here for e.g. non-contiguous arrays or numpy dtypes it does not handle
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def serialise_payload(
+    request_data: RequestData,
+) -> Tuple[Optional[Union[str, bytes]], Optional[Dict[str, str]]]:
+    # JSON payloads are serialised with orjson, instead of leaving that to HTTP library
+    if request_data.data is not None or request_data.payload is None:
+        return request_data.data, request_data.headers
+    headers = {"Content-Type": "application/json"}
+    if request_data.headers is not None:
+        headers.update(request_data.headers)
+    body = serialise_json(value=request_data.payload)
+    if (
+        request_data.content_encoding is not None
+        and len(body) >= UPLOAD_COMPRESSION_MIN_BODY_SIZE
+    ):
+        headers[CONTENT_ENCODING_HEADER] = request_data.content_encoding.value
+        body = compress_body(body=body, content_encoding=request_data.content_encoding)
+    return body, headers
+
+
+def compress_body(body: bytes, content_encoding: UploadCompression) -> bytes:
+    if content_encoding is UploadCompression.GZIP:
+        return gzip.compress(body, compresslevel=GZIP_COMPRESSION_LEVEL)
+    if zstandard is None:
+        raise InvalidParameterError(
+            "`zstd` upload compression requires `zstandard` package to be installed - "
+            "use `pip install zstandard`."
+        )
+    return zstandard.ZstdCompressor(level=ZSTD_COMPRESSION_LEVEL).compress(body)
+
+
+def compression_is_not_supported(
+    status_code: int, headers: Optional[Mapping[str, str]]
+) -> bool:
+    # bodies under the size threshold are sent uncompressed - falling back only makes sense
+    # if `Content-Encoding` was actually sent
+    return (
+        status_code in COMPRESSION_REJECTED_STATUS_CODES
+        and headers is not None
+        and CONTENT_ENCODING_HEADER in headers
+    )
+
+
+def build_httpx_async_client(
+    pool_size: int = CONNECTIONS_POOL_SIZE,
+) -> "httpx.AsyncClient":
+    # HTTP/2 requires `h2` package - installed with `pip install "httpx[http2]"`,
+    # without it connections fall back to HTTP/1.1
+    limits = httpx.Limits(
+        max_connections=pool_size,
+        max_keepalive_connections=pool_size,
+    )
+    return httpx.AsyncClient(
+        http2=h2 is not None,
+        limits=limits,
+        timeout=HTTPX_TIMEOUT,
+    )
 
 
 class RequestMethod(Enum):
@@ -32,6 +191,7 @@ def execute_requests_packages(
     requests_data: List[RequestData],
     request_method: RequestMethod,
     max_concurrent_requests: int,
+    session: Optional[requests.Session] = None,
 ) -> List[Response]:
     requests_data_packages = make_batches(
         iterable=requests_data,
@@ -42,6 +202,7 @@ def execute_requests_packages(
         responses = make_parallel_requests(
             requests_data=requests_data_package,
             request_method=request_method,
+            session=session,
         )
         results.extend(responses)
     for response in results:
@@ -52,9 +213,17 @@ def execute_requests_packages(
 def make_parallel_requests(
     requests_data: List[RequestData],
     request_method: RequestMethod,
+    session: Optional[requests.Session] = None,
 ) -> List[Response]:
     workers = len(requests_data)
-    make_request_closure = partial(make_request, request_method=request_method)
+    make_request_closure = partial(
+        make_request,
+        request_method=request_method,
+        session=session,
+    )
+    if workers == 1:
+        # thread pool is not worth spinning up for a single request
+        return [make_request_closure(requests_data[0])]
     with ThreadPool(processes=workers) as pool:
         return pool.map(
             make_request_closure,
@@ -78,21 +247,36 @@ def make_parallel_requests(
     backoff_log_level=logging.DEBUG,
     giveup_log_level=logging.DEBUG,
 )
-def make_request(request_data: RequestData, request_method: RequestMethod) -> Response:
-    method = requests.get if request_method is RequestMethod.GET else requests.post
-    return method(
+def make_request(
+    request_data: RequestData,
+    request_method: RequestMethod,
+    session: Optional[requests.Session] = None,
+) -> Response:
+    if session is None:
+        session = SESSION
+    method = session.get if request_method is RequestMethod.GET else session.post
+    data, headers = serialise_payload(request_data=request_data)
+    response = method(
         request_data.url,
-        headers=request_data.headers,
+        headers=headers,
         params=request_data.parameters,
-        data=request_data.data,
-        json=request_data.payload,
+        data=data,
     )
+    if compression_is_not_supported(status_code=response.status_code, headers=headers):
+        # server does not accept compressed body - falling back to plain upload
+        return make_request(
+            request_data=replace(request_data, content_encoding=None),
+            request_method=request_method,
+            session=session,
+        )
+    return response
 
 
 async def execute_requests_packages_async(
     requests_data: List[RequestData],
     request_method: RequestMethod,
     max_concurrent_requests: int,
+    session: Optional[AsyncSession] = None,
 ) -> List[Union[dict, bytes]]:
     requests_data_packages = make_batches(
         iterable=requests_data,
@@ -103,6 +287,7 @@ async def execute_requests_packages_async(
         responses = await make_parallel_requests_async(
             requests_data=requests_data_package,
             request_method=request_method,
+            session=session,
         )
         results.extend(responses)
     return results
@@ -111,16 +296,99 @@ async def execute_requests_packages_async(
 async def make_parallel_requests_async(
     requests_data: List[RequestData],
     request_method: RequestMethod,
+    session: Optional[AsyncSession] = None,
 ) -> List[Union[dict, bytes]]:
-    async with aiohttp.ClientSession() as session:
-        make_request_closure = partial(
-            make_request_async,
-            request_method=request_method,
-            session=session,
-        )
-        coroutines = [make_request_closure(data) for data in requests_data]
-        responses = list(await asyncio.gather(*coroutines))
-        return [r[1] for r in responses]
+    if session is None:
+        async with aiohttp.ClientSession(json_serialize=dump_json) as session:
+            return await _make_parallel_requests_with_session(
+                requests_data=requests_data,
+                request_method=request_method,
+                session=session,
+            )
+    return await _make_parallel_requests_with_session(
+        requests_data=requests_data,
+        request_method=request_method,
+        session=session,
+    )
+
+
+async def iterate_requests_packages_async(
+    requests_data: List[RequestData],
+    request_method: RequestMethod,
+    max_concurrent_requests: int,
+    session: Optional[AsyncSession] = None,
+) -> AsyncGenerator[Tuple[int, Union[dict, bytes]], None]:
+    # yields (index of request, response) pairs in order of completion, such that
+    # responses can be processed while the rest of the package is still in flight
+    if session is None:
+        async with aiohttp.ClientSession(json_serialize=dump_json) as session:
+            async for result in iterate_requests_packages_async(
+                requests_data=requests_data,
+                request_method=request_method,
+                max_concurrent_requests=max_concurrent_requests,
+                session=session,
+            ):
+                yield result
+        return
+    make_request_closure = _build_request_closure(
+        request_method=request_method,
+        session=session,
+    )
+    requests_data_packages = make_batches(
+        iterable=list(enumerate(requests_data)),
+        batch_size=max_concurrent_requests,
+    )
+    for requests_data_package in requests_data_packages:
+        tasks = [
+            asyncio.ensure_future(
+                _make_indexed_request(
+                    index=index, request=make_request_closure(request_data)
+                )
+            )
+            for index, request_data in requests_data_package
+        ]
+        try:
+            for task in asyncio.as_completed(tasks):
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+async def _make_indexed_request(
+    index: int,
+    request: Awaitable[Tuple[int, Union[dict, bytes]]],
+) -> Tuple[int, Union[dict, bytes]]:
+    _, response = await request
+    return index, response
+
+
+def _build_request_closure(
+    request_method: RequestMethod,
+    session: AsyncSession,
+) -> partial:
+    request_function = make_request_async
+    if httpx is not None and isinstance(session, httpx.AsyncClient):
+        request_function = make_request_httpx_async
+    return partial(
+        request_function,
+        request_method=request_method,
+        session=session,
+    )
+
+
+async def _make_parallel_requests_with_session(
+    requests_data: List[RequestData],
+    request_method: RequestMethod,
+    session: AsyncSession,
+) -> List[Union[dict, bytes]]:
+    make_request_closure = _build_request_closure(
+        request_method=request_method,
+        session=session,
+    )
+    coroutines = [make_request_closure(data) for data in requests_data]
+    responses = list(await asyncio.gather(*coroutines))
+    return [r[1] for r in responses]
 
 
 def raise_client_error(details: dict) -> None:
@@ -160,31 +428,102 @@ async def make_request_async(
     session: aiohttp.ClientSession,
 ) -> Tuple[int, Union[bytes, dict]]:
     method = session.get if request_method is RequestMethod.GET else session.post
-    parameters_serialised = None
-    if request_data.parameters is not None:
-        parameters_serialised = {
-            name: (
-                str(value)
-                if not issubclass(type(value), list)
-                else [str(e) for e in value]
-            )
-            for name, value in request_data.parameters.items()
-        }
+    parameters_serialised = serialise_parameters(parameters=request_data.parameters)
+    headers, data, payload = (
+        request_data.headers,
+        request_data.data,
+        request_data.payload,
+    )
+    if request_data.content_encoding is not None:
+        data, headers = serialise_payload(request_data=request_data)
+        payload = None
     async with method(
         request_data.url,
-        headers=request_data.headers,
+        headers=headers,
         params=parameters_serialised,
-        data=request_data.data,
-        json=request_data.payload,
+        data=data,
+        json=payload,
     ) as response:
+        if compression_is_not_supported(status_code=response.status, headers=headers):
+            # server does not accept compressed body - falling back to plain upload
+            return await make_request_async(
+                request_data=replace(request_data, content_encoding=None),
+                request_method=request_method,
+                session=session,
+            )
+        # body is parsed straight from bytes, skipping aiohttp's decoding to `str`
+        response_data = await response.read()
         try:
-            response_data = await response.json()
-        except:
-            response_data = await response.read()
+            response_data = orjson.loads(response_data)
+        except orjson.JSONDecodeError:
+            pass
         if response_is_not_retryable_error(response=response):
             response.raise_for_status()
         return response.status, response_data
 
 
+def serialise_parameters(
+    parameters: Optional[Dict[str, Any]]
+) -> Optional[Dict[str, Union[str, List[str]]]]:
+    if parameters is None:
+        return None
+    return {
+        name: (
+            str(value) if not issubclass(type(value), list) else [str(e) for e in value]
+        )
+        for name, value in parameters.items()
+    }
+
+
 def response_is_not_retryable_error(response: ClientResponse) -> bool:
     return response.status != 200 and response.status not in RETRYABLE_STATUS_CODES
+
+
+@backoff.on_predicate(
+    backoff.constant,
+    predicate=lambda r: r[0] in RETRYABLE_STATUS_CODES,
+    max_tries=3,
+    interval=1,
+    on_giveup=raise_client_error,
+    backoff_log_level=logging.DEBUG,
+    giveup_log_level=logging.DEBUG,
+)
+@backoff.on_exception(
+    backoff.constant,
+    exception=HTTPX_CONNECTION_ERRORS,
+    max_tries=3,
+    interval=1,
+    backoff_log_level=logging.DEBUG,
+    giveup_log_level=logging.DEBUG,
+)
+async def make_request_httpx_async(
+    request_data: RequestData,
+    request_method: RequestMethod,
+    session: "httpx.AsyncClient",
+) -> Tuple[int, Union[bytes, dict]]:
+    data, headers = serialise_payload(request_data=request_data)
+    response = await session.request(
+        request_method.value.upper(),
+        request_data.url,
+        headers=headers,
+        # httpx would encode booleans as "true" / "false" - requests and aiohttp use `str(...)`
+        params=serialise_parameters(parameters=request_data.parameters),
+        content=data,
+    )
+    if compression_is_not_supported(status_code=response.status_code, headers=headers):
+        # server does not accept compressed body - falling back to plain upload
+        return await make_request_httpx_async(
+            request_data=replace(request_data, content_encoding=None),
+            request_method=request_method,
+            session=session,
+        )
+    try:
+        response_data = orjson.loads(response.content)
+    except orjson.JSONDecodeError:
+        response_data = response.content
+    if (
+        response.status_code != 200
+        and response.status_code not in RETRYABLE_STATUS_CODES
+    ):
+        response.raise_for_status()
+    return response.status_code, response_data
@@ -25,3 +25,22 @@ def make_batches(
             batch = []
     if len(batch) > 0:
         yield batch
+
+
+def make_batches_within_characters_limit(
+    texts: Iterable[str], batch_size: int, max_batch_characters: int
+) -> Generator[List[str], None, None]:
+    # text longer than the limit is sent alone - it is up to server to reject it
+    batch_size = max(batch_size, 1)
+    batch, batch_characters = [], 0
+    for text in texts:
+        if len(batch) > 0 and batch_characters + len(text) > max_batch_characters:
+            yield batch
+            batch, batch_characters = [], 0
+        batch.append(text)
+        batch_characters += len(text)
+        if len(batch) >= batch_size:
+            yield batch
+            batch, batch_characters = [], 0
+    if len(batch) > 0:
+        yield batch
@@ -1,6 +1,9 @@
+import asyncio
 import base64
+import itertools
 import os
-from typing import Generator, List, Optional, Tuple, Union
+from functools import partial
+from typing import Callable, Generator, List, Optional, Tuple, TypeVar, Union
 
 import aiohttp
 import cv2
@@ -14,14 +17,21 @@ from inference_sdk.http.errors import EncodingError, InvalidInputFormatError
 from inference_sdk.http.utils.encoding import (
     bytes_to_opencv_image,
     encode_base_64,
-    numpy_array_to_base64_jpeg,
-    pillow_image_to_base64_jpeg,
+    numpy_array_to_jpeg_bytes,
+    pillow_image_to_jpeg_bytes,
 )
 from inference_sdk.http.utils.pre_processing import (
     resize_opencv_image,
     resize_pillow_image,
 )
 
+T = TypeVar("T")
+# base64 string by default, raw bytes when loaded with `encode_base64=False`
+SerialisedImage = Union[str, bytes]
+
+# bounds in-flight downloads and decoded images kept in memory when loading large lists
+MAX_CONCURRENT_IMAGES_LOADING = 16
+
 
 def load_stream_inference_input(
     input_uri: str,
@@ -50,7 +60,10 @@ def load_static_inference_input(
     inference_input: Union[ImagesReference, List[ImagesReference]],
     max_height: Optional[int] = None,
     max_width: Optional[int] = None,
-) -> List[Tuple[str, Optional[float]]]:
+    session: Optional[requests.Session] = None,
+    encode_base64: bool = True,
+) -> List[Tuple[SerialisedImage, Optional[float]]]:
+    # `encode_base64=False` gives raw JPEG bytes - for uploads that send binary body anyway
     if issubclass(type(inference_input), list):
         results = []
         for element in inference_input:
@@ -59,13 +72,19 @@ def load_static_inference_input(
                     inference_input=element,
                     max_height=max_height,
                     max_width=max_width,
+                    session=session,
+                    encode_base64=encode_base64,
                 )
             )
         return results
     if issubclass(type(inference_input), str):
         return [
             load_image_from_string(
-                reference=inference_input, max_height=max_height, max_width=max_width
+                reference=inference_input,
+                max_height=max_height,
+                max_width=max_width,
+                session=session,
+                encode_base64=encode_base64,
             )
         ]
     if issubclass(type(inference_input), np.ndarray):
@@ -74,14 +93,30 @@ def load_static_inference_input(
             max_height=max_height,
             max_width=max_width,
         )
-        return [(numpy_array_to_base64_jpeg(image=image), scaling_factor)]
+        return [
+            (
+                serialise_raw_image(
+                    payload=numpy_array_to_jpeg_bytes(image=image),
+                    encode_base64=encode_base64,
+                ),
+                scaling_factor,
+            )
+        ]
     if issubclass(type(inference_input), Image.Image):
         image, scaling_factor = resize_pillow_image(
             image=inference_input,
             max_height=max_height,
             max_width=max_width,
         )
-        return [(pillow_image_to_base64_jpeg(image=image), scaling_factor)]
+        return [
+            (
+                serialise_raw_image(
+                    payload=pillow_image_to_jpeg_bytes(image=image),
+                    encode_base64=encode_base64,
+                ),
+                scaling_factor,
+            )
+        ]
     raise InvalidInputFormatError(
         f"Unknown type of input ({inference_input.__class__.__name__}) submitted."
     )
@@ -91,40 +126,58 @@ async def load_static_inference_input_async(
     inference_input: Union[ImagesReference, List[ImagesReference]],
     max_height: Optional[int] = None,
     max_width: Optional[int] = None,
-) -> List[Tuple[str, Optional[float]]]:
+    session: Optional[aiohttp.ClientSession] = None,
+    encode_base64: bool = True,
+) -> List[Tuple[SerialisedImage, Optional[float]]]:
     if issubclass(type(inference_input), list):
-        results = []
-        for element in inference_input:
-            results.extend(
-                await load_static_inference_input_async(
+        if session is None and any(
+            issubclass(type(element), str) and uri_is_http_link(uri=element)
+            for element in inference_input
+        ):
+            # one session (and its connections pool) is shared by all downloads
+            async with aiohttp.ClientSession() as shared_session:
+                return await load_static_inference_input_async(
+                    inference_input=inference_input,
+                    max_height=max_height,
+                    max_width=max_width,
+                    session=shared_session,
+                    encode_base64=encode_base64,
+                )
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_IMAGES_LOADING)
+
+        async def load_element(
+            element: ImagesReference,
+        ) -> List[Tuple[SerialisedImage, Optional[float]]]:
+            async with semaphore:
+                return await load_static_inference_input_async(
                     inference_input=element,
                     max_height=max_height,
                     max_width=max_width,
+                    session=session,
+                    encode_base64=encode_base64,
                 )
-            )
-        return results
+
+        results = await asyncio.gather(
+            *[load_element(element=element) for element in inference_input]
+        )
+        return list(itertools.chain.from_iterable(results))
     if issubclass(type(inference_input), str):
         return [
             await load_image_from_string_async(
-                reference=inference_input, max_height=max_height, max_width=max_width
+                reference=inference_input,
+                max_height=max_height,
+                max_width=max_width,
+                session=session,
+                encode_base64=encode_base64,
             )
         ]
-    if issubclass(type(inference_input), np.ndarray):
-        image, scaling_factor = resize_opencv_image(
-            image=inference_input,
-            max_height=max_height,
-            max_width=max_width,
-        )
-        return [(numpy_array_to_base64_jpeg(image=image), scaling_factor)]
-    if issubclass(type(inference_input), Image.Image):
-        image, scaling_factor = resize_pillow_image(
-            image=inference_input,
-            max_height=max_height,
-            max_width=max_width,
-        )
-        return [(pillow_image_to_base64_jpeg(image=image), scaling_factor)]
-    raise InvalidInputFormatError(
-        f"Unknown type of input ({inference_input.__class__.__name__}) submitted."
+    # resizing and JPEG / base64 encoding is CPU-bound - must not block event loop
+    return await run_in_executor(
+        load_static_inference_input,
+        inference_input=inference_input,
+        max_height=max_height,
+        max_width=max_width,
+        encode_base64=encode_base64,
     )
 
 
@@ -132,10 +185,16 @@ def load_image_from_string(
     reference: str,
     max_height: Optional[int] = None,
     max_width: Optional[int] = None,
-) -> Tuple[str, Optional[float]]:
+    session: Optional[requests.Session] = None,
+    encode_base64: bool = True,
+) -> Tuple[SerialisedImage, Optional[float]]:
     if uri_is_http_link(uri=reference):
         return load_image_from_url(
-            url=reference, max_height=max_height, max_width=max_width
+            url=reference,
+            max_height=max_height,
+            max_width=max_width,
+            session=session,
+            encode_base64=encode_base64,
         )
     if os.path.exists(reference):
         local_image = cv2.imread(reference)
@@ -146,7 +205,13 @@ def load_image_from_string(
             max_height=max_height,
             max_width=max_width,
         )
-        return numpy_array_to_base64_jpeg(image=local_image), scaling_factor
+        return (
+            serialise_raw_image(
+                payload=numpy_array_to_jpeg_bytes(image=local_image),
+                encode_base64=encode_base64,
+            ),
+            scaling_factor,
+        )
     if max_height is not None and max_width is not None:
         image_bytes = base64.b64decode(reference)
         image = bytes_to_opencv_image(payload=image_bytes)
@@ -155,7 +220,15 @@ def load_image_from_string(
             max_height=max_height,
             max_width=max_width,
         )
-        return numpy_array_to_base64_jpeg(image=image), scaling_factor
+        return (
+            serialise_raw_image(
+                payload=numpy_array_to_jpeg_bytes(image=image),
+                encode_base64=encode_base64,
+            ),
+            scaling_factor,
+        )
+    if not encode_base64:
+        return base64.b64decode(reference), None
     return reference, None
 
 
@@ -163,72 +236,102 @@ async def load_image_from_string_async(
     reference: str,
     max_height: Optional[int] = None,
     max_width: Optional[int] = None,
-) -> Tuple[str, Optional[float]]:
+    session: Optional[aiohttp.ClientSession] = None,
+    encode_base64: bool = True,
+) -> Tuple[SerialisedImage, Optional[float]]:
     if uri_is_http_link(uri=reference):
         return await load_image_from_url_async(
-            url=reference, max_height=max_height, max_width=max_width
-        )
-    if os.path.exists(reference):
-        local_image = cv2.imread(reference)
-        if local_image is None:
-            raise EncodingError(f"Could not load image from {reference}")
-        local_image, scaling_factor = resize_opencv_image(
-            image=local_image,
+            url=reference,
             max_height=max_height,
             max_width=max_width,
+            session=session,
+            encode_base64=encode_base64,
         )
-        return numpy_array_to_base64_jpeg(image=local_image), scaling_factor
-    if max_height is not None and max_width is not None:
-        image_bytes = base64.b64decode(reference)
-        image = bytes_to_opencv_image(payload=image_bytes)
-        image, scaling_factor = resize_opencv_image(
-            image=image,
-            max_height=max_height,
-            max_width=max_width,
-        )
-        return numpy_array_to_base64_jpeg(image=image), scaling_factor
-    return reference, None
+    return await run_in_executor(
+        load_image_from_string,
+        reference=reference,
+        max_height=max_height,
+        max_width=max_width,
+        encode_base64=encode_base64,
+    )
 
 
 def load_image_from_url(
     url: str,
     max_height: Optional[int] = None,
     max_width: Optional[int] = None,
-) -> Tuple[str, Optional[float]]:
-    response = requests.get(url)
+    session: Optional[requests.Session] = None,
+    encode_base64: bool = True,
+) -> Tuple[SerialisedImage, Optional[float]]:
+    get = requests.get if session is None else session.get
+    response = get(url)
     response.raise_for_status()
-    if max_height is None or max_width is None:
-        return encode_base_64(response.content), None
-    image = bytes_to_opencv_image(payload=response.content)
-    resized_image, scaling_factor = resize_opencv_image(
-        image=image,
+    return serialise_image_bytes(
+        payload=response.content,
         max_height=max_height,
         max_width=max_width,
+        encode_base64=encode_base64,
     )
-    serialised_image = numpy_array_to_base64_jpeg(image=resized_image)
-    return serialised_image, scaling_factor
 
 
 async def load_image_from_url_async(
     url: str,
     max_height: Optional[int] = None,
     max_width: Optional[int] = None,
-) -> Tuple[str, Optional[float]]:
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url) as response:
-            response.raise_for_status()
-            response_payload = await response.read()
+    session: Optional[aiohttp.ClientSession] = None,
+    encode_base64: bool = True,
+) -> Tuple[SerialisedImage, Optional[float]]:
+    if session is None:
+        async with aiohttp.ClientSession() as session:
+            response_payload = await download_image_async(url=url, session=session)
+    else:
+        response_payload = await download_image_async(url=url, session=session)
+    return await run_in_executor(
+        serialise_image_bytes,
+        payload=response_payload,
+        max_height=max_height,
+        max_width=max_width,
+        encode_base64=encode_base64,
+    )
+
+
+async def download_image_async(url: str, session: aiohttp.ClientSession) -> bytes:
+    async with session.get(url) as response:
+        response.raise_for_status()
+        return await response.read()
+
+
+def serialise_image_bytes(
+    payload: bytes,
+    max_height: Optional[int] = None,
+    max_width: Optional[int] = None,
+    encode_base64: bool = True,
+) -> Tuple[SerialisedImage, Optional[float]]:
     if max_height is None or max_width is None:
-        return encode_base_64(response_payload), None
-    image = bytes_to_opencv_image(payload=response_payload)
+        return serialise_raw_image(payload=payload, encode_base64=encode_base64), None
+    image = bytes_to_opencv_image(payload=payload)
     resized_image, scaling_factor = resize_opencv_image(
         image=image,
         max_height=max_height,
         max_width=max_width,
     )
-    serialised_image = numpy_array_to_base64_jpeg(image=resized_image)
+    serialised_image = serialise_raw_image(
+        payload=numpy_array_to_jpeg_bytes(image=resized_image),
+        encode_base64=encode_base64,
+    )
     return serialised_image, scaling_factor
 
 
+def serialise_raw_image(payload: bytes, encode_base64: bool) -> SerialisedImage:
+    if not encode_base64:
+        return payload
+    return encode_base_64(payload)
+
+
+async def run_in_executor(function: Callable[..., T], **kwargs) -> T:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, partial(function, **kwargs))
+
+
 def uri_is_http_link(uri: str) -> bool:
     return uri.startswith("http://") or uri.startswith("https://")
@@ -1,6 +1,6 @@
 import base64
 import itertools
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Collection, Dict, Iterable, List, Optional, Tuple, Union
 
 import numpy as np
 from PIL import Image
@@ -24,49 +24,61 @@ IMAGES_TRANSCODING_METHODS = {
 def decode_workflow_outputs(
     workflow_outputs: Dict[str, Any],
     expected_format: VisualisationResponseFormat,
+    decode_fields: Optional[Collection[str]] = None,
 ) -> Dict[str, Any]:
+    return decode_workflow_outputs_items(
+        workflow_outputs_items=workflow_outputs.items(),
+        expected_format=expected_format,
+        decode_fields=decode_fields,
+    )
+
+
+def decode_workflow_outputs_items(
+    workflow_outputs_items: Iterable[Tuple[str, Any]],
+    expected_format: VisualisationResponseFormat,
+    decode_fields: Optional[Collection[str]] = None,
+) -> Dict[str, Any]:
+    # accepts lazily produced (key, value) pairs - e.g. from streaming JSON parser,
+    # if `decode_fields` are given - only those outputs are decoded, other are left raw
     result = {}
-    for key, value in workflow_outputs.items():
-        if is_workflow_image(value=value):
-            value = decode_workflow_output_image(
-                value=value,
-                expected_format=expected_format,
-            )
-        elif issubclass(type(value), dict):
-            value = decode_workflow_outputs(
-                workflow_outputs=value, expected_format=expected_format
-            )
-        elif issubclass(type(value), list):
-            value = decode_workflow_output_list(
-                elements=value,
-                expected_format=expected_format,
+    for key, value in workflow_outputs_items:
+        if decode_fields is None or key in decode_fields:
+            value = decode_workflow_output_value(
+                value=value, expected_format=expected_format
             )
         result[key] = value
     return result
 
 
+def decode_workflow_output_value(
+    value: Any,
+    expected_format: VisualisationResponseFormat,
+) -> Any:
+    if is_workflow_image(value=value):
+        return decode_workflow_output_image(
+            value=value,
+            expected_format=expected_format,
+        )
+    if issubclass(type(value), dict):
+        return decode_workflow_outputs(
+            workflow_outputs=value, expected_format=expected_format
+        )
+    if issubclass(type(value), list):
+        return decode_workflow_output_list(
+            elements=value,
+            expected_format=expected_format,
+        )
+    return value
+
+
 def decode_workflow_output_list(
     elements: List[Any],
     expected_format: VisualisationResponseFormat,
 ) -> List[Any]:
-    result = []
-    for element in elements:
-        if is_workflow_image(value=element):
-            element = decode_workflow_output_image(
-                value=element,
-                expected_format=expected_format,
-            )
-        elif issubclass(type(element), dict):
-            element = decode_workflow_outputs(
-                workflow_outputs=element, expected_format=expected_format
-            )
-        elif issubclass(type(element), list):
-            element = decode_workflow_output_list(
-                elements=element,
-                expected_format=expected_format,
-            )
-        result.append(element)
-    return result
+    return [
+        decode_workflow_output_value(value=element, expected_format=expected_format)
+        for element in elements
+    ]
 
 
 def is_workflow_image(value: Any) -> bool:
@@ -175,14 +187,13 @@ def adjust_object_detection_predictions_to_client_scaling_factor(
     predictions: List[dict],
     scaling_factor: float,
 ) -> List[dict]:
-    result = []
+    # in-place update - avoids allocation of new list
     for prediction in predictions:
-        prediction = adjust_bbox_coordinates_to_client_scaling_factor(
+        adjust_bbox_coordinates_to_client_scaling_factor(
             bbox=prediction,
             scaling_factor=scaling_factor,
         )
-        result.append(prediction)
-    return result
+    return predictions
 
 
 def adjust_prediction_with_bbox_and_points_to_client_scaling_factor(
@@ -190,28 +201,26 @@ def adjust_prediction_with_bbox_and_points_to_client_scaling_factor(
     scaling_factor: float,
     points_key: str,
 ) -> List[dict]:
-    result = []
     for prediction in predictions:
-        prediction = adjust_bbox_coordinates_to_client_scaling_factor(
+        adjust_bbox_coordinates_to_client_scaling_factor(
             bbox=prediction,
             scaling_factor=scaling_factor,
         )
-        prediction[points_key] = adjust_points_coordinates_to_client_scaling_factor(
+        adjust_points_coordinates_to_client_scaling_factor(
             points=prediction[points_key],
             scaling_factor=scaling_factor,
         )
-        result.append(prediction)
-    return result
+    return predictions
 
 
 def adjust_bbox_coordinates_to_client_scaling_factor(
     bbox: dict,
     scaling_factor: float,
 ) -> dict:
-    bbox["x"] = bbox["x"] / scaling_factor
-    bbox["y"] = bbox["y"] / scaling_factor
-    bbox["width"] = bbox["width"] / scaling_factor
-    bbox["height"] = bbox["height"] / scaling_factor
+    bbox["x"] /= scaling_factor
+    bbox["y"] /= scaling_factor
+    bbox["width"] /= scaling_factor
+    bbox["height"] /= scaling_factor
     return bbox
 
 
@@ -219,12 +228,10 @@ def adjust_points_coordinates_to_client_scaling_factor(
     points: List[dict],
     scaling_factor: float,
 ) -> List[dict]:
-    result = []
     for point in points:
-        point["x"] = point["x"] / scaling_factor
-        point["y"] = point["y"] / scaling_factor
-        result.append(point)
-    return result
+        point["x"] /= scaling_factor
+        point["y"] /= scaling_factor
+    return points
 
 
 def combine_gaze_detections(
@@ -258,7 +265,5 @@ def filter_model_descriptions(
     descriptions: List[ModelDescription],
     model_id: str,
 ) -> Optional[ModelDescription]:
-    matching_models = [d for d in descriptions if d.model_id == model_id]
-    if len(matching_models) > 0:
-        return matching_models[0]
-    return None
+    # stops at first match, instead of scanning all registered models
+    return next((d for d in descriptions if d.model_id == model_id), None)
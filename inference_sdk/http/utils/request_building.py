@@ -1,8 +1,11 @@
-from copy import deepcopy
+import base64
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
 
+from urllib3.filepost import encode_multipart_formdata
+
+from inference_sdk.http.entities import UploadCompression
 from inference_sdk.http.utils.iterables import make_batches
 from inference_sdk.http.utils.requests import inject_images_into_payload
 
@@ -10,69 +13,88 @@ from inference_sdk.http.utils.requests import inject_images_into_payload
 class ImagePlacement(Enum):
     DATA = "data"
     JSON = "json"
+    MULTIPART = "multipart"
+
+
+SINGLE_IMAGE_PLACEMENTS = {ImagePlacement.DATA, ImagePlacement.MULTIPART}
+MULTIPART_IMAGE_FIELD = "file"
+MULTIPART_IMAGE_FILE_NAME = "image.jpg"
 
 
 @dataclass(frozen=True)
 class RequestData:
     url: str
     request_elements: int
-    headers: Optional[Dict[str, str]]
+    headers: Optional[Mapping[str, str]]
     parameters: Optional[Dict[str, Union[str, List[str]]]]
     data: Optional[Union[str, bytes]]
     payload: Optional[Dict[str, Any]]
     image_scaling_factors: List[Optional[float]]
+    content_encoding: Optional[UploadCompression] = None
 
 
 def prepare_requests_data(
     url: str,
-    encoded_inference_inputs: List[Tuple[str, Optional[float]]],
-    headers: Optional[Dict[str, str]],
+    encoded_inference_inputs: List[Tuple[Union[str, bytes], Optional[float]]],
+    headers: Optional[Mapping[str, str]],
     parameters: Optional[Dict[str, Union[str, List[str]]]],
     payload: Optional[Dict[str, Any]],
     max_batch_size: int,
     image_placement: ImagePlacement,
+    content_encoding: Optional[UploadCompression] = None,
 ) -> List[RequestData]:
-    batches = list(
-        make_batches(
-            iterable=encoded_inference_inputs,
-            batch_size=max_batch_size,
-        )
-    )
-    requests_data = []
-    for batch_inference_inputs in batches:
-        request_data = assembly_request_data(
+    return [
+        assembly_request_data(
             url=url,
             batch_inference_inputs=batch_inference_inputs,
             headers=headers,
             parameters=parameters,
             payload=payload,
             image_placement=image_placement,
+            content_encoding=content_encoding,
+        )
+        for batch_inference_inputs in make_batches(
+            iterable=encoded_inference_inputs,
+            batch_size=max_batch_size,
         )
-        requests_data.append(request_data)
-    return requests_data
+    ]
 
 
 def assembly_request_data(
     url: str,
-    batch_inference_inputs: List[Tuple[str, Optional[float]]],
-    headers: Optional[Dict[str, str]],
+    batch_inference_inputs: List[Tuple[Union[str, bytes], Optional[float]]],
+    headers: Optional[Mapping[str, str]],
     parameters: Optional[Dict[str, Union[str, List[str]]]],
     payload: Optional[Dict[str, Any]],
     image_placement: ImagePlacement,
+    content_encoding: Optional[UploadCompression] = None,
 ) -> RequestData:
     data = None
-    if image_placement is ImagePlacement.DATA and len(batch_inference_inputs) != 1:
-        raise ValueError("Only single image can be placed in request `data`")
+    if image_placement in SINGLE_IMAGE_PLACEMENTS and len(batch_inference_inputs) != 1:
+        raise ValueError(
+            f"Only single image can be placed in request with {image_placement}"
+        )
     if image_placement is ImagePlacement.JSON and payload is None:
         payload = {}
     if image_placement is ImagePlacement.JSON:
-        payload = deepcopy(payload)
+        # only top-level `image` key is injected - shallow copy is enough to keep
+        # constant part of the payload shared between batches
+        payload = dict(payload)
         payload = inject_images_into_payload(
             payload=payload,
             encoded_images=batch_inference_inputs,
         )
     elif image_placement is ImagePlacement.DATA:
         data = batch_inference_inputs[0][0]
+    elif image_placement is ImagePlacement.MULTIPART:
+        image = batch_inference_inputs[0][0]
+        if issubclass(type(image), str):
+            # images loaded with `encode_base64=False` are raw bytes already
+            image = base64.b64decode(image)
+        data, content_type = encode_multipart_formdata(
+            fields={MULTIPART_IMAGE_FIELD: (MULTIPART_IMAGE_FILE_NAME, image)}
+        )
+        headers = {**(headers or {}), "Content-Type": content_type}
     else:
         raise NotImplemented(
             f"Not implemented request building method for {image_placement}"
@@ -86,4 +108,5 @@ def assembly_request_data(
         data=data,
         payload=payload,
         image_scaling_factors=scaling_factors,
+        content_encoding=content_encoding,
     )
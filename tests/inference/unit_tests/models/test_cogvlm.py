@@ -0,0 +1,611 @@
+import threading
+from types import SimpleNamespace
+from typing import List
+from unittest import mock
+
+import numpy as np
+import pytest
+
+# CogVLM dependencies (`requirements.cogvlm.txt`) are not installed for CPU unit tests
+torch = pytest.importorskip("torch")
+pytest.importorskip("transformers")
+pytest.importorskip("xxhash")
+
+from torch._dynamo.testing import CompileCounter  # noqa: E402
+
+from inference.models.cogvlm import cogvlm  # noqa: E402
+from inference.models.cogvlm.cogvlm import CogVLM  # noqa: E402
+
+
+class StubDecoderLayer(torch.nn.Module):
+    def __init__(self, hidden_size: int = 8):
+        super().__init__()
+        self.linear = torch.nn.Linear(hidden_size, hidden_size)
+
+    def forward(self, hidden_states: torch.Tensor) -> torch.Tensor:
+        return torch.relu(self.linear(hidden_states)) + hidden_states
+
+
+class StubExpertDecoderLayer(torch.nn.Module):
+    # mirrors CogVLM vision-expert routing - boolean mask gives data-dependent shapes
+    def __init__(self, hidden_size: int = 8):
+        super().__init__()
+        self.language_linear = torch.nn.Linear(hidden_size, hidden_size)
+        self.vision_linear = torch.nn.Linear(hidden_size, hidden_size)
+
+    def forward(
+        self, hidden_states: torch.Tensor, token_type_ids: torch.Tensor
+    ) -> torch.Tensor:
+        vision_mask = token_type_ids == 1
+        output = torch.empty_like(hidden_states)
+        output[vision_mask] = self.vision_linear(hidden_states[vision_mask])
+        output[~vision_mask] = self.language_linear(hidden_states[~vision_mask])
+        return output
+
+
+class StubLanguageModel:
+    def __init__(self, tokens: List[int], vocabulary_size: int = 8):
+        self.tokens = tokens
+        self.vocabulary_size = vocabulary_size
+        self.calls = 0
+        self.generation_config = SimpleNamespace(
+            eos_token_id=2, max_length=64, use_cache=True
+        )
+
+    def prepare_inputs_for_generation(self, input_ids: torch.Tensor, **kwargs) -> dict:
+        return {"input_ids": input_ids, **kwargs}
+
+    def __call__(self, **kwargs) -> SimpleNamespace:
+        logits = torch.zeros((1, kwargs["input_ids"].shape[1], self.vocabulary_size))
+        logits[0, -1, self.tokens[self.calls % len(self.tokens)]] = 1.0
+        self.calls += 1
+        return SimpleNamespace(logits=logits)
+
+    def _update_model_kwargs_for_generation(
+        self, outputs: SimpleNamespace, model_kwargs: dict
+    ) -> dict:
+        return model_kwargs
+
+
+def build_stub_greedy_inputs(prompt_length: int = 4) -> dict:
+    return {
+        "input_ids": torch.ones((1, prompt_length), dtype=torch.long),
+        "token_type_ids": torch.zeros((1, prompt_length), dtype=torch.long),
+        "attention_mask": torch.ones((1, prompt_length), dtype=torch.long),
+        "images": [[torch.zeros(3, 4, 4)]],
+    }
+
+
+def build_stub_cogvlm(
+    layers_number: int = 2, layer_class: type = StubDecoderLayer
+) -> CogVLM:
+    # bypassing `__init__(...)` - it downloads weights and requires GPU
+    model = CogVLM.__new__(CogVLM)
+    model.device = torch.device("cpu")
+    model.model = SimpleNamespace(
+        model=SimpleNamespace(
+            layers=torch.nn.ModuleList([layer_class() for _ in range(layers_number)])
+        )
+    )
+    return model
+
+
+@mock.patch.object(cogvlm, "COGVLM_TORCH_COMPILE_DYNAMIC", True)
+def test_compile_decoder_layers_when_prompt_length_changes() -> None:
+    # given
+    torch._dynamo.reset()
+    counter = CompileCounter()
+    original_compile = torch.compile
+    model = build_stub_cogvlm()
+    with mock.patch.object(
+        cogvlm.torch,
+        "compile",
+        side_effect=lambda module, **kwargs: original_compile(
+            module, backend=counter, **kwargs
+        ),
+    ) as compile_mock:
+        model._compile_decoder_layers()
+
+    def run_layers(sequence_length: int) -> None:
+        hidden_states = torch.rand(1, sequence_length, 8)
+        for layer in model.model.model.layers:
+            hidden_states = layer(hidden_states)
+
+    # when
+    run_layers(sequence_length=5)
+    frames_after_first_prompt = counter.frame_count
+    run_layers(sequence_length=9)
+
+    # then
+    assert (
+        compile_mock.call_count == 2
+    ), "Expected each decoder layer to be compiled separately"
+    assert all(
+        "mode" not in call.kwargs for call in compile_mock.call_args_list
+    ), "Expected default compilation mode, as CUDA graphs do not fit growing KV-cache"
+    assert frames_after_first_prompt > 0, "Expected layers to be compiled on first run"
+    assert (
+        counter.frame_count == frames_after_first_prompt
+    ), "Expected no re-compilation when prompt length changes"
+
+
+def test_compile_decoder_layers_when_layers_use_token_type_masks() -> None:
+    # given
+    torch._dynamo.reset()
+    counter = CompileCounter()
+    original_compile = torch.compile
+    model = build_stub_cogvlm(layer_class=StubExpertDecoderLayer)
+    with mock.patch.object(
+        cogvlm.torch,
+        "compile",
+        side_effect=lambda module, **kwargs: original_compile(
+            module, backend=counter, **kwargs
+        ),
+    ) as compile_mock:
+        model._compile_decoder_layers()
+    hidden_states = torch.rand(1, 6, 8)
+    token_type_ids = torch.tensor([[0, 1, 1, 1, 0, 0]])
+
+    # when
+    for layer in model.model.model.layers:
+        hidden_states = layer(hidden_states, token_type_ids)
+
+    # then
+    assert all(
+        call.kwargs["fullgraph"] is False for call in compile_mock.call_args_list
+    ), "Expected graph breaks to be allowed"
+    assert hidden_states.shape == (1, 6, 8)
+    assert counter.frame_count > 0, "Expected layers to be compiled around graph breaks"
+
+
+def build_stub_image_preprocessing(model: CogVLM, image_size: int = 4) -> None:
+    model._image_size = image_size
+    model._layout_image = cogvlm.Image.new("RGB", (image_size, image_size))
+    model._image_mean = torch.tensor(cogvlm.IMAGE_MEAN).view(1, 3, 1, 1)
+    model._image_std = torch.tensor(cogvlm.IMAGE_STD).view(1, 3, 1, 1)
+
+
+def test_build_inputs_should_use_remote_code_token_layout() -> None:
+    # given
+    model = build_stub_cogvlm()
+    build_stub_image_preprocessing(model=model)
+    model._copy_stream = None
+    model._pinned_tokens_buffer = None
+    model.tokenizer = mock.MagicMock()
+    built_inputs = {
+        "input_ids": torch.tensor([1, 0, 0, 5, 6]),
+        "token_type_ids": torch.tensor([0, 1, 1, 0, 0]),
+        "attention_mask": torch.ones(5, dtype=torch.long),
+        "images": [torch.rand(3, 4, 4)],
+    }
+    model.model.build_conversation_input_ids = mock.MagicMock(return_value=built_inputs)
+    image = np.zeros((6, 8, 3), dtype=np.uint8)
+
+    # when
+    result = model._build_inputs(image=image, prompt="What is that?", history=[])
+
+    # then
+    call_kwargs = model.model.build_conversation_input_ids.call_args.kwargs
+    assert call_kwargs["query"] == "What is that?"
+    assert call_kwargs["images"] == [
+        model._layout_image
+    ], "Expected request image not to be converted to PIL"
+    assert torch.equal(result["input_ids"], built_inputs["input_ids"][None])
+    assert torch.equal(result["token_type_ids"], built_inputs["token_type_ids"][None])
+    assert torch.equal(result["attention_mask"], built_inputs["attention_mask"][None])
+    assert result["images"][0][0].shape == (3, 4, 4)
+
+
+def test_transfer_tokens_should_wait_for_previous_copies_before_reusing_buffer() -> (
+    None
+):
+    # given
+    model = build_stub_cogvlm()
+    model._pinned_tokens_buffer = torch.zeros((3, 8), dtype=torch.long)
+    model._pinned_tokens_buffer_event = mock.MagicMock()
+    events = []
+    model._pinned_tokens_buffer_event.synchronize.side_effect = lambda: events.append(
+        ("synchronize", model._pinned_tokens_buffer[0, 0].item())
+    )
+    model._pinned_tokens_buffer_event.record.side_effect = lambda: events.append(
+        ("record", model._pinned_tokens_buffer[0, 0].item())
+    )
+
+    # when
+    _ = model._transfer_tokens(tensors=[torch.tensor([1, 2])] * 3)
+    result = model._transfer_tokens(tensors=[torch.tensor([3, 4, 5])] * 3)
+
+    # then
+    assert events == [
+        ("synchronize", 0),
+        ("record", 1),
+        ("synchronize", 1),
+        ("record", 3),
+    ], "Expected buffer to be overwritten only after previous copies completed"
+    assert [t.tolist() for t in result] == [[[3, 4, 5]]] * 3
+
+
+def test_transfer_image_should_resize_and_normalise_like_remote_code() -> None:
+    # given
+    model = build_stub_cogvlm()
+    build_stub_image_preprocessing(model=model, image_size=4)
+    image = np.full((6, 8, 3), (255, 0, 51), dtype=np.uint8)
+
+    # when
+    result = model._transfer_image(image=image)
+
+    # then
+    expected_channels = [
+        (value - mean) / std
+        for value, mean, std in zip(
+            (1.0, 0.0, 0.2), cogvlm.IMAGE_MEAN, cogvlm.IMAGE_STD
+        )
+    ]
+    assert result.shape == (3, 4, 4), "Expected image resized to vision tower input"
+    assert result.dtype is torch.float16
+    for channel, expected_value in zip(result, expected_channels):
+        assert torch.allclose(
+            channel.float(), torch.full((4, 4), expected_value), atol=1e-2
+        ), "Expected pixel values scaled to [0, 1] and normalised with CLIP statistics"
+
+
+def test_warm_up_should_synchronise_device_after_generation() -> None:
+    # given
+    model = build_stub_cogvlm()
+    model.device = torch.device("cuda")
+    events = []
+    model._build_inputs = mock.MagicMock(return_value={})
+    model._greedy_decode = mock.MagicMock(
+        side_effect=lambda **kwargs: events.append("decode")
+    )
+
+    # when
+    with mock.patch.object(
+        cogvlm, "fused_attention_context", return_value=cogvlm.nullcontext()
+    ), mock.patch.object(
+        cogvlm.torch.cuda,
+        "synchronize",
+        side_effect=lambda: events.append("synchronize"),
+    ):
+        model._warm_up()
+
+    # then
+    assert events == [
+        "decode",
+        "synchronize",
+    ], "Expected warm-up transfers to complete before staging buffers are reused"
+
+
+def test_tf32_matmul_context_should_restore_previous_precision() -> None:
+    # given
+    torch.set_float32_matmul_precision("highest")
+
+    # when
+    with cogvlm.tf32_matmul_context(device=torch.device("cuda")):
+        precision_inside_context = torch.get_float32_matmul_precision()
+
+    # then
+    assert precision_inside_context == "high"
+    assert (
+        torch.get_float32_matmul_precision() == "highest"
+    ), "Expected process-wide precision to be restored after generation"
+
+
+def test_tf32_matmul_context_when_cpu_device_given() -> None:
+    # given
+    torch.set_float32_matmul_precision("highest")
+
+    # when
+    with cogvlm.tf32_matmul_context(device=torch.device("cpu")):
+        precision_inside_context = torch.get_float32_matmul_precision()
+
+    # then
+    assert precision_inside_context == "highest"
+
+
+def test_greedy_decode_when_eos_generated_should_drop_tokens_past_eos() -> None:
+    # given
+    model = build_stub_cogvlm()
+    model.model = StubLanguageModel(tokens=[5, 6, 2, 7])
+
+    # when
+    result = model._greedy_decode(inputs=build_stub_greedy_inputs())
+
+    # then
+    assert result.tolist() == [5, 6, 2], "Expected tokens up to and including EOS"
+    assert (
+        model.model.calls == cogvlm.EOS_CHECK_INTERVAL
+    ), "Expected EOS to be detected on first periodic check"
+
+
+def test_greedy_decode_when_eos_not_generated_should_stop_at_max_length() -> None:
+    # given
+    model = build_stub_cogvlm()
+    model.model = StubLanguageModel(tokens=[5, 6])
+
+    # when
+    result = model._greedy_decode(inputs=build_stub_greedy_inputs(prompt_length=4))
+
+    # then
+    assert result.shape == (60,), "Expected generation to fill up to `max_length`"
+
+
+def test_greedy_decode_when_eos_check_disabled() -> None:
+    # given
+    model = build_stub_cogvlm()
+    model.model = StubLanguageModel(tokens=[2])
+
+    # when
+    result = model._greedy_decode(
+        inputs=build_stub_greedy_inputs(), max_new_tokens=3, stop_on_eos=False
+    )
+
+    # then
+    assert result.tolist() == [2, 2, 2]
+
+
+def test_fused_attention_context_should_keep_math_kernel_as_last_resort() -> None:
+    # given
+    from torch.nn import attention
+
+    # when
+    with mock.patch.object(attention, "sdpa_kernel") as sdpa_kernel_mock:
+        _ = cogvlm.fused_attention_context(device=torch.device("cuda"))
+
+    # then
+    backends = sdpa_kernel_mock.call_args.args[0]
+    assert backends[:2] == [
+        attention.SDPBackend.FLASH_ATTENTION,
+        attention.SDPBackend.EFFICIENT_ATTENTION,
+    ], "Expected fused kernels to be preferred"
+    assert (
+        backends[-1] is attention.SDPBackend.MATH
+    ), "Expected math kernel to remain available as fallback"
+
+
+@mock.patch.object(cogvlm, "COGVLM_TORCH_COMPILE_DYNAMIC", False)
+def test_compile_decoder_layers_when_dynamic_shapes_disabled() -> None:
+    # given
+    model = build_stub_cogvlm()
+
+    # when
+    with mock.patch.object(cogvlm.torch, "compile") as compile_mock:
+        model._compile_decoder_layers()
+
+    # then
+    assert all(
+        call.kwargs["dynamic"] is False for call in compile_mock.call_args_list
+    ), "Expected `COGVLM_TORCH_COMPILE_DYNAMIC` to be passed to `torch.compile(...)`"
+    assert all(
+        layer is compile_mock.return_value for layer in model.model.model.layers
+    ), "Expected compiled layers to replace eager ones"
+
+
+def test_select_device_when_cuda_is_available_should_use_current_device() -> None:
+    # when
+    with mock.patch.object(
+        cogvlm.torch.cuda, "is_available", return_value=True
+    ), mock.patch.object(cogvlm.torch.cuda, "current_device", return_value=1):
+        result = cogvlm.select_device()
+
+    # then
+    assert result == torch.device(
+        "cuda", 1
+    ), "Expected weights and inputs to target current CUDA device, not GPU 0"
+
+
+def test_select_device_when_cuda_is_not_available() -> None:
+    # when
+    with mock.patch.object(cogvlm.torch.cuda, "is_available", return_value=False):
+        result = cogvlm.select_device()
+
+    # then
+    assert result == torch.device("cpu")
+
+
+@mock.patch.object(cogvlm, "COGVLM_LOAD_8BIT", False)
+@mock.patch.object(cogvlm, "COGVLM_LOAD_4BIT", False)
+def test_build_quantization_config_when_quantization_disabled() -> None:
+    # when
+    result = cogvlm.build_quantization_config()
+
+    # then
+    assert result is None
+
+
+@mock.patch.object(cogvlm, "COGVLM_SKIP_VISION_QUANTIZATION", False)
+@mock.patch.object(cogvlm, "COGVLM_LOAD_8BIT", False)
+@mock.patch.object(cogvlm, "COGVLM_LOAD_4BIT", True)
+def test_build_quantization_config_when_4bit_quantization_enabled() -> None:
+    # when
+    result = cogvlm.build_quantization_config()
+
+    # then
+    assert result.load_in_4bit is True
+    assert result.bnb_4bit_quant_type == "nf4"
+    assert result.bnb_4bit_compute_dtype is torch.float16
+    assert result.llm_int8_skip_modules is None
+
+
+@mock.patch.object(cogvlm, "COGVLM_SKIP_VISION_QUANTIZATION", True)
+@mock.patch.object(cogvlm, "COGVLM_LOAD_8BIT", True)
+@mock.patch.object(cogvlm, "COGVLM_LOAD_4BIT", False)
+def test_build_quantization_config_when_8bit_quantization_skips_vision() -> None:
+    # when
+    result = cogvlm.build_quantization_config()
+
+    # then
+    assert result.load_in_8bit is True
+    assert result.llm_int8_skip_modules == [
+        "lm_head",
+        "vision",
+        "patch_embedding",
+    ], "Expected `lm_head` to stay excluded next to vision tower"
+
+
+def test_quantize_linear_layers_to_int8_should_replace_nested_linear_layers() -> None:
+    # given
+    bnb = pytest.importorskip("bitsandbytes")
+    module = torch.nn.Sequential(
+        torch.nn.Linear(4, 8),
+        torch.nn.ReLU(),
+        torch.nn.Sequential(torch.nn.Linear(8, 2, bias=False)),
+    )
+
+    # when
+    result = cogvlm.quantize_linear_layers_to_int8(
+        module=module, device=torch.device("cpu")
+    )
+
+    # then
+    assert result == 2, "Expected number of replaced layers to be reported"
+    assert isinstance(module[0], bnb.nn.Linear8bitLt)
+    assert (module[0].in_features, module[0].out_features) == (4, 8)
+    assert module[0].bias is not None
+    assert isinstance(module[1], torch.nn.ReLU), "Expected non-linear layers intact"
+    assert isinstance(module[2][0], bnb.nn.Linear8bitLt)
+    assert module[2][0].bias is None
+
+
+@mock.patch.object(cogvlm, "COGVLM_SKIP_VISION_QUANTIZATION", False)
+@mock.patch.object(cogvlm, "COGVLM_LOAD_4BIT", True)
+@mock.patch.object(cogvlm, "quantize_linear_layers_to_int8")
+@mock.patch.object(cogvlm, "logger")
+def test_quantize_vision_tower_when_vision_tower_already_quantized(
+    logger_mock: mock.MagicMock,
+    quantize_linear_layers_to_int8_mock: mock.MagicMock,
+) -> None:
+    # given
+    model = build_stub_cogvlm()
+    model.device = torch.device("cuda")
+
+    # when
+    model._quantize_vision_tower()
+
+    # then
+    quantize_linear_layers_to_int8_mock.assert_not_called()
+    logger_mock.warning.assert_called_once()
+    assert "COGVLM_SKIP_VISION_QUANTIZATION" in logger_mock.warning.call_args.args[0]
+
+
+@mock.patch.object(cogvlm, "COGVLM_SKIP_VISION_QUANTIZATION", True)
+@mock.patch.object(cogvlm, "COGVLM_LOAD_4BIT", True)
+@mock.patch.object(cogvlm, "quantize_linear_layers_to_int8")
+@mock.patch.object(cogvlm, "logger")
+def test_quantize_vision_tower_when_vision_tower_skipped_by_quantization(
+    logger_mock: mock.MagicMock,
+    quantize_linear_layers_to_int8_mock: mock.MagicMock,
+) -> None:
+    # given
+    model = build_stub_cogvlm()
+    model.device = torch.device("cuda")
+    model.model.model.vision = torch.nn.Linear(2, 2)
+    quantize_linear_layers_to_int8_mock.return_value = 7
+
+    # when
+    with mock.patch.object(
+        cogvlm.torch.cuda, "get_device_capability", return_value=(8, 0)
+    ):
+        model._quantize_vision_tower()
+
+    # then
+    quantize_linear_layers_to_int8_mock.assert_called_once_with(
+        module=model.model.model.vision, device=model.device
+    )
+    logger_mock.warning.assert_not_called()
+    assert "7" in logger_mock.info.call_args.args[0], "Expected replaced layers logged"
+
+
+def test_get_inputs_when_same_prompt_and_image_given_should_hit_cache() -> None:
+    # given
+    model = build_stub_cogvlm()
+    model._inputs_cache = cogvlm.OrderedDict()
+    model._build_inputs = mock.MagicMock(side_effect=lambda **kwargs: object())
+    image = np.zeros((4, 4, 3), dtype=np.uint8)
+
+    # when
+    first_result = model._get_inputs(image=image, prompt="a", history=[])
+    second_result = model._get_inputs(image=image.copy(), prompt="a", history=[])
+
+    # then
+    assert first_result is second_result, "Expected cached inputs to be re-used"
+    assert model._build_inputs.call_count == 1
+
+
+def test_get_inputs_when_image_or_prompt_differs_should_miss_cache() -> None:
+    # given
+    model = build_stub_cogvlm()
+    model._inputs_cache = cogvlm.OrderedDict()
+    model._build_inputs = mock.MagicMock(side_effect=lambda **kwargs: object())
+    image = np.zeros((4, 4, 3), dtype=np.uint8)
+
+    # when
+    _ = model._get_inputs(image=image, prompt="a", history=[])
+    _ = model._get_inputs(image=image, prompt="b", history=[])
+    _ = model._get_inputs(image=np.ones_like(image), prompt="a", history=[])
+    _ = model._get_inputs(image=image, prompt="a", history=[("a", "b")])
+
+    # then
+    assert model._build_inputs.call_count == 4
+
+
+@mock.patch.object(cogvlm, "INPUTS_CACHE_SIZE", 2)
+def test_get_inputs_when_cache_full_should_evict_least_recently_used_entry() -> None:
+    # given
+    model = build_stub_cogvlm()
+    model._inputs_cache = cogvlm.OrderedDict()
+    model._build_inputs = mock.MagicMock(side_effect=lambda **kwargs: object())
+    image = np.zeros((4, 4, 3), dtype=np.uint8)
+
+    # when
+    _ = model._get_inputs(image=image, prompt="a", history=[])
+    _ = model._get_inputs(image=image, prompt="b", history=[])
+    _ = model._get_inputs(image=image, prompt="a", history=[])
+    _ = model._get_inputs(image=image, prompt="c", history=[])
+    _ = model._get_inputs(image=image, prompt="a", history=[])
+    _ = model._get_inputs(image=image, prompt="b", history=[])
+
+    # then
+    assert len(model._inputs_cache) == 2
+    assert (
+        model._build_inputs.call_count == 4
+    ), "Expected only `b` to be evicted, as `a` was used more recently"
+
+
+def test_run_on_worker_should_run_functions_on_single_dedicated_thread() -> None:
+    # given
+    model = build_stub_cogvlm()
+    model._executor = cogvlm.ThreadPoolExecutor(max_workers=1)
+    model._compute_stream = None
+
+    # when
+    try:
+        first_thread = model._run_on_worker(threading.get_ident)
+        second_thread = model._run_on_worker(threading.get_ident)
+    finally:
+        model._executor.shutdown()
+
+    # then
+    assert first_thread == second_thread, "Expected the same worker thread"
+    assert first_thread != threading.get_ident(), "Expected work off caller thread"
+
+
+def test_run_on_worker_should_pass_arguments_and_propagate_errors() -> None:
+    # given
+    model = build_stub_cogvlm()
+    model._executor = cogvlm.ThreadPoolExecutor(max_workers=1)
+    model._compute_stream = None
+
+    def divide(a: int, b: int) -> float:
+        return a / b
+
+    # when
+    try:
+        result = model._run_on_worker(divide, a=6, b=3)
+        with pytest.raises(ZeroDivisionError):
+            _ = model._run_on_worker(divide, a=1, b=0)
+    finally:
+        model._executor.shutdown()
+
+    # then
+    assert result == 2
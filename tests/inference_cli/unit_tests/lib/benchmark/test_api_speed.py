@@ -0,0 +1,52 @@
+from unittest import mock
+
+import numpy as np
+
+from inference_cli.lib.benchmark.api_speed import execute_api_speed_benchmark
+from inference_cli.lib.benchmark.results_gathering import ResultsCollector
+
+
+def test_execute_api_speed_benchmark_should_close_client_after_benchmark() -> None:
+    # given
+    client = mock.MagicMock()
+    client.infer_async = mock.AsyncMock()
+    client.aclose = mock.AsyncMock()
+    results_collector = ResultsCollector()
+
+    # when
+    execute_api_speed_benchmark(
+        results_collector=results_collector,
+        client=client,
+        images=[np.zeros((32, 32, 3), dtype=np.uint8)],
+        benchmark_requests=3,
+        request_batch_size=1,
+        number_of_clients=2,
+        requests_per_second=None,
+    )
+
+    # then
+    assert client.infer_async.await_count == 6
+    client.aclose.assert_awaited_once()
+
+
+def test_execute_api_speed_benchmark_should_close_client_when_requests_fail() -> None:
+    # given
+    client = mock.MagicMock()
+    client.infer_async = mock.AsyncMock(side_effect=RuntimeError("API down"))
+    client.aclose = mock.AsyncMock()
+    results_collector = ResultsCollector()
+
+    # when
+    execute_api_speed_benchmark(
+        results_collector=results_collector,
+        client=client,
+        images=[np.zeros((32, 32, 3), dtype=np.uint8)],
+        benchmark_requests=2,
+        request_batch_size=1,
+        number_of_clients=1,
+        requests_per_second=None,
+    )
+
+    # then
+    client.aclose.assert_awaited_once()
+    assert results_collector.get_statistics().error_rate == 100.0
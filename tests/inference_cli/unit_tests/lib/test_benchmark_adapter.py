@@ -0,0 +1,49 @@
+from unittest import mock
+
+import numpy as np
+
+from inference_cli import benchmark
+from inference_cli.lib.benchmark_adapter import resize_dataset_images
+
+
+def test_resize_dataset_images_when_size_not_given() -> None:
+    # given
+    images = [np.zeros((192, 168, 3), dtype=np.uint8)]
+
+    # when
+    result = resize_dataset_images(images=images, resize_to=None)
+
+    # then
+    assert result is images, "Expected images to be left intact"
+
+
+def test_resize_dataset_images_when_size_given() -> None:
+    # given
+    images = [
+        np.zeros((192, 168, 3), dtype=np.uint8),
+        np.zeros((480, 640, 3), dtype=np.uint8),
+    ]
+
+    # when
+    result = resize_dataset_images(images=images, resize_to=320)
+
+    # then
+    assert [i.shape for i in result] == [
+        (320, 320, 3),
+        (320, 320, 3),
+    ], "Expected all images to be resized to static square shape"
+
+
+@mock.patch.object(benchmark, "run_python_package_speed_benchmark")
+def test_python_package_speed_command_should_pass_resize_to_option(
+    run_python_package_speed_benchmark_mock: mock.MagicMock,
+) -> None:
+    # when
+    benchmark.python_package_speed(
+        model_id="some/1", dataset_reference="coco", resize_to=640
+    )
+
+    # then
+    call_kwargs = run_python_package_speed_benchmark_mock.call_args.kwargs
+    assert call_kwargs["model_id"] == "some/1"
+    assert call_kwargs["resize_to"] == 640
@@ -1,17 +1,28 @@
+import asyncio
 import base64
+import copy
+import gzip
 import json
+import time
 from io import BytesIO
+from typing import Any
 from unittest import mock
 from unittest.mock import AsyncMock, MagicMock
 
+import aiohttp
+import httpx
+import ijson
+import numpy as np
 import pytest
+import requests
 from aiohttp import ClientConnectionError, ClientResponseError, RequestInfo
-from aioresponses import aioresponses
+from aioresponses import CallbackResult, aioresponses
 from requests import HTTPError, Request, Response
 from requests_mock.mocker import Mocker
 from yarl import URL
 
 from inference_sdk.http import client
+from inference_sdk.http.utils import executors
 from inference_sdk.http.client import (
     DEFAULT_HEADERS,
     InferenceHTTPClient,
@@ -23,16 +34,21 @@ from inference_sdk.http.client import (
 )
 from inference_sdk.http.entities import (
     CLASSIFICATION_TASK,
+    AsyncTransport,
     HTTPClientMode,
     InferenceConfiguration,
     ModelDescription,
     RegisteredModels,
+    UploadCompression,
+    VisualisationResponseFormat,
 )
 from inference_sdk.http.errors import (
     HTTPCallErrorError,
     HTTPClientError,
     InvalidModelIdentifier,
     InvalidParameterError,
+    InvalidWorkflowResponseError,
+    ModelNotInitializedError,
     ModelNotSelectedError,
     ModelTaskTypeNotSupportedError,
     WrongClientModeError,
@@ -198,6 +214,28 @@ def test_wrap_errors_when_connection_error_occurs() -> None:
         example()
 
 
+def test_wrap_errors_when_requests_connection_error_occurs() -> None:
+    # given
+    @wrap_errors
+    def example() -> None:
+        raise requests.ConnectionError("connection refused")
+
+    # when
+    with pytest.raises(HTTPClientError):
+        example()
+
+
+def test_wrap_errors_preserves_wrapped_function_metadata() -> None:
+    # given
+    @wrap_errors
+    def example() -> None:
+        """Some docstring."""
+
+    # then
+    assert example.__name__ == "example"
+    assert example.__doc__ == "Some docstring."
+
+
 @pytest.mark.asyncio
 async def test_wrap_errors_async_when_connection_error_occurs() -> None:
     # given
@@ -322,6 +360,272 @@ def test_setting_mode_with_context_manager() -> None:
     assert http_client.client_mode is HTTPClientMode.V1
 
 
+def test_client_copy_keeps_state_independent() -> None:
+    # given
+    http_client = InferenceHTTPClient(api_url="https://some.com", api_key="my-api-key")
+
+    # when
+    copied_client = copy.copy(http_client).select_model(model_id="some/1")
+
+    # then
+    assert copied_client.selected_model == "some/1"
+    assert http_client.selected_model is None
+    assert copied_client.client_mode is http_client.client_mode
+
+
+@mock.patch.object(client, "build_session")
+def test_client_prewarms_connection_when_requested(
+    build_session_mock: MagicMock,
+) -> None:
+    # when
+    _ = InferenceHTTPClient(api_url="https://some.com", prewarm_connections=True)
+
+    # then
+    session = build_session_mock.return_value
+    for _ in range(100):
+        if session.head.called:
+            break
+        time.sleep(0.01)
+    session.head.assert_called_once_with(
+        "https://some.com", timeout=client.PREWARM_TIMEOUT
+    )
+
+
+@mock.patch.object(client, "build_session")
+def test_client_closes_session_when_used_as_context_manager(
+    build_session_mock: MagicMock,
+) -> None:
+    # when
+    with InferenceHTTPClient(
+        api_key="my-api-key", api_url="https://some.com"
+    ) as http_client:
+        pass
+
+    # then
+    assert isinstance(http_client, InferenceHTTPClient)
+    build_session_mock.return_value.close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_client_reuses_async_session_until_closed() -> None:
+    # given
+    api_url = "http://some.com"
+    created_sessions = []
+
+    def build_async_session() -> aiohttp.ClientSession:
+        session = aiohttp.ClientSession()
+        created_sessions.append(session)
+        return session
+
+    with aioresponses() as m, mock.patch.object(
+        client, "build_async_session", side_effect=build_async_session
+    ):
+        m.get(f"{api_url}/model/registry", payload={"models": []}, repeat=True)
+
+        # when
+        async with InferenceHTTPClient(
+            api_key="my-api-key", api_url=api_url
+        ) as http_client:
+            _ = await http_client.list_loaded_models_async()
+            _ = await http_client.list_loaded_models_async()
+
+    # then
+    assert len(created_sessions) == 1, "Expected single session to be shared"
+    assert created_sessions[0].closed, "Expected session to be closed on exit"
+
+
+def test_client_closes_async_session_after_each_call_outside_context_manager() -> None:
+    # given
+    api_url = "http://some.com"
+    created_sessions = []
+
+    def build_async_session() -> aiohttp.ClientSession:
+        session = aiohttp.ClientSession()
+        created_sessions.append(session)
+        return session
+
+    http_client = InferenceHTTPClient(api_key="my-api-key", api_url=api_url)
+
+    with aioresponses() as m, mock.patch.object(
+        client, "build_async_session", side_effect=build_async_session
+    ):
+        m.get(f"{api_url}/model/registry", payload={"models": []}, repeat=True)
+
+        # when
+        _ = asyncio.run(http_client.list_loaded_models_async())
+        _ = asyncio.run(http_client.list_loaded_models_async())
+
+    # then
+    assert len(created_sessions) == 2, "Expected session per event loop"
+    assert all(
+        s.closed for s in created_sessions
+    ), "Expected sessions not to outlive calls made outside of `async with`"
+
+
+@pytest.mark.asyncio
+async def test_client_shares_async_session_between_concurrent_calls() -> None:
+    # given
+    api_url = "http://some.com"
+    created_sessions = []
+
+    def build_async_session() -> aiohttp.ClientSession:
+        session = aiohttp.ClientSession()
+        created_sessions.append(session)
+        return session
+
+    async def respond_with_delay(url: URL, **kwargs) -> CallbackResult:
+        # both calls must be in flight at the same time
+        await asyncio.sleep(0.01)
+        return CallbackResult(payload={"models": []})
+
+    http_client = InferenceHTTPClient(api_key="my-api-key", api_url=api_url)
+
+    with aioresponses() as m, mock.patch.object(
+        client, "build_async_session", side_effect=build_async_session
+    ):
+        m.get(f"{api_url}/model/registry", callback=respond_with_delay, repeat=True)
+
+        # when
+        _ = await asyncio.gather(
+            http_client.list_loaded_models_async(),
+            http_client.list_loaded_models_async(),
+        )
+
+    # then
+    assert len(created_sessions) == 1, "Expected concurrent calls to share session"
+    assert created_sessions[0].closed, "Expected session to be closed after last call"
+
+
+@pytest.mark.asyncio
+@mock.patch.object(client, "load_static_inference_input_async")
+async def test_infer_from_api_v1_async_when_httpx_transport_is_used(
+    load_static_inference_input_async_mock: MagicMock,
+) -> None:
+    # given
+    api_url = "http://some.com"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, json={"image": {"height": 480, "width": 640}, "predictions": []}
+        )
+
+    http_client = InferenceHTTPClient(
+        api_key="my-api-key",
+        api_url=api_url,
+        async_transport=AsyncTransport.HTTPX,
+    )
+    http_client.get_model_description_async = AsyncMock()
+    http_client.get_model_description_async.return_value = ModelDescription(
+        model_id="some/1",
+        task_type="object-detection",
+        input_height=480,
+        input_width=640,
+    )
+    load_static_inference_input_async_mock.return_value = [("base64_image", 0.5)]
+
+    # when
+    with mock.patch.object(
+        client,
+        "build_httpx_async_client",
+        return_value=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    ):
+        async with http_client:
+            result = await http_client.infer_from_api_v1_async(
+                inference_input="https://some/image.jpg",
+                model_id="some/1",
+            )
+
+    # then
+    assert result == {
+        "image": {"height": 960, "width": 1280},
+        "predictions": [],
+    }, "Expected response to be parsed and rescaled"
+
+
+@pytest.mark.asyncio
+async def test_get_clip_text_embeddings_async_when_httpx_transport_is_used() -> None:
+    # given
+    captured_requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        captured_requests.append(request)
+        return httpx.Response(
+            200, json={"frame_id": None, "time": 0.1, "embeddings": [[1.0]]}
+        )
+
+    http_client = InferenceHTTPClient(
+        api_key="my-api-key",
+        api_url="http://some.com",
+        async_transport=AsyncTransport.HTTPX,
+    )
+
+    # when
+    with mock.patch.object(
+        client,
+        "build_httpx_async_client",
+        return_value=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    ):
+        async with http_client:
+            result = await http_client.get_clip_text_embeddings_async(text="some")
+
+    # then
+    assert result == {
+        "frame_id": None,
+        "time": 0.1,
+        "embeddings": [[1.0]],
+    }, "Result must match the value returned by HTTP endpoint"
+    assert len(captured_requests) == 1, "Expected request to be sent with httpx"
+    assert json.loads(captured_requests[0].content) == {
+        "api_key": "my-api-key",
+        "text": "some",
+    }, "Request must contain API key and text"
+
+
+@pytest.mark.asyncio
+async def test_wrap_errors_async_when_httpx_status_error_occurs() -> None:
+    # given
+    @wrap_errors_async
+    async def example() -> None:
+        request = httpx.Request("GET", "https://some.com")
+        raise httpx.HTTPStatusError(
+            "Not Found",
+            request=request,
+            response=httpx.Response(404, text="Not Found", request=request),
+        )
+
+    # when
+    with pytest.raises(HTTPCallErrorError) as error:
+        await example()
+
+    assert error.value.status_code == 404
+    assert error.value.api_message == "Not Found"
+
+
+@mock.patch.object(client, "load_stream_inference_input")
+def test_infer_on_stream_preserves_order_of_frames(
+    load_stream_inference_input_mock: MagicMock,
+) -> None:
+    # given
+    frames = [(i, np.ones((2, 2, 3), dtype=np.uint8) * i) for i in range(5)]
+    load_stream_inference_input_mock.return_value = iter(frames)
+    http_client = InferenceHTTPClient(api_key="my-api-key", api_url="http://some.com")
+    http_client.configure(InferenceConfiguration(max_concurrent_requests=2))
+    http_client.infer = MagicMock(
+        side_effect=lambda inference_input, model_id: {
+            "frame": int(inference_input[0, 0, 0])
+        }
+    )
+
+    # when
+    result = list(http_client.infer_on_stream(input_uri="/some/video.mp4"))
+
+    # then
+    assert [r[0] for r in result] == [0, 1, 2, 3, 4], "Expected stream order"
+    assert [r[2] for r in result] == [
+        {"frame": i} for i in range(5)
+    ], "Expected predictions to match frames"
+
+
 def test_client_unload_all_models_in_v0_mode() -> None:
     # given
     api_url = "http://some.com"
@@ -995,6 +1299,58 @@ def test_get_model_description_when_model_was_loaded_already_and_alias_was_resol
     assert result == ModelDescription(model_id="coco/3", task_type="object-detection")
 
 
+def test_get_model_description_when_description_is_cached(
+    requests_mock: Mocker,
+) -> None:
+    # given
+    api_url = "http://some.com"
+    requests_mock.get(
+        f"{api_url}/model/registry",
+        json={"models": [{"model_id": "some/1", "task_type": "classification"}]},
+    )
+    http_client = InferenceHTTPClient(api_key="my-api-key", api_url=api_url)
+
+    # when
+    first_result = http_client.get_model_description(model_id="some/1")
+    second_result = http_client.get_model_description(model_id="some/1")
+
+    # then
+    assert first_result == ModelDescription(
+        model_id="some/1", task_type="classification"
+    )
+    assert second_result == first_result
+    assert (
+        len(requests_mock.request_history) == 1
+    ), "Expected registry to be fetched only once"
+
+
+def test_get_model_description_when_model_was_unloaded_after_caching(
+    requests_mock: Mocker,
+) -> None:
+    # given
+    api_url = "http://some.com"
+    requests_mock.get(
+        f"{api_url}/model/registry",
+        [
+            {"json": {"models": [{"model_id": "some/1", "task_type": "classification"}]}},
+            {"json": {"models": []}},
+        ],
+    )
+    requests_mock.post(f"{api_url}/model/remove", json={"models": []})
+    http_client = InferenceHTTPClient(api_key="my-api-key", api_url=api_url)
+    _ = http_client.get_model_description(model_id="some/1")
+    _ = http_client.unload_model(model_id="some/1")
+
+    # when
+    with pytest.raises(ModelNotInitializedError):
+        _ = http_client.get_model_description(model_id="some/1", allow_loading=False)
+
+    # then
+    assert (
+        len(requests_mock.request_history) == 3
+    ), "Expected registry to be fetched again after model was unloaded"
+
+
 @pytest.mark.asyncio
 async def test_get_model_description_async_when_model_was_loaded_already() -> None:
     # given
@@ -1671,6 +2027,51 @@ async def test_infer_from_api_v1_async_when_task_type_is_not_recognised() -> Non
         )
 
 
+@mock.patch.object(client, "load_static_inference_input")
+def test_batch_infer_when_batch_size_is_overridden(
+    load_static_inference_input_mock: MagicMock,
+    requests_mock: Mocker,
+) -> None:
+    # given
+    api_url = "http://some.com"
+    http_client = InferenceHTTPClient(api_key="my-api-key", api_url=api_url)
+    http_client.get_model_description = MagicMock()
+    http_client.get_model_description.return_value = ModelDescription(
+        model_id="some/1",
+        task_type="object-detection",
+        input_height=480,
+        input_width=640,
+    )
+    load_static_inference_input_mock.return_value = [
+        ("base64_image", None),
+        ("another_image", None),
+    ]
+    requests_mock.post(
+        f"{api_url}/infer/object_detection",
+        json=[{"predictions": ["A"]}, {"predictions": ["B"]}],
+    )
+
+    # when
+    result = http_client.batch_infer(
+        inference_inputs=["https://some/image.jpg", "https://some/other.jpg"],
+        model_id="some/1",
+        max_batch_size=2,
+    )
+
+    # then
+    assert result == [
+        {"predictions": ["A"]},
+        {"predictions": ["B"]},
+    ], "Expected predictions for both images to be returned"
+    assert len(requests_mock.request_history) == 1, "Expected single batch request"
+    assert [
+        image["value"] for image in requests_mock.last_request.json()["image"]
+    ] == ["base64_image", "another_image"], "Expected both images in one payload"
+    assert (
+        http_client.inference_configuration.max_batch_size == 1
+    ), "Override must not alter client configuration"
+
+
 @mock.patch.object(client, "load_static_inference_input")
 @pytest.mark.parametrize("model_id_to_use", ["coco/3", "yolov8n-640"])
 def test_infer_from_api_v1_when_request_succeed_for_object_detection_with_batch_request(
@@ -2068,59 +2469,162 @@ def test_prompt_cogvlm_when_successful_response_is_returned(
     }, "Request must contain API key, model id, prompt, chat history and image encoded in standard format"
 
 
+@mock.patch.object(executors, "UPLOAD_COMPRESSION_MIN_BODY_SIZE", 0)
 @mock.patch.object(client, "load_static_inference_input")
-def test_prompt_cogvlm_when_unsuccessful_response_is_returned(
+def test_prompt_cogvlm_when_upload_compression_is_enabled(
     load_static_inference_input_mock: MagicMock,
     requests_mock: Mocker,
 ) -> None:
     # given
     api_url = "http://some.com"
     http_client = InferenceHTTPClient(api_key="my-api-key", api_url=api_url)
-    load_static_inference_input_mock.return_value = [("base64_image", 0.5)]
-    requests_mock.post(
-        f"{api_url}/llm/cogvlm",
-        json={
-            "message": "Cannot load CogVLM.",
-        },
-        status_code=500,
+    http_client.configure(
+        InferenceConfiguration(upload_compression=UploadCompression.GZIP)
     )
-
-    with pytest.raises(HTTPCallErrorError):
-        _ = http_client.prompt_cogvlm(
-            visual_prompt="/some/image.jpg",
-            text_prompt="What is the topic of that picture?",
-            chat_history=[("A", "B")],
-        )
-
-
-@mock.patch.object(client, "load_static_inference_input")
-def test_ocr_image_when_single_image_given_in_v1_mode(
-    load_static_inference_input_mock: MagicMock,
-    requests_mock: Mocker,
-) -> None:
-    api_url = "http://some.com"
-    http_client = InferenceHTTPClient(api_key="my-api-key", api_url=api_url)
     load_static_inference_input_mock.return_value = [("base64_image", 0.5)]
-    requests_mock.post(
-        f"{api_url}/doctr/ocr",
-        json={
-            "response": "Image text 1.",
-            "time": 0.33,
-        },
-    )
+    requests_mock.post(f"{api_url}/llm/cogvlm", json={"response": "Some"})
 
     # when
-    result = http_client.ocr_image(inference_input="/some/image.jpg")
+    result = http_client.prompt_cogvlm(
+        visual_prompt="/some/image.jpg",
+        text_prompt="What is the topic of that picture?",
+    )
 
     # then
-    assert result == {
-        "response": "Image text 1.",
-        "time": 0.33,
-    }, "Result must match the value returned by HTTP endpoint"
-    assert requests_mock.request_history[0].json() == {
+    assert result == {"response": "Some"}
+    request = requests_mock.request_history[0]
+    assert request.headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(request.body)) == {
+        "model_id": "cogvlm",
         "api_key": "my-api-key",
         "image": {"type": "base64", "value": "base64_image"},
-    }, "Request must contain API key and image encoded in standard format"
+        "prompt": "What is the topic of that picture?",
+    }, "Expected CogVLM payload to be sent compressed"
+
+
+@pytest.mark.asyncio
+@mock.patch.object(executors, "UPLOAD_COMPRESSION_MIN_BODY_SIZE", 0)
+@mock.patch.object(client, "load_static_inference_input_async")
+async def test_prompt_cogvlm_async_when_upload_compression_is_enabled(
+    load_static_inference_input_async_mock: MagicMock,
+) -> None:
+    # given
+    api_url = "http://some.com"
+    http_client = InferenceHTTPClient(api_key="my-api-key", api_url=api_url)
+    http_client.configure(
+        InferenceConfiguration(upload_compression=UploadCompression.GZIP)
+    )
+    load_static_inference_input_async_mock.return_value = [("base64_image", 0.5)]
+
+    with aioresponses() as m:
+        m.post(f"{api_url}/llm/cogvlm", payload={"response": "Some"})
+
+        # when
+        async with http_client:
+            result = await http_client.prompt_cogvlm_async(
+                visual_prompt="/some/image.jpg",
+                text_prompt="What is the topic of that picture?",
+            )
+
+        # then
+        assert result == {"response": "Some"}
+        request = m.requests[("POST", URL(f"{api_url}/llm/cogvlm"))][0]
+        assert request.kwargs["headers"]["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(request.kwargs["data"])) == {
+            "model_id": "cogvlm",
+            "api_key": "my-api-key",
+            "image": {"type": "base64", "value": "base64_image"},
+            "prompt": "What is the topic of that picture?",
+        }, "Expected async CogVLM payload to go through the shared serialiser"
+
+
+@pytest.mark.asyncio
+@mock.patch.object(executors, "UPLOAD_COMPRESSION_MIN_BODY_SIZE", 0)
+@mock.patch.object(client, "load_static_inference_input_async")
+async def test_prompt_cogvlm_async_when_compressed_upload_rejected_with_422(
+    load_static_inference_input_async_mock: MagicMock,
+) -> None:
+    # given
+    api_url = "http://some.com"
+    http_client = InferenceHTTPClient(api_key="my-api-key", api_url=api_url)
+    http_client.configure(
+        InferenceConfiguration(upload_compression=UploadCompression.GZIP)
+    )
+    load_static_inference_input_async_mock.return_value = [("base64_image", 0.5)]
+
+    with aioresponses() as m:
+        m.post(f"{api_url}/llm/cogvlm", status=422, payload={"detail": "some"})
+        m.post(f"{api_url}/llm/cogvlm", payload={"response": "Some"})
+
+        # when
+        async with http_client:
+            result = await http_client.prompt_cogvlm_async(
+                visual_prompt="/some/image.jpg",
+                text_prompt="What is the topic of that picture?",
+            )
+
+        # then
+        assert result == {"response": "Some"}, "Expected plain upload to succeed"
+        requests = m.requests[("POST", URL(f"{api_url}/llm/cogvlm"))]
+        assert len(requests) == 2, "Expected single fallback request"
+        assert (
+            "Content-Encoding" not in requests[1].kwargs["headers"]
+        ), "Expected fallback request to be sent uncompressed"
+
+
+@mock.patch.object(client, "load_static_inference_input")
+def test_prompt_cogvlm_when_unsuccessful_response_is_returned(
+    load_static_inference_input_mock: MagicMock,
+    requests_mock: Mocker,
+) -> None:
+    # given
+    api_url = "http://some.com"
+    http_client = InferenceHTTPClient(api_key="my-api-key", api_url=api_url)
+    load_static_inference_input_mock.return_value = [("base64_image", 0.5)]
+    requests_mock.post(
+        f"{api_url}/llm/cogvlm",
+        json={
+            "message": "Cannot load CogVLM.",
+        },
+        status_code=500,
+    )
+
+    with pytest.raises(HTTPCallErrorError):
+        _ = http_client.prompt_cogvlm(
+            visual_prompt="/some/image.jpg",
+            text_prompt="What is the topic of that picture?",
+            chat_history=[("A", "B")],
+        )
+
+
+@mock.patch.object(client, "load_static_inference_input")
+def test_ocr_image_when_single_image_given_in_v1_mode(
+    load_static_inference_input_mock: MagicMock,
+    requests_mock: Mocker,
+) -> None:
+    api_url = "http://some.com"
+    http_client = InferenceHTTPClient(api_key="my-api-key", api_url=api_url)
+    load_static_inference_input_mock.return_value = [("base64_image", 0.5)]
+    requests_mock.post(
+        f"{api_url}/doctr/ocr",
+        json={
+            "response": "Image text 1.",
+            "time": 0.33,
+        },
+    )
+
+    # when
+    result = http_client.ocr_image(inference_input="/some/image.jpg")
+
+    # then
+    assert result == {
+        "response": "Image text 1.",
+        "time": 0.33,
+    }, "Result must match the value returned by HTTP endpoint"
+    assert requests_mock.request_history[0].json() == {
+        "api_key": "my-api-key",
+        "image": {"type": "base64", "value": "base64_image"},
+    }, "Request must contain API key and image encoded in standard format"
 
 
 @pytest.mark.asyncio
@@ -2561,6 +3065,48 @@ async def test_detect_gazes_when_faulty_response_returned(
             _ = await http_client.detect_gazes_async(inference_input="/some/image.jpg")
 
 
+@mock.patch.object(client, "load_static_inference_input")
+def test_get_clip_image_embeddings_when_multiple_images_given_in_batches(
+    load_static_inference_input_mock: MagicMock,
+    requests_mock: Mocker,
+) -> None:
+    # given
+    api_url = "http://some.com"
+    http_client = InferenceHTTPClient(api_key="my-api-key", api_url=api_url)
+    http_client.configure(
+        InferenceConfiguration(max_batch_size=2, max_concurrent_requests=2)
+    )
+    load_static_inference_input_mock.side_effect = lambda inference_input, **_: [
+        (f"base64_{inference_input}", None)
+    ]
+
+    def embed_images(request, context) -> dict:
+        images = request.json()["image"]
+        images = images if isinstance(images, list) else [images]
+        return {
+            "frame_id": None,
+            "time": 0.1,
+            "embeddings": [[image["value"]] for image in images],
+        }
+
+    requests_mock.post(f"{api_url}/clip/embed_image", json=embed_images)
+
+    # when
+    result = http_client.get_clip_image_embeddings(
+        inference_input=["a.jpg", "b.jpg", "c.jpg"]
+    )
+
+    # then
+    assert [e["embeddings"] for e in result] == [
+        [["base64_a.jpg"]],
+        [["base64_b.jpg"]],
+        [["base64_c.jpg"]],
+    ], "Embeddings must be returned in order of input images"
+    assert (
+        load_static_inference_input_mock.call_count == 3
+    ), "Expected each image to be encoded separately"
+
+
 @mock.patch.object(client, "load_static_inference_input")
 def test_get_clip_image_embeddings_when_single_image_given_in_v1_mode(
     load_static_inference_input_mock: MagicMock,
@@ -2603,6 +3149,52 @@ def test_get_clip_image_embeddings_when_single_image_given_in_v1_mode(
     }, "Request must contain API key and image encoded in standard format"
 
 
+@pytest.mark.asyncio
+@mock.patch.object(client, "make_parallel_requests_async")
+@mock.patch.object(client, "load_static_inference_input_async")
+async def test_iterate_post_images_async_when_batches_complete_out_of_order(
+    load_static_inference_input_async_mock: AsyncMock,
+    make_parallel_requests_async_mock: AsyncMock,
+) -> None:
+    # given
+    http_client = InferenceHTTPClient(api_key="my-api-key", api_url="http://some.com")
+    http_client.configure(
+        InferenceConfiguration(max_batch_size=1, max_concurrent_requests=2)
+    )
+    load_static_inference_input_async_mock.side_effect = lambda inference_input, **_: [
+        (image, None) for image in inference_input
+    ]
+
+    async def make_requests(requests_data, **_) -> list:
+        image = requests_data[0].payload["image"]["value"]
+        if image == "slow":
+            await asyncio.sleep(0.05)
+        return [{"image": image}]
+
+    make_parallel_requests_async_mock.side_effect = make_requests
+
+    # when
+    iterated = [
+        result
+        async for result in http_client._iterate_post_images_async(
+            inference_input=["slow", "fast"], endpoint="/clip/embed_image"
+        )
+    ]
+    result = await http_client._post_images_async(
+        inference_input=["slow", "fast"], endpoint="/clip/embed_image"
+    )
+
+    # then
+    assert iterated == [
+        (1, [{"image": "fast"}]),
+        (0, [{"image": "slow"}]),
+    ], "Expected batches to be yielded as they complete, with their index"
+    assert result == [
+        {"image": "slow"},
+        {"image": "fast"},
+    ], "Expected results to be returned in order of input images"
+
+
 @pytest.mark.asyncio
 @mock.patch.object(client, "load_static_inference_input_async")
 async def test_get_clip_image_embeddings_async_when_single_image_given_in_v1_mode(
@@ -2837,6 +3429,229 @@ def test_get_clip_text_embeddings_when_single_text_given(
     }, "Request must contain API key and text"
 
 
+@mock.patch.object(executors, "UPLOAD_COMPRESSION_MIN_BODY_SIZE", 0)
+def test_get_clip_text_embeddings_when_upload_compression_is_enabled(
+    requests_mock: Mocker,
+) -> None:
+    # given
+    api_url = "http://some.com"
+    http_client = InferenceHTTPClient(api_key="my-api-key", api_url=api_url)
+    http_client.configure(
+        InferenceConfiguration(upload_compression=UploadCompression.GZIP)
+    )
+    requests_mock.post(
+        f"{api_url}/clip/embed_text", json={"time": 0.1, "embeddings": [[0.5]]}
+    )
+
+    # when
+    result = http_client.get_clip_text_embeddings(text="some")
+
+    # then
+    assert result == {"time": 0.1, "embeddings": [[0.5]]}
+    request = requests_mock.request_history[0]
+    assert request.headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(request.body)) == {
+        "api_key": "my-api-key",
+        "text": "some",
+    }, "Expected CLIP text payload to be sent compressed"
+
+
+def test_get_clip_text_embeddings_when_duplicated_texts_given(
+    requests_mock: Mocker,
+) -> None:
+    # given
+    api_url = "http://some.com"
+    http_client = InferenceHTTPClient(api_key="my-api-key", api_url=api_url)
+    requests_mock.post(
+        f"{api_url}/clip/embed_text",
+        json={"frame_id": None, "time": 0.1, "embeddings": [[1.0], [2.0]]},
+    )
+
+    # when
+    result = http_client.get_clip_text_embeddings(text=["a", "b", "a"])
+
+    # then
+    assert result == {
+        "frame_id": None,
+        "time": 0.1,
+        "embeddings": [[1.0], [2.0], [1.0]],
+    }, "Embeddings must be restored for each of input texts"
+    assert requests_mock.request_history[0].json() == {
+        "api_key": "my-api-key",
+        "text": ["a", "b"],
+    }, "Each unique text must be sent only once"
+
+
+def test_get_clip_text_embeddings_when_client_mode_is_switched(
+    requests_mock: Mocker,
+) -> None:
+    # given
+    api_url = "http://some.com"
+    http_client = InferenceHTTPClient(api_key="my-api-key", api_url=api_url)
+    requests_mock.post(
+        f"{api_url}/clip/embed_text",
+        json={"frame_id": None, "time": 0.1, "embeddings": [[1.0]]},
+    )
+
+    # when
+    _ = http_client.get_clip_text_embeddings(text="a")
+    with http_client.use_api_v0():
+        _ = http_client.get_clip_text_embeddings(text="a")
+    _ = http_client.get_clip_text_embeddings(text="a")
+
+    # then
+    assert [r.url for r in requests_mock.request_history] == [
+        f"{api_url}/clip/embed_text",
+        f"{api_url}/clip/embed_text?api_key=my-api-key",
+        f"{api_url}/clip/embed_text",
+    ], "API key must be added to URL only in v0 mode"
+
+
+def test_get_clip_text_embeddings_when_api_key_contains_reserved_characters(
+    requests_mock: Mocker,
+) -> None:
+    # given
+    api_url = "http://some.com"
+    http_client = InferenceHTTPClient(api_key="my&key=1", api_url=api_url)
+    requests_mock.post(
+        f"{api_url}/clip/embed_text",
+        json={"frame_id": None, "time": 0.1, "embeddings": [[1.0]]},
+    )
+
+    # when
+    with http_client.use_api_v0():
+        _ = http_client.get_clip_text_embeddings(text="a")
+
+    # then
+    assert (
+        requests_mock.request_history[0].url
+        == f"{api_url}/clip/embed_text?api_key=my%26key%3D1"
+    ), "API key must be escaped in URL query"
+
+
+def test_get_clip_text_embeddings_when_cache_is_enabled(
+    requests_mock: Mocker,
+) -> None:
+    # given
+    api_url = "http://some.com"
+    http_client = InferenceHTTPClient(api_key="my-api-key", api_url=api_url)
+    http_client.configure(InferenceConfiguration(clip_text_embeddings_cache_size=2))
+    requests_mock.post(
+        f"{api_url}/clip/embed_text",
+        [
+            {"json": {"frame_id": None, "time": 0.1, "embeddings": [[1.0], [2.0]]}},
+            {"json": {"frame_id": None, "time": 0.1, "embeddings": [[3.0]]}},
+        ],
+    )
+
+    # when
+    first_result = http_client.get_clip_text_embeddings(text=["a", "b"])
+    second_result = http_client.get_clip_text_embeddings(text=["b", "c", "a"])
+    third_result = http_client.get_clip_text_embeddings(text="c")
+
+    # then
+    assert first_result["embeddings"] == [[1.0], [2.0]]
+    assert second_result["embeddings"] == [
+        [2.0],
+        [3.0],
+        [1.0],
+    ], "Cached and fetched embeddings must be returned in order of input texts"
+    assert third_result == {
+        "frame_id": None,
+        "time": None,
+        "embeddings": [[3.0]],
+    }, "Expected embedding to be served from cache"
+    assert [r.json()["text"] for r in requests_mock.request_history] == [
+        ["a", "b"],
+        ["c"],
+    ], "Only texts missing in cache must be sent"
+
+
+def test_get_clip_text_embeddings_when_cache_size_is_exceeded(
+    requests_mock: Mocker,
+) -> None:
+    # given
+    api_url = "http://some.com"
+    http_client = InferenceHTTPClient(api_key="my-api-key", api_url=api_url)
+    http_client.configure(InferenceConfiguration(clip_text_embeddings_cache_size=1))
+    requests_mock.post(
+        f"{api_url}/clip/embed_text",
+        json={"frame_id": None, "time": 0.1, "embeddings": [[1.0]]},
+    )
+
+    # when
+    for text in ["a", "b", "a"]:
+        _ = http_client.get_clip_text_embeddings(text=text)
+
+    # then
+    assert [r.json()["text"] for r in requests_mock.request_history] == [
+        "a",
+        "b",
+        "a",
+    ], "Least recently used embedding must be evicted from cache"
+
+
+def test_get_clip_text_embeddings_batch(requests_mock: Mocker) -> None:
+    # given
+    api_url = "http://some.com"
+    http_client = InferenceHTTPClient(api_key="my-api-key", api_url=api_url)
+
+    def embed_texts(request, context) -> dict:
+        texts = request.json()["text"]
+        return {
+            "frame_id": None,
+            "time": 0.1,
+            "embeddings": [[float(len(text))] for text in texts],
+        }
+
+    requests_mock.post(f"{api_url}/clip/embed_text", json=embed_texts)
+
+    # when
+    result = http_client.get_clip_text_embeddings_batch(
+        texts=["a", "bb", "ccc"], batch_size=2
+    )
+
+    # then
+    assert result == [
+        {"frame_id": None, "time": 0.1, "embeddings": [[1.0]]},
+        {"frame_id": None, "time": 0.1, "embeddings": [[2.0]]},
+        {"frame_id": None, "time": 0.1, "embeddings": [[3.0]]},
+    ], "Expected one embedding per text, in order of texts"
+    assert [r.json()["text"] for r in requests_mock.request_history] == [
+        ["a", "bb"],
+        ["ccc"],
+    ], "Expected texts to be sent in batches of 2"
+
+
+@pytest.mark.asyncio
+async def test_get_clip_text_embeddings_batch_async() -> None:
+    # given
+    api_url = "http://some.com"
+    http_client = InferenceHTTPClient(api_key="my-api-key", api_url=api_url)
+
+    # when
+    with aioresponses() as m:
+        m.post(
+            f"{api_url}/clip/embed_text",
+            payload={"frame_id": None, "time": 0.1, "embeddings": [[1.0], [2.0]]},
+        )
+        m.post(
+            f"{api_url}/clip/embed_text",
+            payload={"frame_id": None, "time": 0.1, "embeddings": [[3.0]]},
+        )
+        result = await http_client.get_clip_text_embeddings_batch_async(
+            texts=["a", "bb", "ccc"], batch_size=2
+        )
+    await http_client.aclose()
+
+    # then
+    assert [e["embeddings"] for e in result] == [
+        [[1.0]],
+        [[2.0]],
+        [[3.0]],
+    ], "Expected one embedding per text"
+
+
 @pytest.mark.asyncio
 async def test_get_clip_text_embeddings_async_when_single_text_given() -> None:
     api_url = "http://some.com"
@@ -2902,6 +3717,31 @@ def test_get_clip_text_embeddings_when_faulty_response_returned(
         _ = http_client.get_clip_text_embeddings(text="some")
 
 
+@pytest.mark.asyncio
+async def test_get_clip_text_embeddings_async_when_cache_is_enabled() -> None:
+    # given
+    api_url = "http://some.com"
+    http_client = InferenceHTTPClient(api_key="my-api-key", api_url=api_url)
+    http_client.configure(InferenceConfiguration(clip_text_embeddings_cache_size=8))
+
+    with aioresponses() as m:
+        m.post(
+            f"{api_url}/clip/embed_text",
+            payload={"frame_id": None, "time": 0.1, "embeddings": [[1.0]]},
+        )
+
+        # when
+        first_result = await http_client.get_clip_text_embeddings_async(text="a")
+        second_result = await http_client.get_clip_text_embeddings_async(text="a")
+
+    # then
+    assert first_result["embeddings"] == [[1.0]]
+    assert second_result["embeddings"] == [
+        [1.0]
+    ], "Expected embedding to be served from cache"
+    assert len(m.requests) == 1, "Expected single request to be sent"
+
+
 @pytest.mark.asyncio
 async def test_get_clip_text_embeddings_async_when_faulty_response_returned() -> None:
     # given
@@ -3334,6 +4174,111 @@ def test_infer_from_workflow_when_no_parameters_given(
     }, "Request payload must contain api key and inputs"
 
 
+def test_infer_from_workflow_when_decoding_is_skipped(
+    requests_mock: Mocker,
+) -> None:
+    # given
+    api_url = "http://some.com"
+    http_client = InferenceHTTPClient(api_key="my-api-key", api_url=api_url)
+    http_client.configure(
+        InferenceConfiguration(
+            output_visualisation_format=VisualisationResponseFormat.NUMPY
+        )
+    )
+    image = {"type": "base64", "value": "base64_image_here"}
+    requests_mock.post(
+        f"{api_url}/infer/workflows/my_workspace/my_workflow",
+        json={"outputs": {"some": 3, "image": image}},
+    )
+
+    # when
+    result = http_client.infer_from_workflow(
+        workspace_name="my_workspace",
+        workflow_name="my_workflow",
+        decode_fields=[],
+    )
+
+    # then
+    assert result == {
+        "some": 3,
+        "image": image,
+    }, "Outputs must be returned as raw JSON"
+
+
+def test_infer_from_workflow_when_upload_compression_is_enabled(
+    requests_mock: Mocker,
+) -> None:
+    # given
+    api_url = "http://some.com"
+    http_client = InferenceHTTPClient(api_key="my-api-key", api_url=api_url)
+    http_client.configure(
+        InferenceConfiguration(upload_compression=UploadCompression.GZIP)
+    )
+    requests_mock.post(
+        f"{api_url}/infer/workflows/my_workspace/my_workflow",
+        response_list=[
+            {"status_code": 415},
+            {"json": {"outputs": {"some": 3}}},
+        ],
+    )
+    parameters = {"prompt": "x" * 32 * 1024}
+
+    # when
+    result = http_client.infer_from_workflow(
+        workspace_name="my_workspace",
+        workflow_name="my_workflow",
+        parameters=parameters,
+    )
+
+    # then
+    assert result == {"some": 3}, "Response from API must be properly decoded"
+    compressed_request, fallback_request = requests_mock.request_history
+    assert compressed_request.headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(compressed_request.body)) == {
+        "api_key": "my-api-key",
+        "inputs": parameters,
+    }, "Large payload must be compressed"
+    assert (
+        "Content-Encoding" not in fallback_request.headers
+    ), "Expected plain upload when server does not accept compressed body"
+    assert fallback_request.json() == {"api_key": "my-api-key", "inputs": parameters}
+
+
+def test_infer_from_workflow_when_compressed_upload_rejected_should_release_first_response(
+    requests_mock: Mocker,
+) -> None:
+    # given
+    api_url = "http://some.com"
+    http_client = InferenceHTTPClient(api_key="my-api-key", api_url=api_url)
+    http_client.configure(
+        InferenceConfiguration(upload_compression=UploadCompression.GZIP)
+    )
+    requests_mock.post(
+        f"{api_url}/infer/workflows/my_workspace/my_workflow",
+        response_list=[
+            {"status_code": 415},
+            {"json": {"outputs": {"some": 3}}},
+        ],
+    )
+
+    # when
+    with mock.patch.object(
+        Response, "close", autospec=True, side_effect=Response.close
+    ) as close_mock:
+        result = http_client.infer_from_workflow(
+            workspace_name="my_workspace",
+            workflow_name="my_workflow",
+            parameters={"prompt": "x" * 32 * 1024},
+        )
+
+    # then
+    assert result == {"some": 3}, "Response from API must be properly decoded"
+    closed_statuses = [call.args[0].status_code for call in close_mock.call_args_list]
+    assert (
+        415 in closed_statuses
+    ), "Expected rejected response to be closed before retrying"
+
+
 @mock.patch.object(client, "load_static_inference_input")
 def test_infer_from_workflow_when_parameters_and_excluded_fields_given(
     load_static_inference_input_mock: MagicMock,
@@ -3409,6 +4354,60 @@ def test_infer_from_workflow_when_faulty_response_given(
         )
 
 
+@pytest.mark.parametrize("stream_parser", [None, ijson])
+def test_infer_from_workflow_when_response_is_parsed_with_and_without_streaming(
+    requests_mock: Mocker,
+    stream_parser: Any,
+) -> None:
+    # given
+    api_url = "http://some.com"
+    http_client = InferenceHTTPClient(api_key="my-api-key", api_url=api_url)
+    requests_mock.post(
+        f"{api_url}/infer/workflows/my_workspace/my_workflow",
+        json={"outputs": {"some": 3.5, "other": [{"a": 1}]}, "outputs_meta": []},
+    )
+
+    # when
+    with mock.patch.object(client, "ijson", stream_parser):
+        result = http_client.infer_from_workflow(
+            workspace_name="my_workspace",
+            workflow_name="my_workflow",
+        )
+
+    # then
+    assert result == {
+        "some": 3.5,
+        "other": [{"a": 1}],
+    }, "Both decoding paths must produce the same outputs"
+
+
+@pytest.mark.parametrize("stream_parser", [None, ijson])
+@pytest.mark.parametrize(
+    "response_payload",
+    [{"other": {"some": 3}}, {"outputs": [{"some": 3}]}, {"outputs": None}],
+)
+def test_infer_from_workflow_when_response_does_not_contain_outputs_object(
+    requests_mock: Mocker,
+    stream_parser: Any,
+    response_payload: dict,
+) -> None:
+    # given
+    api_url = "http://some.com"
+    http_client = InferenceHTTPClient(api_key="my-api-key", api_url=api_url)
+    requests_mock.post(
+        f"{api_url}/infer/workflows/my_workspace/my_workflow",
+        json=response_payload,
+    )
+
+    # when
+    with mock.patch.object(client, "ijson", stream_parser):
+        with pytest.raises(InvalidWorkflowResponseError):
+            _ = http_client.infer_from_workflow(
+                workspace_name="my_workspace",
+                workflow_name="my_workflow",
+            )
+
+
 def test_infer_from_workflow_when_neither_workflow_name_nor_specs_given() -> None:
     # given
     api_url = "http://some.com"
@@ -1,6 +1,7 @@
 import base64
 from io import BytesIO
 from typing import Optional
+from unittest import mock
 
 import cv2
 import numpy as np
@@ -8,6 +9,7 @@ import pytest
 from PIL import Image, ImageChops
 
 from inference_sdk.http.errors import EncodingError
+from inference_sdk.http.utils import encoding as encoding_module
 from inference_sdk.http.utils.encoding import (
     bytes_to_opencv_image,
     bytes_to_pillow_image,
@@ -63,6 +65,30 @@ def test_encode_base_64() -> None:
     assert decoded_payload == payload
 
 
+@mock.patch.object(encoding_module, "pybase64")
+def test_encode_base_64_when_pybase64_is_available(
+    pybase64_mock: mock.MagicMock,
+) -> None:
+    # given
+    pybase64_mock.b64encode_as_string.return_value = "ZW5jb2RlZA=="
+
+    # when
+    result = encode_base_64(payload=b"encoded")
+
+    # then
+    assert result == "ZW5jb2RlZA==", "Expected result of pybase64 to be returned"
+    pybase64_mock.b64encode_as_string.assert_called_once_with(b"encoded")
+
+
+@mock.patch.object(encoding_module, "pybase64", None)
+def test_encode_base_64_when_pybase64_is_not_available() -> None:
+    # when
+    result = encode_base_64(payload=b"encoded")
+
+    # then
+    assert result == "ZW5jb2RlZA==", "Expected standard library fallback to be used"
+
+
 @pytest.mark.parametrize("encoding", [".jpg", ".png"])
 def test_bytes_to_opencv_image_when_bytes_represent_image(encoding: str) -> None:
     # given
@@ -1,33 +1,59 @@
+import asyncio
+import gzip
+import json
 from unittest import mock
 from unittest.mock import MagicMock, call
 
 import aiohttp
+import httpx
+import numpy as np
 import pytest
 from aiohttp import ClientConnectionError, ClientResponseError
 from aioresponses import aioresponses
 from requests import HTTPError, Response
 from requests_mock import Mocker
+from yarl import URL
 
+from inference_sdk.http.entities import UploadCompression
+from inference_sdk.http.errors import InvalidParameterError
 from inference_sdk.http.utils import executors
 from inference_sdk.http.utils.executors import (
     RequestMethod,
+    build_httpx_async_client,
+    build_session,
+    dump_json,
     execute_requests_packages,
     execute_requests_packages_async,
+    iterate_requests_packages_async,
     make_parallel_requests,
     make_parallel_requests_async,
     make_request,
     make_request_async,
+    make_request_httpx_async,
+    serialise_json,
+    serialise_payload,
 )
 from inference_sdk.http.utils.request_building import RequestData
 
 
+def test_build_session_mounts_pooled_adapters() -> None:
+    # when
+    session = build_session(pool_size=16)
+
+    # then
+    for prefix in ("http://", "https://"):
+        adapter = session.get_adapter(f"{prefix}some.com")
+        assert adapter._pool_connections == 16, "Expected pool size to be applied"
+        assert adapter._pool_maxsize == 16, "Expected pool size to be applied"
+
+
 @pytest.mark.slow
-@mock.patch.object(executors, "requests")
+@mock.patch.object(executors, "SESSION")
 def test_make_request_when_connection_error_occurs_and_does_not_recover(
-    requests_mock: MagicMock,
+    session_mock: MagicMock,
 ) -> None:
     # given
-    requests_mock.get.side_effect = [
+    session_mock.get.side_effect = [
         ConnectionError(),
         ConnectionError(),
         ConnectionError("Third"),
@@ -53,13 +79,13 @@ def test_make_request_when_connection_error_occurs_and_does_not_recover(
 
 
 @pytest.mark.slow
-@mock.patch.object(executors, "requests")
+@mock.patch.object(executors, "SESSION")
 def test_make_request_when_connection_error_occurs_and_recovers(
-    requests_mock: MagicMock,
+    session_mock: MagicMock,
 ) -> None:
     # given
     expected_response = Response()
-    requests_mock.get.side_effect = [ConnectionError(), expected_response]
+    session_mock.get.side_effect = [ConnectionError(), expected_response]
     request_data = RequestData(
         url="https://some.com",
         request_elements=1,
@@ -218,6 +244,255 @@ def test_make_request_when_successful_response_is_expected(
     ), "Parameters must be posted according to request specification"
 
 
+def test_serialise_json_when_numpy_values_and_non_str_keys_are_given() -> None:
+    # given
+    value = {
+        "confidence": np.float64(0.35),
+        "max_detections": np.int64(100),
+        "classes": np.array([1, 2]),
+        "mapping": {1: "car", 2: "truck"},
+    }
+
+    # when
+    result = serialise_json(value=value)
+
+    # then
+    assert json.loads(result) == {
+        "confidence": 0.35,
+        "max_detections": 100,
+        "classes": [1, 2],
+        "mapping": {"1": "car", "2": "truck"},
+    }, "Values accepted by `json.dumps(...)` must be serialised the same way"
+
+
+def test_serialise_json_when_non_contiguous_array_is_given() -> None:
+    # given
+    value = {"points": np.arange(6).reshape((2, 3)).T}
+
+    # when
+    result = serialise_json(value=value)
+
+    # then
+    assert json.loads(result) == {"points": [[0, 3], [1, 4], [2, 5]]}
+
+
+def test_serialise_json_when_unsupported_value_is_given() -> None:
+    # when
+    with pytest.raises(TypeError):
+        _ = serialise_json(value={"some": object()})
+
+
+def test_dump_json_when_numpy_scalar_and_non_str_key_are_given() -> None:
+    # when
+    result = dump_json(value={1: np.float32(0.5)})
+
+    # then
+    assert result == '{"1":0.5}', "aiohttp `json_serialize` must accept the same values"
+
+
+def test_serialise_payload_when_json_payload_is_given() -> None:
+    # given
+    request_data = RequestData(
+        url="https://some.com",
+        request_elements=1,
+        headers={"some": "header"},
+        data=None,
+        parameters=None,
+        payload={"some": "value"},
+        image_scaling_factors=[None],
+    )
+
+    # when
+    data, headers = serialise_payload(request_data=request_data)
+
+    # then
+    assert json.loads(data) == {"some": "value"}, "Payload must be serialised"
+    assert headers == {
+        "Content-Type": "application/json",
+        "some": "header",
+    }, "JSON content type must be added to headers"
+
+
+def test_serialise_payload_when_payload_contains_numpy_values() -> None:
+    # given
+    request_data = RequestData(
+        url="https://some.com",
+        request_elements=1,
+        headers=None,
+        data=None,
+        parameters=None,
+        payload={"inputs": {"confidence": np.float64(0.5), "classes": {1: "car"}}},
+        image_scaling_factors=[None],
+    )
+
+    # when
+    data, _ = serialise_payload(request_data=request_data)
+
+    # then
+    assert json.loads(data) == {
+        "inputs": {"confidence": 0.5, "classes": {"1": "car"}}
+    }, "Workflow parameters computed with numpy must be serialised"
+
+
+def test_serialise_payload_when_raw_data_is_given() -> None:
+    # given
+    request_data = RequestData(
+        url="https://some.com",
+        request_elements=1,
+        headers=None,
+        data="some",
+        parameters=None,
+        payload=None,
+        image_scaling_factors=[None],
+    )
+
+    # when
+    data, headers = serialise_payload(request_data=request_data)
+
+    # then
+    assert data == "some", "Raw data must be passed as is"
+    assert headers is None, "Headers must not be altered"
+
+
+@mock.patch.object(executors, "UPLOAD_COMPRESSION_MIN_BODY_SIZE", 0)
+def test_serialise_payload_when_gzip_compression_is_requested() -> None:
+    # given
+    request_data = RequestData(
+        url="https://some.com",
+        request_elements=1,
+        headers=None,
+        data=None,
+        parameters=None,
+        payload={"some": "value"},
+        image_scaling_factors=[None],
+        content_encoding=UploadCompression.GZIP,
+    )
+
+    # when
+    data, headers = serialise_payload(request_data=request_data)
+
+    # then
+    assert json.loads(gzip.decompress(data)) == {
+        "some": "value"
+    }, "Payload must be serialised and compressed"
+    assert headers == {
+        "Content-Type": "application/json",
+        "Content-Encoding": "gzip",
+    }, "Content encoding must be announced in headers"
+
+
+def test_serialise_payload_when_compression_is_requested_for_small_body() -> None:
+    # given
+    request_data = RequestData(
+        url="https://some.com",
+        request_elements=1,
+        headers=None,
+        data=None,
+        parameters=None,
+        payload={"some": "value"},
+        image_scaling_factors=[None],
+        content_encoding=UploadCompression.GZIP,
+    )
+
+    # when
+    data, headers = serialise_payload(request_data=request_data)
+
+    # then
+    assert json.loads(data) == {"some": "value"}, "Small body must not be compressed"
+    assert headers == {
+        "Content-Type": "application/json"
+    }, "Content encoding must not be announced for plain body"
+
+
+@mock.patch.object(executors, "UPLOAD_COMPRESSION_MIN_BODY_SIZE", 0)
+@mock.patch.object(executors, "zstandard", None)
+def test_serialise_payload_when_zstd_compression_is_requested_but_not_installed() -> (
+    None
+):
+    # given
+    request_data = RequestData(
+        url="https://some.com",
+        request_elements=1,
+        headers=None,
+        data=None,
+        parameters=None,
+        payload={"some": "value"},
+        image_scaling_factors=[None],
+        content_encoding=UploadCompression.ZSTD,
+    )
+
+    # when
+    with pytest.raises(InvalidParameterError):
+        _ = serialise_payload(request_data=request_data)
+
+
+@pytest.mark.parametrize("rejection_status_code", [400, 415, 422])
+@mock.patch.object(executors, "UPLOAD_COMPRESSION_MIN_BODY_SIZE", 0)
+def test_make_request_when_server_does_not_accept_compressed_body(
+    requests_mock: Mocker,
+    rejection_status_code: int,
+) -> None:
+    # given
+    request_data = RequestData(
+        url="https://some.com",
+        request_elements=1,
+        headers=None,
+        data=None,
+        parameters=None,
+        payload={"some": "value"},
+        image_scaling_factors=[None],
+        content_encoding=UploadCompression.GZIP,
+    )
+    requests_mock.post(
+        "https://some.com",
+        response_list=[
+            {"status_code": rejection_status_code},
+            {"status_code": 200, "json": {"status": "ok"}},
+        ],
+    )
+
+    # when
+    result = make_request(request_data=request_data, request_method=RequestMethod.POST)
+
+    # then
+    assert result.json() == {"status": "ok"}, "Expected plain upload to succeed"
+    assert len(requests_mock.request_history) == 2, "Expected one fallback request"
+    fallback_request = requests_mock.request_history[1]
+    assert "Content-Encoding" not in fallback_request.headers
+    assert fallback_request.json() == {"some": "value"}
+
+
+@pytest.mark.parametrize("rejection_status_code", [415, 422])
+def test_make_request_when_uncompressed_small_body_is_rejected(
+    requests_mock: Mocker,
+    rejection_status_code: int,
+) -> None:
+    # given
+    request_data = RequestData(
+        url="https://some.com",
+        request_elements=1,
+        headers=None,
+        data=None,
+        parameters=None,
+        payload={"some": "value"},
+        image_scaling_factors=[None],
+        content_encoding=UploadCompression.GZIP,
+    )
+    requests_mock.post("https://some.com", status_code=rejection_status_code)
+
+    # when
+    result = make_request(request_data=request_data, request_method=RequestMethod.POST)
+
+    # then
+    assert (
+        result.status_code == rejection_status_code
+    ), "Expected server response to be returned"
+    assert (
+        len(requests_mock.request_history) == 1
+    ), "Expected no fallback, as body under threshold was not compressed"
+    assert "Content-Encoding" not in requests_mock.request_history[0].headers
+
+
 @mock.patch.object(executors, "make_request")
 def test_make_parallel_requests(make_request_mock: MagicMock) -> None:
     # given
@@ -240,10 +515,44 @@ def test_make_parallel_requests(make_request_mock: MagicMock) -> None:
     # then
     assert len(result) == 4, "Number of output responses must match number of requests"
     make_request_mock.assert_has_calls(
-        [call(request_data, request_method=RequestMethod.GET)] * 4, any_order=True
+        [call(request_data, request_method=RequestMethod.GET, session=None)] * 4,
+        any_order=True,
     ), "Mock of request method must be invoked 4 times with proper parameters"
 
 
+@mock.patch.object(executors, "ThreadPool")
+@mock.patch.object(executors, "make_request")
+def test_make_parallel_requests_when_single_request_given(
+    make_request_mock: MagicMock,
+    thread_pool_mock: MagicMock,
+) -> None:
+    # given
+    request_data = RequestData(
+        url="https://some.com",
+        request_elements=1,
+        headers={"some": "header"},
+        data=None,
+        parameters=None,
+        payload={"some": "value"},
+        image_scaling_factors=[None],
+    )
+
+    # when
+    result = make_parallel_requests(
+        requests_data=[request_data],
+        request_method=RequestMethod.POST,
+    )
+
+    # then
+    assert result == [
+        make_request_mock.return_value
+    ], "Expected response of single request to be returned"
+    make_request_mock.assert_called_once_with(
+        request_data, request_method=RequestMethod.POST, session=None
+    )
+    thread_pool_mock.assert_not_called()
+
+
 def test_execute_requests_packages_when_api_call_error_occurs(
     requests_mock: Mocker,
 ) -> None:
@@ -470,6 +779,112 @@ async def test_make_request_async_when_non_retryable_error_occurs() -> None:
                 )
 
 
+@pytest.mark.asyncio
+async def test_make_request_async_when_response_body_is_not_json() -> None:
+    # given
+    request_data = RequestData(
+        url="https://some.com/",
+        request_elements=1,
+        headers=None,
+        data=None,
+        parameters=None,
+        payload={"some": "data"},
+        image_scaling_factors=[None],
+    )
+
+    with aioresponses() as m:
+        async with aiohttp.ClientSession() as session:
+            m.post(
+                "https://some.com",
+                status=200,
+                body=b"\xff\xd8\xffjpeg",
+                content_type="image/jpeg",
+            )
+
+            # when
+            result = await make_request_async(
+                request_data=request_data,
+                request_method=RequestMethod.POST,
+                session=session,
+            )
+
+    # then
+    assert result == (200, b"\xff\xd8\xffjpeg"), "Expected raw bytes to be returned"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("rejection_status_code", [415, 422])
+@mock.patch.object(executors, "UPLOAD_COMPRESSION_MIN_BODY_SIZE", 0)
+async def test_make_request_async_when_server_does_not_accept_compressed_body(
+    rejection_status_code: int,
+) -> None:
+    # given
+    request_data = RequestData(
+        url="https://some.com/",
+        request_elements=1,
+        headers=None,
+        data=None,
+        parameters=None,
+        payload={"some": "data"},
+        image_scaling_factors=[None],
+        content_encoding=UploadCompression.GZIP,
+    )
+
+    with aioresponses() as m:
+        async with aiohttp.ClientSession() as session:
+            m.post("https://some.com", status=rejection_status_code)
+            m.post("https://some.com", status=200, payload={"status": "ok"})
+
+            # when
+            result = await make_request_async(
+                request_data=request_data,
+                request_method=RequestMethod.POST,
+                session=session,
+            )
+
+        # then
+        m.assert_called_with(
+            url="https://some.com",
+            method="POST",
+            headers=None,
+            json={"some": "data"},
+            data=None,
+            params=None,
+        )
+    assert result == (200, {"status": "ok"}), "Expected plain upload to succeed"
+
+
+@pytest.mark.asyncio
+async def test_make_request_async_when_uncompressed_small_body_is_rejected() -> None:
+    # given
+    request_data = RequestData(
+        url="https://some.com/",
+        request_elements=1,
+        headers=None,
+        data=None,
+        parameters=None,
+        payload={"some": "data"},
+        image_scaling_factors=[None],
+        content_encoding=UploadCompression.GZIP,
+    )
+
+    with aioresponses() as m:
+        async with aiohttp.ClientSession() as session:
+            m.post("https://some.com", status=415, payload={"message": "some"})
+
+            # when
+            with pytest.raises(ClientResponseError):
+                _ = await make_request_async(
+                    request_data=request_data,
+                    request_method=RequestMethod.POST,
+                    session=session,
+                )
+
+        # then
+        requests = m.requests[("POST", URL("https://some.com"))]
+        assert len(requests) == 1, "Expected no fallback for uncompressed body"
+
+
 @pytest.mark.asyncio
 async def test_make_request_async_when_request_is_successful() -> None:
     # given
@@ -564,6 +979,38 @@ async def test_make_parallel_requests_async_when_all_requests_succeed() -> None:
     ), "All requests are expected to return predefined result"
 
 
+@pytest.mark.asyncio
+async def test_make_parallel_requests_async_when_session_is_given() -> None:
+    # given
+    request_data = RequestData(
+        url="https://some.com",
+        request_elements=1,
+        headers=None,
+        data="some",
+        parameters=None,
+        payload=None,
+        image_scaling_factors=[None],
+    )
+    with aioresponses() as m:
+        m.get("https://some.com", status=200, payload={"status": "ok"})
+        m.get("https://some.com", status=200, payload={"status": "ok"})
+
+        # when
+        async with aiohttp.ClientSession() as session:
+            result = await make_parallel_requests_async(
+                requests_data=[request_data] * 2,
+                request_method=RequestMethod.GET,
+                session=session,
+            )
+            session_closed = session.closed
+
+    # then
+    assert (
+        result == [{"status": "ok"}] * 2
+    ), "All requests are expected to return predefined result"
+    assert session_closed is False, "Session provided by caller must not be closed"
+
+
 @pytest.mark.asyncio
 async def test_execute_requests_packages_async_when_some_request_fails() -> None:
     # given
@@ -619,3 +1066,202 @@ async def test_execute_requests_packages_async_when_all_requests_succeed() -> No
     assert (
         result == [{"status": "ok"}] * 3
     ), "All requests are expected to return predefined result"
+
+
+@pytest.mark.asyncio
+async def test_iterate_requests_packages_async_yields_responses_in_completion_order() -> (
+    None
+):
+    # given
+    delays = {"/slow": 0.2, "/fast": 0.0}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(delays[request.url.path])
+        return httpx.Response(200, json={"path": request.url.path})
+
+    requests_data = [
+        RequestData(
+            url=f"https://some.com{path}",
+            request_elements=1,
+            headers=None,
+            data=None,
+            parameters=None,
+            payload={"some": "value"},
+            image_scaling_factors=[None],
+        )
+        for path in ["/slow", "/fast"]
+    ]
+
+    # when
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as session:
+        result = [
+            e
+            async for e in iterate_requests_packages_async(
+                requests_data=requests_data,
+                request_method=RequestMethod.POST,
+                max_concurrent_requests=2,
+                session=session,
+            )
+        ]
+
+    # then
+    assert result == [
+        (1, {"path": "/fast"}),
+        (0, {"path": "/slow"}),
+    ], "Expected faster response to be yielded first, with index of its request"
+
+
+@mock.patch.object(executors, "h2", None)
+@mock.patch.object(executors.httpx, "AsyncClient")
+def test_build_httpx_async_client_when_h2_is_not_installed(
+    async_client_mock: MagicMock,
+) -> None:
+    # when
+    _ = build_httpx_async_client()
+
+    # then
+    assert (
+        async_client_mock.call_args[1]["http2"] is False
+    ), "Expected HTTP/1.1 to be used when `h2` is not available"
+
+
+@pytest.mark.asyncio
+async def test_make_parallel_requests_async_when_httpx_client_is_given() -> None:
+    # given
+    captured_requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        captured_requests.append(request)
+        return httpx.Response(200, json={"status": "ok"})
+
+    request_data = RequestData(
+        url="https://some.com",
+        request_elements=1,
+        headers={"some": "header"},
+        data=None,
+        parameters={"a": ["1", "2"], "b": "3"},
+        payload={"some": "value"},
+        image_scaling_factors=[None],
+    )
+
+    # when
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as session:
+        result = await make_parallel_requests_async(
+            requests_data=[request_data] * 2,
+            request_method=RequestMethod.POST,
+            session=session,
+        )
+
+    # then
+    assert (
+        result == [{"status": "ok"}] * 2
+    ), "All requests are expected to return predefined result"
+    assert len(captured_requests) == 2, "Expected two requests to be sent"
+    assert (
+        captured_requests[0].headers["some"] == "header"
+    ), "Request headers expected to be injected"
+    assert (
+        captured_requests[0].url.query == b"a=1&a=2&b=3"
+    ), "Parameters must be posted according to request specification"
+    assert json.loads(captured_requests[0].content) == {
+        "some": "value"
+    }, "Request payload expected to be injected"
+
+
+@pytest.mark.asyncio
+async def test_make_request_httpx_async_when_non_retryable_error_occurs() -> None:
+    # given
+    request_data = RequestData(
+        url="https://some.com",
+        request_elements=1,
+        headers=None,
+        data="some",
+        parameters=None,
+        payload=None,
+        image_scaling_factors=[None],
+    )
+    transport = httpx.MockTransport(lambda request: httpx.Response(500))
+
+    # when
+    async with httpx.AsyncClient(transport=transport) as session:
+        with pytest.raises(httpx.HTTPStatusError):
+            _ = await make_request_httpx_async(
+                request_data=request_data,
+                request_method=RequestMethod.GET,
+                session=session,
+            )
+
+
+@pytest.mark.asyncio
+async def test_make_request_httpx_async_when_boolean_parameters_given() -> None:
+    # given
+    captured_queries = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        captured_queries.append(request.url.query)
+        return httpx.Response(200, json={"status": "ok"})
+
+    request_data = RequestData(
+        url="https://some.com/",
+        request_elements=1,
+        headers=None,
+        data=None,
+        parameters={"api_key": "my-key", "disable_active_learning": True, "c": 0.5},
+        payload={"some": "data"},
+        image_scaling_factors=[None],
+    )
+
+    # when
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as session:
+        result = await make_request_httpx_async(
+            request_data=request_data,
+            request_method=RequestMethod.POST,
+            session=session,
+        )
+
+    # then
+    assert result == (200, {"status": "ok"})
+    assert captured_queries == [
+        b"api_key=my-key&disable_active_learning=True&c=0.5"
+    ], "Expected parameters to be encoded as requests and aiohttp transports do"
+
+
+@pytest.mark.asyncio
+@mock.patch.object(executors, "UPLOAD_COMPRESSION_MIN_BODY_SIZE", 0)
+async def test_make_request_httpx_async_when_compressed_body_is_rejected_with_422() -> (
+    None
+):
+    # given
+    captured_encodings = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        captured_encodings.append(request.headers.get("Content-Encoding"))
+        if "Content-Encoding" in request.headers:
+            return httpx.Response(422, json={"detail": "invalid JSON"})
+        return httpx.Response(200, json={"status": "ok"})
+
+    request_data = RequestData(
+        url="https://some.com/",
+        request_elements=1,
+        headers=None,
+        data=None,
+        parameters=None,
+        payload={"some": "data"},
+        image_scaling_factors=[None],
+        content_encoding=UploadCompression.GZIP,
+    )
+
+    # when
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as session:
+        result = await make_request_httpx_async(
+            request_data=request_data,
+            request_method=RequestMethod.POST,
+            session=session,
+        )
+
+    # then
+    assert result == (200, {"status": "ok"}), "Expected plain upload to succeed"
+    assert captured_encodings == [
+        "gzip",
+        None,
+    ], "Expected single fallback request without compression"
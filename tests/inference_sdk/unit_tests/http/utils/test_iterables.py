@@ -1,5 +1,6 @@
 from inference_sdk.http.utils.iterables import (
     make_batches,
+    make_batches_within_characters_limit,
     remove_empty_values,
     unwrap_single_element_list,
 )
@@ -85,3 +86,43 @@ def test_make_batches_when_non_empty_input_and_valid_batch_size_provided() -> No
 
     # then
     assert result == [[1, 2], [3, 4], [5]]
+
+
+def test_make_batches_within_characters_limit_when_batch_size_is_reached_first() -> (
+    None
+):
+    # when
+    result = list(
+        make_batches_within_characters_limit(
+            texts=["a", "b", "c"], batch_size=2, max_batch_characters=100
+        )
+    )
+
+    # then
+    assert result == [["a", "b"], ["c"]]
+
+
+def test_make_batches_within_characters_limit_when_characters_limit_is_reached_first() -> (
+    None
+):
+    # when
+    result = list(
+        make_batches_within_characters_limit(
+            texts=["aaa", "bbb", "c", "dddddd"], batch_size=10, max_batch_characters=5
+        )
+    )
+
+    # then
+    assert result == [["aaa"], ["bbb", "c"], ["dddddd"]]
+
+
+def test_make_batches_within_characters_limit_when_input_is_empty() -> None:
+    # when
+    result = list(
+        make_batches_within_characters_limit(
+            texts=[], batch_size=10, max_batch_characters=5
+        )
+    )
+
+    # then
+    assert result == []
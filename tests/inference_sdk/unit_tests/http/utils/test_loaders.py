@@ -1,9 +1,12 @@
+import asyncio
 import base64
 import os.path
+import threading
 from typing import Tuple
 from unittest import mock
 from unittest.mock import MagicMock
 
+import aiohttp
 import cv2
 import numpy as np
 import pytest
@@ -58,6 +61,27 @@ def test_uri_is_http_link_when_https_url_provided() -> None:
     assert result is True
 
 
+def test_load_file_from_url_when_session_is_given() -> None:
+    # given
+    image = np.zeros((128, 128, 3), dtype=np.uint8)
+    _, encoded_image = cv2.imencode(".jpg", image)
+    response = Response()
+    response.status_code = 200
+    response._content = encoded_image.tobytes()
+    session = MagicMock()
+    session.get.return_value = response
+
+    # when
+    serialised_image, scaling_factor = load_image_from_url(
+        url="http://some/file.jpg", session=session
+    )
+
+    # then
+    session.get.assert_called_once_with("http://some/file.jpg")
+    assert scaling_factor is None
+    assert base64.b64decode(serialised_image) == encoded_image.tobytes()
+
+
 @mock.patch.object(loaders.requests, "get")
 def test_load_file_from_url_on_unsuccessful_image_download(
     requests_get_mock: MagicMock,
@@ -124,6 +148,28 @@ async def test_load_file_from_url_async_on_successful_image_download_without_res
         assert np.allclose(decoding_result, image)
 
 
+@pytest.mark.asyncio
+async def test_load_file_from_url_async_when_session_is_given() -> None:
+    with aioresponses() as m:
+        # given
+        image = np.zeros((128, 128, 3), dtype=np.uint8)
+        _, encoded_image = cv2.imencode(".jpg", image)
+        m.get("https://some.com/file.jpg", status=200, body=encoded_image.tobytes())
+        m.get("https://some.com/file.jpg", status=200, body=encoded_image.tobytes())
+
+        async with aiohttp.ClientSession() as session:
+            # when
+            results = await load_static_inference_input_async(
+                inference_input=["https://some.com/file.jpg"] * 2,
+                session=session,
+            )
+
+            # then
+            assert not session.closed, "Given session must not be closed by loader"
+        assert len(results) == 2
+        assert all(scaling_factor is None for _, scaling_factor in results)
+
+
 @mock.patch.object(loaders.requests, "get")
 def test_load_file_from_url_on_successful_image_download_with_resize(
     requests_get_mock: MagicMock,
@@ -465,6 +511,59 @@ async def test_load_static_inference_input_async_when_single_np_array_passed(
     assert np.allclose(decoding_result, image)
 
 
+@pytest.mark.asyncio
+async def test_load_static_inference_input_async_does_not_encode_images_in_event_loop_thread(
+    example_local_image: Tuple[str, np.ndarray]
+) -> None:
+    # given
+    _, image = example_local_image
+    encoding_threads = []
+    original_encoding = loaders.numpy_array_to_jpeg_bytes
+
+    def numpy_array_to_jpeg_bytes(image: np.ndarray) -> bytes:
+        encoding_threads.append(threading.get_ident())
+        return original_encoding(image=image)
+
+    # when
+    with mock.patch.object(
+        loaders, "numpy_array_to_jpeg_bytes", numpy_array_to_jpeg_bytes
+    ):
+        result = await load_static_inference_input_async(inference_input=[image] * 3)
+
+    # then
+    assert len(result) == 3
+    assert len(encoding_threads) == 3
+    assert (
+        threading.get_ident() not in encoding_threads
+    ), "Encoding is expected to be offloaded from event loop thread"
+
+
+def test_load_static_inference_input_when_base64_encoding_is_disabled(
+    example_local_image: Tuple[str, np.ndarray]
+) -> None:
+    # given
+    file_path, image = example_local_image
+    _, encoded_image = cv2.imencode(".jpg", image)
+    base64_image = base64.b64encode(encoded_image.tobytes()).decode("ascii")
+
+    # when
+    result = load_static_inference_input(
+        inference_input=[image, file_path, Image.fromarray(image), base64_image],
+        encode_base64=False,
+    )
+
+    # then
+    assert len(result) == 4
+    for serialised_image, scaling_factor in result:
+        assert scaling_factor is None
+        assert issubclass(type(serialised_image), bytes), "Expected raw bytes"
+        decoding_result = cv2.imdecode(
+            np.frombuffer(serialised_image, dtype=np.uint8), cv2.IMREAD_UNCHANGED
+        )
+        assert decoding_result.shape == image.shape
+    assert result[3][0] == encoded_image.tobytes(), "Expected no re-encoding"
+
+
 def test_load_static_inference_input_when_single_pillow_image_passed(
     example_local_image: Tuple[str, np.ndarray]
 ) -> None:
@@ -572,6 +671,59 @@ async def test_load_static_inference_input_async_when_multiple_inputs_passed(
         assert (decoding_result == 0).all()
 
 
+@pytest.mark.asyncio
+async def test_load_static_inference_input_async_when_urls_passed_without_session() -> None:
+    # given
+    image = np.zeros((128, 128, 3), dtype=np.uint8)
+    _, encoded_image = cv2.imencode(".jpg", image)
+    urls = [f"https://some.com/file_{i}.jpg" for i in range(3)]
+
+    with aioresponses() as m:
+        for url in urls:
+            m.get(url, status=200, body=encoded_image.tobytes())
+
+        # when
+        with mock.patch.object(
+            loaders.aiohttp, "ClientSession", wraps=aiohttp.ClientSession
+        ) as client_session_mock:
+            result = await load_static_inference_input_async(inference_input=urls)
+
+    # then
+    assert len(result) == 3
+    assert (
+        client_session_mock.call_count == 1
+    ), "Expected single session to be shared by all downloads"
+
+
+@pytest.mark.asyncio
+@mock.patch.object(loaders, "MAX_CONCURRENT_IMAGES_LOADING", 2)
+async def test_load_static_inference_input_async_when_many_inputs_passed() -> None:
+    # given
+    in_flight, max_in_flight = 0, 0
+
+    async def load_image(reference: str, **kwargs) -> Tuple[str, None]:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return reference, None
+
+    # when
+    with mock.patch.object(
+        loaders, "load_image_from_string_async", side_effect=load_image
+    ):
+        result = await load_static_inference_input_async(
+            inference_input=[f"image_{i}" for i in range(6)]
+        )
+
+    # then
+    assert result == [
+        (f"image_{i}", None) for i in range(6)
+    ], "Expected order of inputs to be preserved"
+    assert max_in_flight == 2, "Expected no more than 2 images loaded at a time"
+
+
 def test_load_static_inference_input_when_invalid_input_passed_among_multiple_inputs(
     example_local_image: Tuple[str, np.ndarray]
 ) -> None:
@@ -22,6 +22,7 @@ from inference_sdk.http.utils.post_processing import (
     combine_gaze_detections,
     decode_workflow_output_image,
     decode_workflow_outputs,
+    decode_workflow_outputs_items,
     filter_model_descriptions,
     is_workflow_image,
     response_contains_jpeg_image,
@@ -592,6 +593,55 @@ def test_decode_workflow_outputs() -> None:
     ), "This element must be deserialized"
 
 
+@mock.patch.object(post_processing, "transform_base64_visualisation", MagicMock())
+def test_decode_workflow_outputs_when_decode_fields_are_given() -> None:
+    # given
+    workflow_outputs = {
+        "some": {"type": "base64", "value": "base64_image_here"},
+        "other": [{"type": "base64", "value": "base64_image_here"}],
+    }
+
+    # when
+    result = decode_workflow_outputs(
+        workflow_outputs=workflow_outputs,
+        expected_format=VisualisationResponseFormat.NUMPY,
+        decode_fields={"other"},
+    )
+
+    # then
+    assert result["some"] == {
+        "type": "base64",
+        "value": "base64_image_here",
+    }, "Output not listed in `decode_fields` must be left raw"
+    assert (
+        result["other"][0]["type"] == "numpy_object"
+    ), "This element must be deserialized"
+
+
+@mock.patch.object(post_processing, "transform_base64_visualisation", MagicMock())
+def test_decode_workflow_outputs_items_when_items_are_produced_lazily() -> None:
+    # given
+    workflow_outputs_items = (
+        item
+        for item in [
+            ("some", "value"),
+            ("other", {"type": "base64", "value": "base64_image_here"}),
+        ]
+    )
+
+    # when
+    result = decode_workflow_outputs_items(
+        workflow_outputs_items=workflow_outputs_items,
+        expected_format=VisualisationResponseFormat.NUMPY,
+    )
+
+    # then
+    assert result["some"] == "value", "This value must not be changed"
+    assert (
+        result["other"]["type"] == "numpy_object"
+    ), "This element must be deserialized"
+
+
 def test_combine_gaze_detections_when_single_detections_given() -> None:
     # when
     result = combine_gaze_detections(detections={"predictions": []})
@@ -1,3 +1,5 @@
+import base64
+
 import pytest
 
 from inference_sdk.http.utils.request_building import (
@@ -48,6 +50,60 @@ def test_assembly_request_data_when_image_placement_is_in_body_and_batch_of_imag
         )
 
 
+def test_assembly_request_data_when_image_placement_is_multipart() -> None:
+    # when
+    result = assembly_request_data(
+        url="https://some.com",
+        batch_inference_inputs=[(base64.b64encode(b"raw-jpeg").decode("ascii"), 0.5)],
+        headers={"Content-Type": "application/json", "some": "header"},
+        parameters={"api_key": "secret"},
+        payload=None,
+        image_placement=ImagePlacement.MULTIPART,
+    )
+
+    # then
+    assert result.headers["some"] == "header", "Other headers must be preserved"
+    assert result.headers["Content-Type"].startswith("multipart/form-data; boundary=")
+    assert b'name="file"' in result.data, "Image must be sent as `file` field"
+    assert b"raw-jpeg" in result.data, "Image bytes must not be base64 encoded"
+    assert result.payload is None
+    assert result.image_scaling_factors == [0.5]
+
+
+def test_assembly_request_data_when_image_placement_is_multipart_and_raw_bytes_given() -> (
+    None
+):
+    # when
+    result = assembly_request_data(
+        url="https://some.com",
+        batch_inference_inputs=[(b"raw-jpeg", None)],
+        headers=None,
+        parameters={"api_key": "secret"},
+        payload=None,
+        image_placement=ImagePlacement.MULTIPART,
+    )
+
+    # then
+    assert result.headers["Content-Type"].startswith("multipart/form-data; boundary=")
+    assert b"raw-jpeg" in result.data, "Raw image bytes must be sent as they are"
+    assert result.image_scaling_factors == [None]
+
+
+def test_assembly_request_data_when_image_placement_is_multipart_and_batch_of_images_given() -> (
+    None
+):
+    # when
+    with pytest.raises(ValueError):
+        _ = assembly_request_data(
+            url="https://some.com",
+            batch_inference_inputs=[("aW1hZ2VfMQ==", 0.5), ("aW1hZ2VfMg==", 0.5)],
+            headers=None,
+            parameters=None,
+            payload=None,
+            image_placement=ImagePlacement.MULTIPART,
+        )
+
+
 def test_assembly_request_data_when_image_placement_is_in_json_and_single_image_given() -> (
     None
 ):
@@ -151,3 +207,23 @@ def test_prepare_requests_data() -> None:
         },
         image_scaling_factors=[0.75],
     )
+
+
+def test_prepare_requests_data_does_not_mutate_base_payload() -> None:
+    # given
+    payload = {"api_key": "secret", "disable_active_learning": True}
+
+    # when
+    result = prepare_requests_data(
+        url="https://some.com",
+        encoded_inference_inputs=[("image_1", 1.0), ("image_2", 0.5)],
+        headers=None,
+        parameters=None,
+        payload=payload,
+        max_batch_size=1,
+        image_placement=ImagePlacement.JSON,
+    )
+
+    # then
+    assert payload == {"api_key": "secret", "disable_active_learning": True}
+    assert [r.payload["image"]["value"] for r in result] == ["image_1", "image_2"]